@@ -0,0 +1,173 @@
+"""
+Replays bid storms through the create_bid lambda_handler against DynamoDB Local and checks that
+no accepted bid was lost or duplicated and that every auction ends with the highest accepted amount.
+
+    java -Djava.library.path=./DynamoDBLocal_lib -jar DynamoDBLocal.jar -inMemory -port 8000
+    python -m benchmarks.bid_storm --auctions 2 --bidders 50 --bids-per-bidder 20 --threads 32
+"""
+import os
+import json
+import time
+import uuid
+import argparse
+import threading
+import itertools
+from collections import Counter
+from typing import Dict, List, Tuple
+from concurrent.futures import ThreadPoolExecutor
+
+from benchmarks.stats import summarize_latencies
+from benchmarks.local_dynamodb import configure_environment, provision_tables
+
+START_AMOUNT = 100
+
+
+def seed(resource, auctions: int, bidders: int) -> Tuple[List[str], List[str]]:
+    """
+    Create open auctions and active bidders, returning the auction ids and one access token per bidder
+    """
+    from src.shared.helper_functions.token_authy import TokenAuthy
+    from src.shared.helper_functions.time_manipulation import TimeManipulation
+
+    now = TimeManipulation.get_current_time()
+    token = TokenAuthy()
+
+    tokens = []
+    with resource.Table(os.environ["USER_TABLE"]).batch_writer() as batch:
+        for number in range(bidders):
+            user_id = str(uuid.uuid4())
+            batch.put_item(Item={
+                "PK": user_id,
+                "SK": "USER",
+                "first_name": f"Bidder{number}",
+                "last_name": "Benchmark",
+                "email": f"bidder{number}@benchmark.local",
+                "type_account": "USER",
+                "status_account": "ACTIVE",
+                "created_at": now,
+            })
+            tokens.append(token.generate_token(user_id=user_id, exp_time=now + 24 * 3600))
+
+    auction_ids = [str(auction_id) for auction_id in range(1, auctions + 1)]
+    with resource.Table(os.environ["AUCTION_TABLE"]).batch_writer() as batch:
+        for auction_id in auction_ids:
+            batch.put_item(Item={
+                "PK": auction_id,
+                "SK": "AUCTION",
+                "created_by": str(uuid.uuid4()),
+                "title": f"Benchmark {auction_id}",
+                "description": "Bid storm benchmark",
+                "start_date": now - 60,
+                "end_date": now + 3600,
+                "start_amount": START_AMOUNT,
+                "current_amount": START_AMOUNT,
+                "images": [],
+                "status_auction": "OPEN",
+                "created_at": now,
+            })
+    return auction_ids, tokens
+
+
+def run_storm(auction_ids: List[str], tokens: List[str], bids_per_bidder: int, threads: int) -> Dict:
+    """
+    Every bidder bids bids_per_bidder times, spread over the auctions. Amounts grow by 1 per auction in
+    submission order, so bids arriving out of order are expected to be refused by the 1 real rule.
+    """
+    from src.modules.create_bid.app.create_bid_presenter import lambda_handler
+
+    lock = threading.Lock()
+    amounts = {auction_id: itertools.count(START_AMOUNT + 1) for auction_id in auction_ids}
+
+    def submit(job: Tuple[str, str]) -> Tuple[str, int, int, float]:
+        token, auction_id = job
+        with lock:
+            amount = next(amounts[auction_id])
+        event = {
+            "headers": {"Authorization": token},
+            "body": json.dumps({"auction_id": auction_id, "amount": amount}),
+        }
+        started = time.perf_counter()
+        response = lambda_handler(event, None)
+        return auction_id, amount, response["statusCode"], time.perf_counter() - started
+
+    jobs = [(token, auction_ids[(bidder + bid) % len(auction_ids)])
+            for bid in range(bids_per_bidder) for bidder, token in enumerate(tokens)]
+
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=threads) as executor:
+        results = list(executor.map(submit, jobs))
+    elapsed = time.perf_counter() - started
+
+    return {"results": results, "elapsed": elapsed}
+
+
+def verify(resource, auction_ids: List[str], results: List[Tuple[str, int, int, float]]) -> Dict:
+    """
+    Compare the accepted bids with what ended up in the table
+    """
+    from boto3.dynamodb.conditions import Key
+    from src.shared.database.pagination import query_items
+
+    table = resource.Table(os.environ["AUCTION_TABLE"])
+    lost, duplicated, wrong_current_amount = 0, 0, []
+    for auction_id in auction_ids:
+        accepted = {amount for result_auction_id, amount, status_code, _ in results
+                    if result_auction_id == auction_id and status_code == 201}
+        stored = Counter(
+            int(bid["amount"]) for bid in query_items(
+                table, KeyConditionExpression=Key("PK").eq(auction_id) & Key("SK").begins_with("BID#"))
+        )
+        lost += sum(1 for amount in accepted if not stored[amount])
+        duplicated += sum(count - 1 for count in stored.values() if count > 1)
+        duplicated += sum(count for amount, count in stored.items() if amount not in accepted)
+
+        current_amount = int(table.get_item(Key={"PK": auction_id, "SK": "AUCTION"})["Item"]["current_amount"])
+        expected_amount = max(accepted, default=START_AMOUNT)
+        if current_amount != expected_amount:
+            wrong_current_amount.append({"auction_id": auction_id, "current_amount": current_amount,
+                                         "expected": expected_amount})
+
+    return {"lost_bids": lost, "duplicated_bids": duplicated, "wrong_current_amount": wrong_current_amount}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Bid storm benchmark against DynamoDB Local")
+    parser.add_argument("--auctions", type=int, default=1)
+    parser.add_argument("--bidders", type=int, default=20)
+    parser.add_argument("--bids-per-bidder", type=int, default=10)
+    parser.add_argument("--threads", type=int, default=16)
+    parser.add_argument("--json", action="store_true", help="print the report as JSON")
+    args = parser.parse_args()
+
+    configure_environment()
+    resource = provision_tables(reset=True)
+    auction_ids, tokens = seed(resource, args.auctions, args.bidders)
+
+    storm = run_storm(auction_ids, tokens, args.bids_per_bidder, args.threads)
+    results = storm["results"]
+    report = {
+        "requests": len(results),
+        "threads": args.threads,
+        "elapsed_s": round(storm["elapsed"], 3),
+        "throughput_rps": round(len(results) / storm["elapsed"], 1) if storm["elapsed"] else 0.0,
+        "status_codes": dict(Counter(status_code for _, _, status_code, _ in results)),
+        "latency": summarize_latencies([latency for _, _, _, latency in results]),
+        **verify(resource, auction_ids, results),
+    }
+
+    if args.json:
+        print(json.dumps(report, indent=2))
+        return
+    latency = report["latency"]
+    print(f"{report['requests']} bids on {len(auction_ids)} auction(s) from {args.threads} threads "
+          f"in {report['elapsed_s']}s ({report['throughput_rps']} req/s)")
+    print(f"status codes: {report['status_codes']}")
+    print(f"latency p50={latency['p50_ms']}ms p95={latency['p95_ms']}ms p99={latency['p99_ms']}ms "
+          f"max={latency['max_ms']}ms")
+    print(f"lost bids: {report['lost_bids']}, duplicated bids: {report['duplicated_bids']}")
+    for auction in report["wrong_current_amount"]:
+        print(f"auction {auction['auction_id']} ended at {auction['current_amount']}, expected {auction['expected']}")
+
+
+if __name__ == '__main__':
+    main()
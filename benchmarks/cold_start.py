@@ -0,0 +1,112 @@
+"""
+Measures the cold start of every Lambda: each presenter is imported in a fresh interpreter, splitting
+the time spent importing the use case module from the time spent building the repositories, clients
+and use case at presenter import.
+
+    python -m benchmarks.cold_start --runs 5 --save before.json
+    git checkout <other revision>
+    python -m benchmarks.cold_start --runs 5 --compare before.json
+"""
+import os
+import sys
+import json
+import glob
+import argparse
+import statistics
+import subprocess
+from typing import Dict, List, Optional
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+PROBE = """
+import json, time, importlib
+started = time.perf_counter()
+importlib.import_module({usecase!r})
+imported = time.perf_counter()
+importlib.import_module({presenter!r})
+finished = time.perf_counter()
+print(json.dumps({{"import_ms": (imported - started) * 1000, "init_ms": (finished - imported) * 1000}}))
+"""
+
+
+def find_functions(only: Optional[List[str]] = None) -> List[str]:
+    paths = glob.glob(os.path.join(ROOT, "src", "modules", "*", "app", "*_presenter.py"))
+    functions = sorted(os.path.basename(path)[:-len("_presenter.py")] for path in paths)
+    return [function for function in functions if not only or function in only]
+
+
+def probe_environment() -> Dict[str, str]:
+    """
+    Enough configuration for every presenter to import without reaching AWS
+    """
+    environment = dict(os.environ)
+    environment.setdefault("STAGE", "test")
+    environment.setdefault("AWS_DEFAULT_REGION", "sa-east-1")
+    environment.setdefault("AWS_ACCESS_KEY_ID", "dummy")
+    environment.setdefault("AWS_SECRET_ACCESS_KEY", "dummy")
+    environment.setdefault("USER_TABLE", "User_Apae_Leilao")
+    environment.setdefault("AUCTION_TABLE", "Auction_Apae_Leilao")
+    environment.setdefault("EMAIL_PORT", "587")
+    environment.setdefault("ENCRYPTED_KEY", "benchmark")
+    environment["PYTHONDONTWRITEBYTECODE"] = "1"
+    return environment
+
+
+def probe(function: str, environment: Dict[str, str]) -> Dict:
+    code = PROBE.format(usecase=f"src.modules.{function}.app.{function}_usecase",
+                        presenter=f"src.modules.{function}.app.{function}_presenter")
+    completed = subprocess.run([sys.executable, "-c", code], cwd=ROOT, env=environment,
+                               capture_output=True, text=True)
+    if completed.returncode != 0:
+        return {"error": completed.stderr.strip().splitlines()[-1] if completed.stderr else "failed"}
+    return json.loads(completed.stdout.strip().splitlines()[-1])
+
+
+def measure(functions: List[str], runs: int) -> Dict[str, Dict]:
+    environment = probe_environment()
+    report = {}
+    for function in functions:
+        samples = [probe(function, environment) for _ in range(runs)]
+        errors = [sample["error"] for sample in samples if "error" in sample]
+        if errors:
+            report[function] = {"error": errors[0]}
+            continue
+        import_ms = statistics.median(sample["import_ms"] for sample in samples)
+        init_ms = statistics.median(sample["init_ms"] for sample in samples)
+        report[function] = {"import_ms": round(import_ms, 1), "init_ms": round(init_ms, 1),
+                            "total_ms": round(import_ms + init_ms, 1)}
+    return report
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Cold start import and init time of every presenter")
+    parser.add_argument("--runs", type=int, default=5, help="fresh interpreters per presenter, median is kept")
+    parser.add_argument("--only", nargs="*", help="function names to measure, all by default")
+    parser.add_argument("--save", help="write the report to this JSON file")
+    parser.add_argument("--compare", help="JSON report of a previous run to compare with")
+    args = parser.parse_args()
+
+    report = measure(find_functions(args.only), args.runs)
+    if args.save:
+        with open(args.save, "w") as file:
+            json.dump(report, file, indent=2)
+
+    baseline = {}
+    if args.compare:
+        with open(args.compare) as file:
+            baseline = json.load(file)
+
+    print(f"{'function':<32}{'import ms':>11}{'init ms':>10}{'total ms':>10}" + (f"{'before ms':>11}" if baseline else ""))
+    for function, result in report.items():
+        if "error" in result:
+            print(f"{function:<32} {result['error']}")
+            continue
+        line = f"{function:<32}{result['import_ms']:>11}{result['init_ms']:>10}{result['total_ms']:>10}"
+        before = baseline.get(function, {}).get("total_ms")
+        if before is not None:
+            line += f"{before:>11}"
+        print(line)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,129 @@
+"""
+Micro-benchmark of email body rendering: the f-string layout rebuilt on every call, the compiled
+templates rendered by substitution and the cached render used when one body goes out many times.
+
+    python -m benchmarks.email_render --iterations 20000
+"""
+import os
+import json
+import timeit
+import argparse
+
+TITLE = "Leilão Benchmark - LOTE[1] começou!"
+FOOTER = "<h2>Atenciosamente,</h2>"
+
+
+def fstring_layout(title: str, content: str, footer: str) -> str:
+    """
+    The layout as set_email_template built it before the template registry
+    """
+    return f"""
+        <html lang="pt-br" charset="UTF-8">
+        <head>
+        </head>
+        <body
+            style="margin: 0; padding: 0; display: flex; align-items: center; justify-content: center; min-height: 75vh; background-color: white; font-family: system-ui, -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, Oxygen, Ubuntu, Cantarell, 'Open Sans', 'Helvetica Neue', sans-serif;">
+            <table class="main"
+                style="width: 50vw; max-width: 600px; background-color: #E9E9E9; border-radius: 10px; box-shadow: 0px 4px 10px rgba(0, 0, 0, 0.25); overflow: hidden;">
+                <tr>
+                    <td>
+                        <table class="TittleBox" style="width: 100%; background-color: #2C4FBC; border-radius: 10px 10px 0 0;">
+                            <tr>
+                                <td style="text-align: center; padding: 20px;">
+                                    <img alt="Apae Leilão Logo"
+                                        src="https://apaeleilaoimtphotos.s3.sa-east-1.amazonaws.com/logo-apaeleilao/logo-apaeleilao-branco.jpg"
+                                        style="width: 50%;"/>
+                                    <h1 style="color: #FFFFFF; margin-top: 10px;"><b>{title}</b></h1>
+                                </td>
+                            </tr>
+                        </table>
+                        <table class="ContentBox" style="width: 100%; background-color: #FFFFFF;">
+                            <tr>
+                                <td style="text-align: center; padding: 20px;">
+                                    {content}
+                                </td>
+                            </tr>
+                        </table>
+                        <table class="BottomBox"
+                            style="width: 100%; background-color: #FFFFFF; border-top: 1px solid gray; border-radius: 0 0 10px 10px;">
+                            <tr>
+                                <td style="text-align: center; padding: 20px;">
+                                    {footer}
+                                </td>
+                            </tr>
+                        </table>
+                    </td>
+                </tr>
+            </table>
+        </body>
+        </html>
+        """
+
+
+def fstring_card(title: str, current_amount: float, date: str) -> str:
+    return f"""
+                <div class="TextsBox" style="display: flex; justify-content: center; align-items: center;">
+                    <div style="border: 1px solid black; border-radius: 10px; padding-bottom: 16px;">
+                        <img style="border-radius: 10px 10px 0 0;" width="250" src="http://via.placeholder.com/500x500" alt="">
+                        <div style="color: #949393; text-align: center; margin-bottom: 16px;">
+                            <h2 style="color:#000000;">{title}</h2>
+                            <p style="color:#000000">Data: {date}</p>
+                            <label style="color: black; font-weight: bold; font-size: 24px;">Lance: R${current_amount}</label>
+                        </div>
+                        <a style="background-color: yellow; border: none; padding: 6px 12px; font-size: 16px; font-weight: bold; border-radius: 25px; margin: 8px; color: black;" href="https://apaeleilao.local"> Ir para o Leilão </a>
+                    </div>
+                </div>
+                """
+
+
+def template_card(templates) -> str:
+    return templates.render(
+        'auction_card',
+        image="http://via.placeholder.com/500x500",
+        image_alt="",
+        title="Benchmark",
+        date="01-01-2024 - 10:00",
+        label_color="black",
+        label="Lance: R$100.0",
+        action=templates.render('auction_card_link', url="https://apaeleilao.local"),
+    )
+
+
+def run(iterations: int) -> dict:
+    from src.shared.helper_functions.email_templates import templates
+
+    card = template_card(templates)
+
+    cases = {
+        "fstring": lambda: fstring_layout(TITLE, fstring_card("Benchmark", 100.0, "01-01-2024 - 10:00"), FOOTER),
+        "template": lambda: templates.render('layout', title=TITLE, content=template_card(templates),
+                                             footer=FOOTER),
+        # send_notification gets the card already rendered and renders the layout of every split message
+        "template_cached": lambda: templates.render('layout', cache_key=('auction_started', '1', 'OPEN'),
+                                                    title=TITLE, content=card, footer=FOOTER),
+    }
+    report = {}
+    for name, case in cases.items():
+        best = min(timeit.repeat(case, number=iterations, repeat=5))
+        report[name] = {"us_per_render": round(best / iterations * 1e6, 3)}
+    return report
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Email rendering micro-benchmark")
+    parser.add_argument("--iterations", type=int, default=20000)
+    parser.add_argument("--json", action="store_true", help="print the report as JSON")
+    args = parser.parse_args()
+
+    os.environ.setdefault("EMAIL_RENDER_CACHE_SIZE", "128")
+    report = run(args.iterations)
+
+    if args.json:
+        print(json.dumps(report, indent=2))
+        return
+    for name, result in report.items():
+        print(f"{name:>16}: {result['us_per_render']} us/render")
+
+
+if __name__ == '__main__':
+    main()
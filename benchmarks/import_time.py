@@ -0,0 +1,90 @@
+"""
+Records `python -X importtime` for every presenter's lambda_handler and summarizes where the import
+time goes: the cumulative time of the presenter, the heaviest modules it pulls in and the self time
+grouped by top-level package (src, boto3, botocore, jwt, stdlib modules...).
+
+    python -m benchmarks.import_time --top 10
+    python -m benchmarks.import_time --only create_bid get_user --json
+"""
+import sys
+import json
+import argparse
+import subprocess
+from collections import defaultdict
+from typing import Dict, List
+
+from benchmarks.cold_start import find_functions, probe_environment, ROOT
+
+
+def parse_importtime(stderr: str) -> List[Dict]:
+    """
+    Parse the `import time: self [us] | cumulative | imported package` lines written to stderr
+    """
+    modules = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "imported package" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|")
+        modules.append({
+            "module": name.strip(),
+            "depth": (len(name) - len(name.lstrip()) - 1) // 2,
+            "self_us": int(self_us),
+            "cumulative_us": int(cumulative_us),
+        })
+    return modules
+
+
+def record(function: str, environment: Dict[str, str]) -> Dict:
+    code = f"from src.modules.{function}.app.{function}_presenter import lambda_handler"
+    completed = subprocess.run([sys.executable, "-X", "importtime", "-c", code], cwd=ROOT, env=environment,
+                               capture_output=True, text=True)
+    if completed.returncode != 0:
+        return {"error": completed.stderr.strip().splitlines()[-1] if completed.stderr else "failed"}
+    return {"modules": parse_importtime(completed.stderr)}
+
+
+def summarize(modules: List[Dict], top: int) -> Dict:
+    by_package = defaultdict(int)
+    for module in modules:
+        by_package[module["module"].split(".")[0]] += module["self_us"]
+    return {
+        "total_ms": round(sum(module["self_us"] for module in modules) / 1000, 1),
+        "modules": len(modules),
+        "heaviest": [{"module": module["module"], "cumulative_ms": round(module["cumulative_us"] / 1000, 1)}
+                     for module in sorted(modules, key=lambda module: module["cumulative_us"], reverse=True)
+                     if module["depth"] > 0][:top],
+        "by_package_ms": {package: round(self_us / 1000, 1) for package, self_us in
+                          sorted(by_package.items(), key=lambda item: item[1], reverse=True)[:top]},
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="-X importtime of every presenter")
+    parser.add_argument("--only", nargs="*", help="function names to record, all by default")
+    parser.add_argument("--top", type=int, default=10, help="modules and packages listed per function")
+    parser.add_argument("--json", action="store_true", help="print the report as JSON")
+    args = parser.parse_args()
+
+    environment = probe_environment()
+    environment.pop("PYTHONDONTWRITEBYTECODE", None)
+    report = {}
+    for function in find_functions(args.only):
+        recorded = record(function, environment)
+        report[function] = summarize(recorded["modules"], args.top) if "modules" in recorded else recorded
+
+    if args.json:
+        print(json.dumps(report, indent=2))
+        return
+    for function, summary in report.items():
+        if "error" in summary:
+            print(f"{function}: {summary['error']}")
+            continue
+        print(f"{function}: {summary['total_ms']} ms, {summary['modules']} modules")
+        packages = ", ".join(f"{package} {ms}" for package, ms in summary["by_package_ms"].items())
+        print(f"    by package (ms): {packages}")
+        for module in summary["heaviest"]:
+            print(f"    {module['cumulative_ms']:>8} ms  {module['module']}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,44 @@
+import os
+
+from iac.iac.dynamodb_schema import TABLES, USER_TABLE, AUCTION_TABLE, create_table_request
+
+LOCAL_ENDPOINT = "http://localhost:8000"
+
+
+def configure_environment():
+    """
+    Point the shared Database at DynamoDB Local. Must run before the first table access from src,
+    since the shared boto3 resource reads STAGE when it is created.
+    """
+    os.environ["STAGE"] = "test"
+    os.environ.setdefault("USER_TABLE", USER_TABLE)
+    os.environ.setdefault("AUCTION_TABLE", AUCTION_TABLE)
+    os.environ.setdefault("ENCRYPTED_KEY", "benchmark")
+
+
+def local_resource():
+    import boto3
+
+    return boto3.resource("dynamodb",
+                          endpoint_url=LOCAL_ENDPOINT,
+                          region_name="dummy",
+                          aws_access_key_id="dummy",
+                          aws_secret_access_key="dummy"
+                          )
+
+
+def provision_tables(reset: bool = True):
+    """
+    Create the tables and indexes defined in the CDK stack, dropping the previous ones when reset is set
+    """
+    resource = local_resource()
+    existing = set(resource.meta.client.list_tables().get("TableNames", []))
+    for table_name in TABLES:
+        if table_name in existing:
+            if not reset:
+                continue
+            resource.Table(table_name).delete()
+            resource.meta.client.get_waiter("table_not_exists").wait(TableName=table_name)
+        resource.create_table(**create_table_request(table_name))
+        resource.meta.client.get_waiter("table_exists").wait(TableName=table_name)
+    return resource
@@ -0,0 +1,67 @@
+"""
+Deploy order of the auction table indexes. CloudFormation creates only one global secondary index per
+table in each stack update, so the two indexes added to the auction table go out in separate deploys:
+
+    1. cdk deploy                                  creates status_auction_start_date-index
+    2. python backfill_status_auction_index.py     once the index is ACTIVE (--dry-run to preview)
+    3. cdk deploy -c bid_amount_index=true         creates PK_amount-index; in CD, set the
+                                                   BID_AMOUNT_INDEX repository variable to true
+
+Until step 3, the lambdas read the top bids without PK_amount-index.
+"""
+import os
+import sys
+from decimal import Decimal
+
+import boto3
+from boto3.dynamodb.conditions import Key
+
+AUCTION_TABLE_NAME = os.environ.get("AUCTION_TABLE", "Auction_Apae_Leilao")
+STATUS_AUCTION = ("AVAILABLE", "PENDING", "OPEN", "CLOSED", "SUSPENDED")
+
+
+def backfill_status_auction_index(dry_run: bool = False):
+    """
+    DynamoDB fills status_auction_start_date-index by itself from the existing attributes, but only indexes
+    items whose status_auction is a string and whose start_date is a number. This rewrites the auctions
+    stored with another type so that every auction is reachable through the index.
+    """
+    table = boto3.resource("dynamodb").Table(AUCTION_TABLE_NAME)
+
+    query = dict(
+        IndexName="SK-index",
+        KeyConditionExpression=Key("SK").eq("AUCTION"),
+    )
+    scanned, fixed, skipped = 0, 0, 0
+    while True:
+        response = table.query(**query)
+        for auction in response.get("Items", []):
+            scanned += 1
+            status_auction = auction.get("status_auction")
+            start_date = auction.get("start_date")
+
+            if status_auction not in STATUS_AUCTION or start_date is None:
+                print(f"Skipping auction {auction['PK']}: status_auction={status_auction} start_date={start_date}")
+                skipped += 1
+                continue
+            if isinstance(start_date, Decimal):
+                continue
+
+            print(f"Fixing auction {auction['PK']}: start_date={start_date!r}")
+            fixed += 1
+            if not dry_run:
+                table.update_item(
+                    Key={"PK": auction["PK"], "SK": auction["SK"]},
+                    UpdateExpression="SET start_date = :start_date",
+                    ExpressionAttributeValues={":start_date": int(start_date)},
+                )
+
+        if not response.get("LastEvaluatedKey"):
+            break
+        query["ExclusiveStartKey"] = response["LastEvaluatedKey"]
+
+    print(f"Auctions scanned: {scanned}, fixed: {fixed}, skipped: {skipped}{' (dry run)' if dry_run else ''}")
+
+
+if __name__ == '__main__':
+    backfill_status_auction_index(dry_run="--dry-run" in sys.argv)
@@ -0,0 +1,72 @@
+"""
+Embed on every user item the summaries of its suspensions. Users created before the summaries were
+embedded have no suspensions attribute, and a user suspended again before this runs has only the
+newer summaries. Run it once after the deploy that embeds the summaries (--dry-run to preview):
+
+    python backfill_suspension_summaries.py
+"""
+import os
+import sys
+
+import boto3
+from boto3.dynamodb.conditions import Key, Attr
+from botocore.exceptions import ClientError
+
+USER_TABLE_NAME = os.environ.get("USER_TABLE", "User_Apae_Leilao")
+SUMMARY_ATTRIBUTES = ("reason", "status_suspension", "date_suspension", "date_reactivation", "created_at")
+
+
+def query_all(table, **query):
+    while True:
+        response = table.query(**query)
+        yield from response.get("Items", [])
+        if not response.get("LastEvaluatedKey"):
+            return
+        query["ExclusiveStartKey"] = response["LastEvaluatedKey"]
+
+
+def backfill_suspension_summaries(dry_run: bool = False):
+    """
+    Rebuilds the summaries from the SUSPENSION# items of each user and writes them when they differ
+    from the embedded ones. The write is conditioned on the summaries read, so a suspension created
+    meanwhile is not lost; those users are reported and the script can be run again.
+    """
+    table = boto3.resource("dynamodb").Table(USER_TABLE_NAME)
+
+    scanned, fixed, conflicts = 0, 0, 0
+    for user in query_all(table, IndexName="SK_type_account-index", KeyConditionExpression=Key("SK").eq("USER")):
+        scanned += 1
+        suspensions = query_all(table, KeyConditionExpression=Key("PK").eq(user["PK"]) &
+                                Key("SK").begins_with("SUSPENSION#"))
+        summaries = [{"suspension_id": suspension["SK"].split("#")[1],
+                      **{attribute: suspension.get(attribute) for attribute in SUMMARY_ATTRIBUTES}}
+                     for suspension in suspensions]
+
+        current = user.get("suspensions")
+        if current is not None and sorted(summary["suspension_id"] for summary in current) == \
+                sorted(summary["suspension_id"] for summary in summaries):
+            continue
+
+        print(f"Fixing user {user['PK']}: {len(current or [])} embedded, {len(summaries)} suspensions")
+        fixed += 1
+        if dry_run:
+            continue
+        condition = Attr("suspensions").not_exists() if current is None else Attr("suspensions").eq(current)
+        try:
+            table.update_item(
+                Key={"PK": user["PK"], "SK": user["SK"]},
+                UpdateExpression="SET suspensions = :suspensions",
+                ConditionExpression=condition,
+                ExpressionAttributeValues={":suspensions": summaries},
+            )
+        except ClientError as e:
+            if e.response["Error"]["Code"] != "ConditionalCheckFailedException":
+                raise e
+            print(f"User {user['PK']} changed while fixing, run again")
+            conflicts += 1
+
+    print(f"Users scanned: {scanned}, fixed: {fixed}, conflicts: {conflicts}{' (dry run)' if dry_run else ''}")
+
+
+if __name__ == '__main__':
+    backfill_suspension_summaries(dry_run="--dry-run" in sys.argv)
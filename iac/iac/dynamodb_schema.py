@@ -0,0 +1,76 @@
+"""
+Key schema of the DynamoDB tables and their global secondary indexes.
+Kept free of CDK imports so the same definition provisions the tables on DynamoDB Local for the benchmarks.
+"""
+from typing import Dict
+
+USER_TABLE = "User_Apae_Leilao"
+AUCTION_TABLE = "Auction_Apae_Leilao"
+
+STRING = "S"
+NUMBER = "N"
+
+TABLES = {
+    USER_TABLE: {
+        "partition_key": ("PK", STRING),
+        "sort_key": ("SK", STRING),
+        "global_secondary_indexes": [
+            {"index_name": "SK_created_at-index", "partition_key": ("SK", STRING), "sort_key": ("created_at", NUMBER)},
+            {"index_name": "SK_type_account-index", "partition_key": ("SK", STRING),
+             "sort_key": ("type_account", STRING)},
+            {"index_name": "email-index", "partition_key": ("email", STRING)},
+            {"index_name": "cpf-index", "partition_key": ("cpf", STRING)},
+            {"index_name": "access_key-index", "partition_key": ("access_key", STRING)},
+        ],
+    },
+    AUCTION_TABLE: {
+        "partition_key": ("PK", STRING),
+        "sort_key": ("SK", STRING),
+        "global_secondary_indexes": [
+            {"index_name": "SK_PK-index", "partition_key": ("SK", STRING), "sort_key": ("PK", STRING)},
+            {"index_name": "SK_start_date-index", "partition_key": ("SK", STRING), "sort_key": ("start_date", NUMBER)},
+            {"index_name": "SK_created_at-index", "partition_key": ("SK", STRING), "sort_key": ("created_at", NUMBER)},
+            {"index_name": "SK-index", "partition_key": ("SK", STRING)},
+            {"index_name": "user_id-index", "partition_key": ("user_id", STRING)},
+            {"index_name": "status_auction_start_date-index", "partition_key": ("status_auction", STRING),
+             "sort_key": ("start_date", NUMBER)},
+            # CloudFormation creates one GSI per table per update, so this one only deploys with
+            # `cdk deploy -c bid_amount_index=true`, once status_auction_start_date-index exists
+            {"index_name": "PK_amount-index", "partition_key": ("PK", STRING), "sort_key": ("amount", NUMBER),
+             "context_flag": "bid_amount_index"},
+        ],
+    },
+}
+
+
+def create_table_request(table_name: str) -> Dict:
+    """
+    Arguments of a boto3 create_table call for one of the tables, used outside CDK
+    """
+    table = TABLES[table_name]
+    attributes = {}
+
+    def key_schema(partition_key, sort_key=None):
+        keys = [partition_key] + ([sort_key] if sort_key else [])
+        for name, attribute_type in keys:
+            attributes[name] = attribute_type
+        return [{"AttributeName": name, "KeyType": key_type}
+                for (name, _), key_type in zip(keys, ("HASH", "RANGE"))]
+
+    request = {
+        "TableName": table_name,
+        "KeySchema": key_schema(table["partition_key"], table.get("sort_key")),
+        "BillingMode": "PAY_PER_REQUEST",
+    }
+    if table["global_secondary_indexes"]:
+        request["GlobalSecondaryIndexes"] = [
+            {
+                "IndexName": index["index_name"],
+                "KeySchema": key_schema(index["partition_key"], index.get("sort_key")),
+                "Projection": {"ProjectionType": "ALL"},
+            }
+            for index in table["global_secondary_indexes"]
+        ]
+    request["AttributeDefinitions"] = [{"AttributeName": name, "AttributeType": attribute_type}
+                                       for name, attribute_type in attributes.items()]
+    return request
@@ -8,6 +8,8 @@ from aws_cdk import (
 import boto3
 from constructs import Construct
 
+from .dynamodb_schema import TABLES, USER_TABLE, AUCTION_TABLE, NUMBER
+
 
 def create_table(self,
                  name: str,
@@ -56,8 +58,30 @@ def create_global_secondary_index(table: dynamodb.Table,
     )
 
 
+def context_enabled(self, flag: str) -> bool:
+    return str(self.node.try_get_context(flag)).lower() == "true"
+
+
+def create_table_from_schema(self, name: str) -> dynamodb.Table:
+    def attribute_type(key_type: str) -> dynamodb.AttributeType:
+        return dynamodb.AttributeType.NUMBER if key_type == NUMBER else dynamodb.AttributeType.STRING
+
+    schema = TABLES[name]
+    partition_key, _ = schema["partition_key"]
+    sort_key, sort_key_type = schema["sort_key"]
+    table = create_table(self, name, partition_key, sort_key, attribute_type(sort_key_type))
+    for index in schema["global_secondary_indexes"]:
+        if index.get("context_flag") and not context_enabled(self, index["context_flag"]):
+            continue
+        index_partition_key, _ = index["partition_key"]
+        index_sort_key, index_sort_key_type = index.get("sort_key", (None, None))
+        create_global_secondary_index(table, index["index_name"], index_partition_key, index_sort_key,
+                                      attribute_type(index_sort_key_type) if index_sort_key else None)
+    return table
+
+
 def add_admin_user() -> None:
-    client = boto3.resource('dynamodb').Table("User_Apae_Leilao")
+    client = boto3.resource('dynamodb').Table(USER_TABLE)
     if not client.get_item(Key={"PK": os.environ.get("ADMIN_ID"), "SK": "USER"}).get("Item"):
         admin_user = {
             "PK": os.environ.get("ADMIN_ID"),
@@ -77,28 +101,14 @@ class DynamoDBStack(Construct):
     def __init__(self, scope: Construct) -> None:
         super().__init__(scope, "ApaeLeilao_DynamoDB")
 
-        self.__user_table = create_table(self, "User_Apae_Leilao", "PK", "SK",
-                                         dynamodb.AttributeType.STRING)
-        create_global_secondary_index(self.__user_table, "SK_created_at-index", "SK",
-                                        "created_at", dynamodb.AttributeType.NUMBER)
-        create_global_secondary_index(self.__user_table, "SK_type_account-index", "SK",
-                                      "type_account", dynamodb.AttributeType.STRING)
-        create_global_secondary_index(self.__user_table, "email-index", "email")
-        create_global_secondary_index(self.__user_table, "cpf-index", "cpf")
-        create_global_secondary_index(self.__user_table, "access_key-index", "access_key")
-
-        self.__auction_table = create_table(self, "Auction_Apae_Leilao", "PK", "SK",
-                                            dynamodb.AttributeType.STRING)
-        create_global_secondary_index(self.__auction_table, "SK_PK-index", "SK", "PK",
-                                      dynamodb.AttributeType.STRING)
-        create_global_secondary_index(self.__auction_table, "SK_start_date-index", "SK",
-                                      "start_date", dynamodb.AttributeType.NUMBER)
-        create_global_secondary_index(self.__auction_table, "SK_created_at-index", "SK",
-                                      "created_at", dynamodb.AttributeType.NUMBER)
-        create_global_secondary_index(self.__auction_table, "SK-index", "SK")
-        create_global_secondary_index(self.__auction_table, "user_id-index", "user_id")
+        self.__user_table = create_table_from_schema(self, USER_TABLE)
+        self.__auction_table = create_table_from_schema(self, AUCTION_TABLE)
         add_admin_user()
 
+    @property
+    def bid_amount_index(self) -> bool:
+        return context_enabled(self, "bid_amount_index")
+
     @property
     def user_table(self) -> dynamodb.Table:
         return self.__user_table
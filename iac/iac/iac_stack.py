@@ -1,7 +1,8 @@
 import os
 from aws_cdk import (
     aws_apigateway as apigw,
-    Stack, aws_iam as iam
+    aws_sqs as sqs,
+    Stack, Duration, aws_iam as iam
 )
 from constructs import Construct
 
@@ -87,14 +88,29 @@ class IACStack(Stack):
 
         ENVIRONMENT_VARIABLES["USER_TABLE"] = self.dynamodb_stack.user_table.table_name
         ENVIRONMENT_VARIABLES["AUCTION_TABLE"] = self.dynamodb_stack.auction_table.table_name
+        ENVIRONMENT_VARIABLES["BID_AMOUNT_INDEX"] = str(self.dynamodb_stack.bid_amount_index).lower()
 
-        self.lambda_events_function = LambdaEventsStack(self, environment_variables=ENVIRONMENT_VARIABLES)
+        self.notification_dead_letter_queue = sqs.Queue(
+            self, "Notification_Dead_Letter_Queue_Apae_Leilao",
+            retention_period=Duration.days(14),
+        )
+        self.notification_queue = sqs.Queue(
+            self, "Notification_Queue_Apae_Leilao",
+            visibility_timeout=Duration.seconds(720),
+            dead_letter_queue=sqs.DeadLetterQueue(max_receive_count=3, queue=self.notification_dead_letter_queue),
+        )
+        ENVIRONMENT_VARIABLES["NOTIFICATION_QUEUE_URL"] = self.notification_queue.queue_url
+
+        self.lambda_events_function = LambdaEventsStack(self, environment_variables=ENVIRONMENT_VARIABLES,
+                                                        notification_queue=self.notification_queue)
         self.add_lambda_database_permissions(self.lambda_events_function)
+        self.add_lambda_notification_permissions(self.lambda_events_function)
         add_lambda_policies(self.lambda_events_function)
 
         self.lambda_function = LambdaStack(self, restapi_resource=restapi_resourse,
                                            environment_variables=ENVIRONMENT_VARIABLES)
         self.add_lambda_database_permissions(self.lambda_function)
+        self.add_lambda_notification_permissions(self.lambda_function)
         add_lambda_policies(self.lambda_function)
 
         restapi_resourse_webhook = self.__restapi.root.add_resource("apae-leilao-webhook",
@@ -109,6 +125,7 @@ class IACStack(Stack):
         self.lambda_webhook = LambdaWebhookStack(self, restapi_resource=restapi_resourse_webhook,
                                                  environment_variables=ENVIRONMENT_VARIABLES)
         self.add_lambda_database_permissions(self.lambda_webhook)
+        self.add_lambda_notification_permissions(self.lambda_webhook)
         add_lambda_policies(self.lambda_webhook)
 
     def add_lambda_database_permissions(self, lambda_stack):
@@ -117,3 +134,7 @@ class IACStack(Stack):
 
         for lambda_function in lambda_stack.functions_need_auction_table_permission:
             self.dynamodb_stack.auction_table.grant_read_write_data(lambda_function)
+
+    def add_lambda_notification_permissions(self, lambda_stack):
+        for lambda_function in lambda_stack.functions_need_notification_permission:
+            self.notification_queue.grant_send_messages(lambda_function)
@@ -1,6 +1,11 @@
 from typing import Dict, Tuple
 from aws_cdk import (
+    aws_iam as iam,
     aws_lambda as _lambda,
+    aws_sqs as sqs,
+    aws_events as events,
+    aws_events_targets as targets,
+    aws_lambda_event_sources as event_sources,
     Duration
 )
 from constructs import Construct
@@ -10,6 +15,7 @@ class LambdaEventsStack(Construct):
 
     def create_lambda(self, function_name: str,
                       environment_variables: Dict[str, str],
+                      timeout: Duration = Duration.seconds(15),
                       ) -> _lambda.Function:
         function = _lambda.Function(
             self, (function_name + "_apae_leilao").title(),
@@ -19,14 +25,15 @@ class LambdaEventsStack(Construct):
             code=_lambda.Code.from_asset(f"../src/modules/{function_name}"),
             handler=f"app.{function_name}_presenter.lambda_handler",
             layers=[self.shared_layer, self.mercadopago, self.urllib3],
-            timeout=Duration.seconds(15),
+            timeout=timeout,
             memory_size=512,
         )
 
         return function
 
     def __init__(self, scope: Construct,
-                 environment_variables: Dict[str, str]) -> None:
+                 environment_variables: Dict[str, str],
+                 notification_queue: sqs.Queue) -> None:
         super().__init__(scope, "ApaeLeilao_Lambdas_Events")
 
         self.shared_layer = _lambda.LayerVersion(
@@ -62,6 +69,32 @@ class LambdaEventsStack(Construct):
             environment_variables=environment_variables,
         )
 
+        self.send_notification = self.create_lambda(
+            function_name="send_notification",
+            environment_variables=environment_variables,
+            timeout=Duration.seconds(120),
+        )
+        self.send_notification.add_event_source(event_sources.SqsEventSource(
+            notification_queue,
+            batch_size=10,
+            report_batch_item_failures=True,
+        ))
+
+        self.cleanup_auction_images = self.create_lambda(
+            function_name="cleanup_auction_images",
+            environment_variables=environment_variables,
+            timeout=Duration.minutes(15),
+        )
+        self.cleanup_auction_images.add_to_role_policy(statement=iam.PolicyStatement(
+            actions=["s3:ListBucket", "s3:DeleteObject"],
+            resources=["*"]
+        ))
+        events.Rule(
+            self, "Cleanup_Auction_Images_Schedule_Apae_Leilao",
+            schedule=events.Schedule.cron(minute="0", hour="6"),
+            targets=[targets.LambdaFunction(self.cleanup_auction_images)],
+        )
+
     @property
     def functions_need_user_table_permission(self) -> Tuple[_lambda.Function] or None:
         return (
@@ -75,6 +108,15 @@ class LambdaEventsStack(Construct):
         return (
             self.start_auction,
             self.end_auction,
+            self.cleanup_auction_images,
+        )
+
+    @property
+    def functions_need_notification_permission(self) -> Tuple[_lambda.Function] or None:
+        return (
+            self.start_auction,
+            self.end_auction,
+            self.send_notification,
         )
 
     @property
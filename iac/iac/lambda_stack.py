@@ -15,6 +15,8 @@ class LambdaStack(Construct):
                       restapi_resource: apigw.Resource = None,
                       origins: List = apigw.Cors.ALL_ORIGINS,
                       more_layers: List[_lambda.LayerVersion] = None,
+                      memory_size: int = 512,
+                      timeout: Duration = Duration.seconds(15),
                       ) -> _lambda.Function:
         layers = [self.shared_layer, self.jwt_layer, self.bcrypt_layer]
         layers.extend(more_layers) if more_layers else None
@@ -27,8 +29,8 @@ class LambdaStack(Construct):
             code=_lambda.Code.from_asset(f"../src/modules/{function_name}"),
             handler=f"app.{function_name}_presenter.lambda_handler",
             layers=layers,
-            timeout=Duration.seconds(15),
-            memory_size=512,
+            timeout=timeout,
+            memory_size=memory_size,
         )
 
         restapi_resource.add_resource(function_name.replace("_", "-"),
@@ -76,6 +78,12 @@ class LambdaStack(Construct):
             compatible_runtimes=[_lambda.Runtime.PYTHON_3_9]
         )
 
+        self.pillow_layer = _lambda.LayerVersion(
+            self, "Pillow_Layer",
+            code=_lambda.Code.from_asset("./pillow_layer"),
+            compatible_runtimes=[_lambda.Runtime.PYTHON_3_9]
+        )
+
         self.create_user = self.create_lambda(
             function_name="create_user",
             method="POST",
@@ -130,6 +138,11 @@ class LambdaStack(Construct):
             method="POST",
             restapi_resource=restapi_resource,
             environment_variables=environment_variables,
+            more_layers=[self.pillow_layer],
+            # Up to 10 images are resized in the request, at 1769 MB the function gets a full vCPU and
+            # 29 s is as long as API Gateway waits
+            memory_size=1769,
+            timeout=Duration.seconds(29),
         )
 
         self.create_user_by_admin = self.create_lambda(
@@ -217,11 +230,23 @@ class LambdaStack(Construct):
             environment_variables=environment_variables,
         )
 
+        self.create_auction_upload = self.create_lambda(
+            function_name="create_auction_upload",
+            method="POST",
+            restapi_resource=restapi_resource,
+            environment_variables=environment_variables,
+        )
+
         self.create_auction.add_to_role_policy(statement=iam.PolicyStatement(
             actions=["s3:*"],
             resources=["*"]
         ))
 
+        self.create_auction_upload.add_to_role_policy(statement=iam.PolicyStatement(
+            actions=["s3:PutObject", "s3:PutObjectAcl"],
+            resources=["*"]
+        ))
+
     @property
     def functions_need_user_table_permission(self) -> Tuple[_lambda.Function] or None:
         return (
@@ -245,6 +270,7 @@ class LambdaStack(Construct):
             self.get_all_users,
             self.delete_suspension,
             self.get_all_feedbacks,
+            self.create_auction_upload,
         )
 
     @property
@@ -258,6 +284,13 @@ class LambdaStack(Construct):
             self.get_payment,
             self.get_all_auctions_user,
             self.get_all_auctions_admin,
+            self.create_auction_upload,
+        )
+
+    @property
+    def functions_need_notification_permission(self) -> Tuple[_lambda.Function] or None:
+        return (
+            self.delete_auction,
         )
 
     @property
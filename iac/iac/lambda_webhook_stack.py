@@ -89,6 +89,7 @@ class LambdaWebhookStack(Construct):
     @property
     def functions_need_user_table_permission(self) -> Tuple[_lambda.Function] or None:
         return (
+            self.update_payment,
         )
 
     @property
@@ -97,6 +98,12 @@ class LambdaWebhookStack(Construct):
             self.update_payment,
         )
 
+    @property
+    def functions_need_notification_permission(self) -> Tuple[_lambda.Function] or None:
+        return (
+            self.update_payment,
+        )
+
     @property
     def functions_need_events_permission(self) -> Tuple[_lambda.Function] or None:
         return (
@@ -0,0 +1,11 @@
+from typing import Dict
+
+from .cleanup_auction_images_usecase import CleanupAuctionImagesUseCase
+
+
+class CleanupAuctionImagesController:
+    def __init__(self, usecase: CleanupAuctionImagesUseCase):
+        self.__usecase = usecase
+
+    def __call__(self, event: Dict) -> Dict:
+        return self.__usecase(body=(event or {}).get('body'))
@@ -0,0 +1,11 @@
+from .cleanup_auction_images_usecase import CleanupAuctionImagesUseCase
+from .cleanup_auction_images_controller import CleanupAuctionImagesController
+
+from src.shared.database.database_auction import AuctionDynamodb
+
+usecase = CleanupAuctionImagesUseCase(AuctionDynamodb())
+controller = CleanupAuctionImagesController(usecase)
+
+
+def lambda_handler(event, context):
+    return controller(event=event)
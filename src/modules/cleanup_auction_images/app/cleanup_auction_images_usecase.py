@@ -0,0 +1,61 @@
+import os
+import time
+from typing import Dict, List, Optional
+
+from src.shared.helper_functions.image_manipulation import DELETE_BATCH_SIZE, ImageManipulation
+from src.shared.structure.enums.auction_enum import STATUS_AUCTION_ENUM
+from src.shared.structure.interface.auction_interface import AuctionInterface
+
+
+class CleanupAuctionImagesUseCase:
+
+    def __init__(self, auction_interface: AuctionInterface):
+        self.__auction_interface = auction_interface
+        self.__image_manipulation = ImageManipulation()
+        self.__grace_hours = float(os.environ.get('IMAGE_CLEANUP_GRACE_HOURS', 24))
+
+    def __call__(self, body: Optional[Dict] = None) -> Dict:
+        """
+        Delete the objects of the auctions prefix that belong to no live auction: suspended auctions,
+        failed creations and presigned uploads never confirmed. Objects newer than the grace period are
+        kept, so uploads of an auction still being created are not removed.
+        """
+        dry_run = bool((body or {}).get('dry_run'))
+        live_auction_ids = self.__auction_interface.get_auction_ids(exclude_status=[STATUS_AUCTION_ENUM.SUSPENDED])
+        cutoff = time.time() - self.__grace_hours * 3600
+
+        report = {
+            'dry_run': dry_run,
+            'scanned_objects': 0,
+            'orphan_auctions': set(),
+            'deleted_objects': 0,
+            'reclaimed_bytes': 0,
+            'kept_recent_objects': 0,
+            'failed_keys': [],
+        }
+        batch = []
+        for item in self.__image_manipulation.list_auction_objects():
+            report['scanned_objects'] += 1
+            if not item['auction_id'] or item['auction_id'] in live_auction_ids:
+                continue
+            if item['last_modified'].timestamp() > cutoff:
+                report['kept_recent_objects'] += 1
+                continue
+            report['orphan_auctions'].add(item['auction_id'])
+            batch.append(item)
+            if len(batch) == DELETE_BATCH_SIZE:
+                self.__delete(batch, dry_run, report)
+                batch = []
+        if batch:
+            self.__delete(batch, dry_run, report)
+
+        report['orphan_auctions'] = sorted(report['orphan_auctions'], key=lambda auction_id: auction_id.zfill(10))
+        return report
+
+    def __delete(self, batch: List[Dict], dry_run: bool, report: Dict):
+        failed = [] if dry_run else self.__image_manipulation.delete_objects([item['key'] for item in batch])
+        report['failed_keys'].extend(failed)
+        failed = set(failed)
+        deleted = [item for item in batch if item['key'] not in failed]
+        report['deleted_objects'] += len(deleted)
+        report['reclaimed_bytes'] += sum(item['size'] for item in deleted)
@@ -2,44 +2,34 @@ import time
 from typing import Dict
 
 from src.shared.structure.entities.user import User
-from src.shared.helper_functions.token_authy import TokenAuthy
+from src.shared.helper_functions.authorizer import Authorizer, USER_ACCOUNTS
 from src.shared.structure.interface.user_interface import UserInterface
-from src.shared.structure.enums.user_enum import STATUS_USER_ACCOUNT_ENUM, TYPE_ACCOUNT_USER_ENUM
+from src.shared.structure.enums.user_enum import STATUS_USER_ACCOUNT_ENUM
 from src.shared.helper_functions.time_manipulation import TimeManipulation
-from src.shared.errors.modules_errors import MissingParameter, UserNotAuthenticated, InvalidParameter
+from src.shared.errors.modules_errors import MissingParameter, InvalidParameter
 
 
 class ConfirmVerificationEmailCodeUseCase:
 
     def __init__(self, user_interface: UserInterface):
         self.__user_interface = user_interface
-        self.__token = TokenAuthy()
+        self.__authorizer = Authorizer(user_interface)
 
     def __call__(self, auth: Dict, body: Dict):
         if not auth:
             raise MissingParameter('auth')
-        if not auth.get('Authorization'):
-            raise UserNotAuthenticated('Authorization')
+        principal = self.__authorizer(auth, type_accounts=USER_ACCOUNTS, missing_token_message='Authorization',
+                                      type_account_message='Você não tem permissão para validar uma conta de usuário.')
+        user = principal.user
 
         if not body:
             raise MissingParameter('body')
         if not body.get('verification_email_code'):
             raise MissingParameter('Código de validação')
 
-        decoded_token = self.__token.decode_token(auth['Authorization'])
-        if not decoded_token:
-            raise UserNotAuthenticated("Token de acesso inválido ou expirado.")
-        user_id = decoded_token.get('user_id')
-        user = self.__user_interface.get_user_by_id(user_id=user_id)
-        if not user:
-            raise UserNotAuthenticated()
-
-        if user.get('status_account') != STATUS_USER_ACCOUNT_ENUM.PENDING.value:
+        if principal.status_account != STATUS_USER_ACCOUNT_ENUM.PENDING:
             raise InvalidParameter(parameter='Conta', body='já verificada')
 
-        if TYPE_ACCOUNT_USER_ENUM(user.get('type_account')) != TYPE_ACCOUNT_USER_ENUM.USER:
-            raise UserNotAuthenticated(message='Você não tem permissão para validar uma conta de usuário.')
-
         current_time = TimeManipulation.get_current_time()
 
         if current_time > user.get('verification_email_code_expires_at'):
@@ -2,9 +2,10 @@ from typing import Dict
 
 from .create_auction_usecase import CreateUserUseCase
 
-from src.shared.https_codes.https_code import Created, BadRequest, InternalServerError, ParameterError, Unauthorized
+from src.shared.https_codes.https_code import Created, BadRequest, InternalServerError, NotFound, ParameterError, \
+    Unauthorized
 from src.shared.errors.modules_errors import InvalidRequest, MissingParameter, InvalidParameter, DataAlreadyUsed, \
-    UserNotAuthenticated
+    DataNotFound, UserNotAuthenticated
 
 
 class CreateUserController:
@@ -26,6 +27,9 @@ class CreateUserController:
         except DataAlreadyUsed as e:
             return ParameterError(message=e.message)
 
+        except DataNotFound as e:
+            return NotFound(message=e.message)
+
         except InvalidRequest as e:
             return BadRequest(message=e.message)
 
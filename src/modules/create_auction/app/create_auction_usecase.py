@@ -1,19 +1,19 @@
-from typing import Dict
+from typing import Dict, List
 
 from src.shared.structure.entities.auction import Auction
-from src.shared.helper_functions.token_authy import TokenAuthy
+from src.shared.helper_functions.authorizer import Authorizer, STAFF_ACCOUNTS, ACTIVE_STATUS
 from src.shared.helper_functions.events_trigger import EventsTrigger
 from src.shared.structure.interface.user_interface import UserInterface
 from src.shared.helper_functions.time_manipulation import TimeManipulation
 from src.shared.helper_functions.image_manipulation import ImageManipulation
 from src.shared.structure.interface.auction_interface import AuctionInterface
-from src.shared.structure.enums.user_enum import STATUS_USER_ACCOUNT_ENUM, TYPE_ACCOUNT_USER_ENUM
-from src.shared.errors.modules_errors import DataAlreadyUsed, MissingParameter, UserNotAuthenticated, InvalidParameter
+from src.shared.structure.enums.user_enum import STATUS_USER_ACCOUNT_ENUM
+from src.shared.errors.modules_errors import DataAlreadyUsed, MissingParameter, InvalidParameter
 
 
 class CreateUserUseCase:
     def __init__(self, user_interface: UserInterface, auction_interface: AuctionInterface):
-        self.__token = TokenAuthy()
+        self.__authorizer = Authorizer(user_interface)
         self.__trigger = EventsTrigger()
         self.__user_interface = user_interface
         self.__auction_interface = auction_interface
@@ -21,22 +21,7 @@ class CreateUserUseCase:
 
     def __call__(self, auth: Dict, body: Dict) -> None:
 
-        if not auth.get('Authorization'):
-            raise UserNotAuthenticated('Token de acesso não encontrado.')
-
-        decoded_token = self.__token.decode_token(auth.get('Authorization'))
-        if not decoded_token:
-            raise UserNotAuthenticated("Token de acesso inválido ou expirado.")
-        user_id = decoded_token.get('user_id')
-        user = self.__user_interface.get_user_by_id(user_id=user_id)
-        if not user:
-            raise UserNotAuthenticated()
-        AUTHORIZED_TYPE_ACCOUNT = [TYPE_ACCOUNT_USER_ENUM.ADMIN, TYPE_ACCOUNT_USER_ENUM.MODERATOR]
-        if TYPE_ACCOUNT_USER_ENUM(user.get('type_account')) not in AUTHORIZED_TYPE_ACCOUNT:
-            raise UserNotAuthenticated()
-
-        if STATUS_USER_ACCOUNT_ENUM(user.get('status_account')) != STATUS_USER_ACCOUNT_ENUM.ACTIVE:
-            raise UserNotAuthenticated()
+        principal = self.__authorizer(auth, type_accounts=STAFF_ACCOUNTS, status_accounts=ACTIVE_STATUS)
 
         if not body.get('title'):
             raise MissingParameter('Título')
@@ -74,12 +59,25 @@ class CreateUserUseCase:
         if body.get('start_date') > body.get('end_date'):
             raise InvalidParameter('Data de início', 'não pode ser maior que a data de encerramento')
 
-        last_auction_id = self.__auction_interface.get_last_auction_id()
-        auction_id = last_auction_id + 1 if last_auction_id else 1
+        if self.__auction_interface.get_auction_between_dates(body.get('start_date'), body.get('end_date')):
+            raise DataAlreadyUsed('Já existe um leilão cadastrado para esse período.')
+
+        auction_id = body.get('auction_id')
+        if auction_id:
+            if not str(auction_id).isdigit():
+                raise InvalidParameter('auction_id', 'inválido')
+            if any(image.get('image_body') for image in body.get('images')):
+                raise InvalidParameter('Imagens', 'já enviadas não podem ter image_body')
+            if self.__auction_interface.get_auction_by_id(auction_id=str(auction_id)):
+                raise DataAlreadyUsed(f'Leilão {auction_id}')
+            body['images'] = self.__image_manipulation.confirm_auction_images(
+                auction_id=str(auction_id), image_ids=[image.get('image_id') for image in body.get('images')])
+        else:
+            auction_id = self.__auction_interface.get_next_auction_id()
 
         auction = Auction(
             auction_id=str(auction_id),
-            created_by=user['user_id'],
+            created_by=principal.user_id,
             title=body.get('title'),
             description=body.get('description'),
             start_date=body.get('start_date'),
@@ -91,19 +89,21 @@ class CreateUserUseCase:
             created_at=TimeManipulation.get_current_time()
         )
 
-        if self.__auction_interface.get_auction_between_dates(auction.start_date, auction.end_date):
-            raise DataAlreadyUsed('Já existe um leilão cadastrado para esse período.')
-
-        if auction.images:
-            self.__image_manipulation.create_auction_folder(auction_id=auction.auction_id)
-            for image in body.get('images'):
-                response = self.__image_manipulation.upload_auction_image(auction_id=auction.auction_id,
-                                                                          image_id=image.get('image_id'),
-                                                                          image_body=image.get('image_body'),
-                                                                          content_type=image.get('content_type'))
-                image['image_body'] = response
+        images = body.get('images')
+        image_ids = [image.get('image_id') for image in images]
+        if body.get('auction_id'):
+            self.__set_image_sizes(auction.auction_id, images, image_ids)
+            self.__auction_interface.create_auction(auction)
+        else:
+            uploaded = self.__image_manipulation.upload_auction_images(auction_id=auction.auction_id, images=images)
+            for image, upload in zip(images, uploaded):
+                image.update(upload)
 
-        self.__auction_interface.create_auction(auction)
+            try:
+                self.__auction_interface.create_auction(auction)
+            except Exception as e:
+                self.__image_manipulation.discard_auction_upload(auction_id=auction.auction_id, image_ids=image_ids)
+                raise e
 
         time_now = TimeManipulation().plus_hour(3)
         notification_date = TimeManipulation(time_now=auction.start_date).plus_minute(-10)
@@ -129,3 +129,8 @@ class CreateUserUseCase:
                                       date=auction.start_date)
 
         return None
+
+    def __set_image_sizes(self, auction_id: str, images: List[Dict], image_ids: List[str]):
+        sizes = self.__image_manipulation.create_auction_derivatives(auction_id=auction_id, image_ids=image_ids)
+        for image, image_sizes in zip(images, sizes):
+            image['sizes'] = image_sizes
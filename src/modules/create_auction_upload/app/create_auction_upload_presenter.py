@@ -0,0 +1,17 @@
+from .create_auction_upload_usecase import CreateAuctionUploadUseCase
+from .create_auction_upload_controller import CreateAuctionUploadController
+
+from src.shared.database.database_user import UserDynamodb
+from src.shared.database.database_auction import AuctionDynamodb
+from src.shared.https_codes.https_code import HttpResponse, HttpRequest
+
+usecase = CreateAuctionUploadUseCase(UserDynamodb(), AuctionDynamodb())
+controller = CreateAuctionUploadController(usecase)
+
+
+def lambda_handler(event, context):
+    request = HttpRequest(auth=event['headers'], body=event['body'])
+    response = controller(request=request())
+    http_response = HttpResponse(status_code=response.status_code, body=response.body)
+
+    return http_response.to_dict()
@@ -0,0 +1,52 @@
+from uuid import uuid4
+from typing import Dict
+
+from src.shared.helper_functions.authorizer import Authorizer, STAFF_ACCOUNTS, ACTIVE_STATUS
+from src.shared.structure.interface.user_interface import UserInterface
+from src.shared.helper_functions.image_manipulation import ImageManipulation
+from src.shared.structure.interface.auction_interface import AuctionInterface
+from src.shared.errors.modules_errors import MissingParameter, InvalidParameter
+
+
+class CreateAuctionUploadUseCase:
+    MAX_IMAGES = 10
+
+    def __init__(self, user_interface: UserInterface, auction_interface: AuctionInterface):
+        self.__authorizer = Authorizer(user_interface)
+        self.__auction_interface = auction_interface
+        self.__image_manipulation = ImageManipulation()
+
+    def __call__(self, auth: Dict, body: Dict) -> Dict:
+        """
+        Reserve the id of the auction being created and return one presigned upload per image.
+        The client then sends auction_id and the image_ids to create_auction instead of base64 images.
+        """
+        self.__authorizer(auth, type_accounts=STAFF_ACCOUNTS, status_accounts=ACTIVE_STATUS)
+
+        if not body:
+            raise MissingParameter('body')
+
+        images = body.get('images')
+        if not images:
+            raise MissingParameter('Imagens')
+
+        if not isinstance(images, list):
+            raise InvalidParameter('Imagens', 'deve ser uma lista')
+
+        if len(images) > self.MAX_IMAGES:
+            raise InvalidParameter('Imagens', f'não podem ser mais que {self.MAX_IMAGES}')
+
+        content_types = ImageManipulation.UPLOAD_CONTENT_TYPES
+        for image in images:
+            if not isinstance(image, dict) or image.get('content_type') not in content_types:
+                raise InvalidParameter('Tipo da imagem', f'deve ser {", ".join(content_types)}')
+
+        auction_id = str(self.__auction_interface.get_next_auction_id())
+        uploads = [self.__image_manipulation.create_upload_form(auction_id=auction_id, image_id=uuid4().hex,
+                                                                content_type=image.get('content_type'))
+                   for image in images]
+
+        return {
+            'auction_id': auction_id,
+            'images': uploads,
+        }
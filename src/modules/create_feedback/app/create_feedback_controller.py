@@ -3,7 +3,8 @@ from typing import Dict
 from .create_feedback_usecase import CreateFeedbackUseCase
 
 from src.shared.https_codes.https_code import Created, BadRequest, InternalServerError, ParameterError, Unauthorized
-from src.shared.errors.modules_errors import InvalidRequest, MissingParameter, InvalidParameter, UserNotAuthenticated
+from src.shared.errors.modules_errors import DataAlreadyUsed, InvalidRequest, MissingParameter, InvalidParameter, \
+    UserNotAuthenticated
 
 
 class CreateFeedbackController:
@@ -31,6 +32,9 @@ class CreateFeedbackController:
         except MissingParameter as e:
             return BadRequest(message=e.message)
 
+        except DataAlreadyUsed as e:
+            return ParameterError(message=e.message)
+
         except UserNotAuthenticated as e:
             return Unauthorized(message=e.message)
 
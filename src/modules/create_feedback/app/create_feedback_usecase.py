@@ -1,16 +1,16 @@
 from typing import Dict
 
 from src.shared.structure.entities.feedback import Feedback
-from src.shared.helper_functions.token_authy import TokenAuthy
+from src.shared.helper_functions.authorizer import Authorizer
 from src.shared.helper_functions.events_trigger import EventsTrigger
 from src.shared.structure.interface.user_interface import UserInterface
 from src.shared.helper_functions.time_manipulation import TimeManipulation
-from src.shared.errors.modules_errors import MissingParameter, UserNotAuthenticated
+from src.shared.errors.modules_errors import MissingParameter
 
 
 class CreateFeedbackUseCase:
     def __init__(self, user_interface: UserInterface):
-        self.__token = TokenAuthy()
+        self.__authorizer = Authorizer(user_interface)
         self.__trigger = EventsTrigger()
         self.__user_interface = user_interface
 
@@ -18,13 +18,7 @@ class CreateFeedbackUseCase:
 
         user = None
         if auth.get("Authorization"):
-            decoded_token = self.__token.decode_token(auth["Authorization"])
-            if not decoded_token:
-                raise UserNotAuthenticated("Token de acesso inválido ou expirado.")
-            user_id = decoded_token.get('user_id')
-            user = self.__user_interface.get_user_by_id(user_id=user_id)
-            if not user:
-                raise UserNotAuthenticated()
+            user = self.__authorizer(auth).user
             
         if not body.get("email") and not auth.get("Authorization"):
             raise MissingParameter("Email")
@@ -35,7 +29,7 @@ class CreateFeedbackUseCase:
         if not body.get("grade"):
             raise MissingParameter("Nota")
         
-        feedback_id = self.__user_interface.get_last_feedback_id()+1
+        feedback_id = self.__user_interface.get_next_feedback_id()
         email = body.get('email') if body.get('email') else user.get('email')
         created_at = TimeManipulation.get_current_time()
 
@@ -3,7 +3,7 @@ import uuid
 from typing import Dict
 from bcrypt import hashpw, gensalt
 
-from src.shared.errors.modules_errors import *
+from src.shared.errors.modules_errors import DataAlreadyUsed, InvalidParameter, MissingParameter
 from src.shared.structure.entities.user import User
 from src.shared.helper_functions.token_authy import TokenAuthy
 from src.shared.structure.interface.user_interface import UserInterface
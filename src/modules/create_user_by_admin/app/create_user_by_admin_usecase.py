@@ -6,22 +6,22 @@ from bcrypt import hashpw, gensalt
 
 
 from src.shared.structure.entities.user import UserModerator
-from src.shared.helper_functions.token_authy import TokenAuthy
+from src.shared.helper_functions.authorizer import Authorizer, ADMIN_ACCOUNTS
 from src.shared.structure.interface.user_interface import UserInterface
 from src.shared.helper_functions.time_manipulation import TimeManipulation
 from src.shared.structure.enums.user_enum import STATUS_USER_ACCOUNT_ENUM, TYPE_ACCOUNT_USER_ENUM
-from src.shared.errors.modules_errors import DataAlreadyUsed, MissingParameter, UserNotAuthenticated
+from src.shared.errors.modules_errors import DataAlreadyUsed, MissingParameter
 
 
 class CreateUserUseCase:
     def __init__(self, user_interface: UserInterface):
         self.__user_interface = user_interface
-        self.__token = TokenAuthy()
+        self.__authorizer = Authorizer(user_interface)
 
     def __call__(self, auth: Dict, body: Dict) -> Dict:
 
-        if not auth.get('Authorization'):
-            raise UserNotAuthenticated('Token de acesso não encontrado.')
+        self.__authorizer(auth, type_accounts=ADMIN_ACCOUNTS,
+                          type_account_message='Você não tem permissão para criar um novo usuário.')
 
         if not body.get('cpf'):
             raise MissingParameter('CPF')
@@ -31,17 +31,6 @@ class CreateUserUseCase:
             if user.get('type_account') == TYPE_ACCOUNT_USER_ENUM.MODERATOR.value:
                 raise DataAlreadyUsed('CPF')
 
-        decoded_token = self.__token.decode_token(auth.get('Authorization'))
-        if not decoded_token:
-            raise UserNotAuthenticated("Token de acesso inválido ou expirado.")
-        user_id = decoded_token.get('user_id')
-        user = self.__user_interface.get_user_by_id(user_id=user_id)
-        if not user:
-            raise UserNotAuthenticated()
-
-        if user.get('type_account') != TYPE_ACCOUNT_USER_ENUM.ADMIN.value:
-            raise UserNotAuthenticated(message='Você não tem permissão para criar um novo usuário.')
-
         user_id = str(uuid.uuid4())
         while self.__user_interface.get_user_by_id(user_id):
             user_id = str(uuid.uuid4())
@@ -1,44 +1,30 @@
 from typing import Dict
 from datetime import datetime
 
-from src.shared.errors.modules_errors import *
+from src.shared.errors.modules_errors import DataNotFound, InvalidParameter, MissingParameter
 from src.shared.helper_functions.email_function import Email
-from src.shared.helper_functions.token_authy import TokenAuthy
+from src.shared.helper_functions.authorizer import Authorizer, STAFF_ACCOUNTS, ACTIVE_STATUS
 from src.shared.helper_functions.events_trigger import EventsTrigger
 from src.shared.structure.interface.user_interface import UserInterface
 from src.shared.structure.enums.suspension_enum import STATUS_SUSPENSION_ENUM
-from src.shared.structure.enums.user_enum import TYPE_ACCOUNT_USER_ENUM, STATUS_USER_ACCOUNT_ENUM
+from src.shared.structure.enums.user_enum import STATUS_USER_ACCOUNT_ENUM
 
 
 class DeleteSuspensionUseCase:
 
     def __init__(self, user_interface: UserInterface):
         self.__email = Email()
-        self.__token = TokenAuthy()
+        self.__authorizer = Authorizer(user_interface)
         self.__trigger = EventsTrigger()
         self.__user_interface = user_interface
 
     def __call__(self, auth: Dict, body: Dict) -> Dict:
 
-        if not auth.get('Authorization'):
-            raise UserNotAuthenticated('Token de acesso não encontrado.')
+        self.__authorizer(auth, type_accounts=STAFF_ACCOUNTS, status_accounts=ACTIVE_STATUS)
+
         if not body:
             raise MissingParameter('body')
         
-        decoded_token = self.__token.decode_token(auth.get('Authorization'))
-        if not decoded_token:
-            raise UserNotAuthenticated("Token de acesso inválido ou expirado.")
-        user_id = decoded_token.get('user_id')
-        user = self.__user_interface.get_user_by_id(user_id=user_id)
-        if not user:
-            raise UserNotAuthenticated()
-        
-        AUTHORIZED_TYPE_ACCOUNT = [TYPE_ACCOUNT_USER_ENUM.ADMIN, TYPE_ACCOUNT_USER_ENUM.MODERATOR]
-        if TYPE_ACCOUNT_USER_ENUM(user.get('type_account')) not in AUTHORIZED_TYPE_ACCOUNT:
-            raise UserNotAuthenticated()
-        if STATUS_USER_ACCOUNT_ENUM(user.get('status_account')) != STATUS_USER_ACCOUNT_ENUM.ACTIVE:
-            raise UserNotAuthenticated()
-        
         suspension_id = body.get("suspension_id")
         if not suspension_id:
             raise MissingParameter('suspension_id')
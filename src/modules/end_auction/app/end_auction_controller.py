@@ -1,7 +1,10 @@
+from typing import Dict
 from .end_auction_usecase import EndAuctionUseCase
 
-from src.shared.errors.modules_errors import *
-from src.shared.https_codes.https_code import *
+from src.shared.errors.modules_errors import DataNotFound, InvalidParameter, InvalidRequest, MissingParameter, \
+    UserNotAuthenticated
+from src.shared.https_codes.https_code import BadRequest, InternalServerError, NotFound, OK, ParameterError, \
+    Unauthorized
 
 
 class EndAuctionController:
@@ -1,11 +1,12 @@
 from typing import Dict
 
-from src.shared.errors.modules_errors import *
+from src.shared.errors.modules_errors import DataNotFound, MissingParameter
 from src.shared.structure.entities.auction import Auction
 from src.shared.structure.entities.payment import Payment
-from src.shared.helper_functions.email_function import Email
 from src.shared.helper_functions.mercadopago_api import MercadoPago
+from src.shared.helper_functions.email_templates import templates
 from src.shared.helper_functions.events_trigger import EventsTrigger
+from src.shared.helper_functions.notification_outbox import Notification, get_notification_outbox
 from src.shared.structure.interface.user_interface import UserInterface
 from src.shared.helper_functions.time_manipulation import TimeManipulation
 from src.shared.structure.interface.auction_interface import AuctionInterface
@@ -15,7 +16,7 @@ from src.shared.structure.enums.auction_enum import STATUS_AUCTION_ENUM, PAYMENT
 class EndAuctionUseCase:
 
     def __init__(self, auction_interface: AuctionInterface, user_interface: UserInterface):
-        self.__email = Email()
+        self.__outbox = get_notification_outbox()
         self.__payment = MercadoPago()
         self.__trigger = EventsTrigger()
         self.__user_interface = user_interface
@@ -61,24 +62,20 @@ class EndAuctionUseCase:
 
             winner = bids_sorted[0]
             winner_email = winner.get('email')
-            to_emails = list(set([item.get('email') for item in bids_sorted][1:]))
+            to_emails = list(set([item.get('email') for item in bids_sorted]) - {winner_email})
 
-            email_body = f"""
-            <h1>Leilão<span style="font-weight: bold;">{auction.title} LOTE[{auction.auction_id}]</span> Finalizado!</h1>
-            <p>Parabéns você ganhou o leilão!</p>
-            <p>Para mais informações acesse o site.</p>
-            """
-            self.__email.set_email_template(f"Leilão {auction.title} Finalizado", email_body)
-            self.__email.send_email(to=winner_email, subject='Você Ganhou o Leilão')
+            email_body = templates.render('auction_winner', title=auction.title, auction_id=auction.auction_id)
+            self.__outbox.publish(Notification(to=winner_email, subject='Você Ganhou o Leilão',
+                                               title=f"Leilão {auction.title} Finalizado", content=email_body))
 
             if len(to_emails) > 0:
-                email_body = f"""
-                            <h1>Leilão<span style="font-weight: bold;">LOTE[{auction.auction_id}]</span> Finalizado!</h1>
-                            <p>Infelizmente você não ganhou o leilão.</p>
-                            <p>Para mais informações acesse o site.</p>
-                            """
-                self.__email.set_email_template(f"Leilão {auction.title} Finalizado", email_body)
-                self.__email.send_email(to=to_emails, subject='Leilão encerrado')
+                email_body = templates.render('auction_loser', auction_id=auction.auction_id)
+                self.__outbox.publish(Notification(to=to_emails, subject='Leilão encerrado',
+                                                   title=f"Leilão {auction.title} Finalizado", content=email_body,
+                                                   broadcast=True,
+                                                   cache_key=('auction_loser', auction.auction_id,
+                                                              auction.status_auction.value)))
+            self.__outbox.flush()
 
             self.__trigger.delete_rule(rule_name=f"end_auction_{auction_id}", lambda_function=f"End_Auction")
 
@@ -108,5 +105,15 @@ class EndAuctionUseCase:
             date_of_expiration = TimeManipulation(datetime_now=date_of_expiration).get_time()
             payment.payment_expires_at = date_of_expiration
             self.__auction_interface.create_payment(payment=payment)
+            self.__user_interface.put_auction_history(user_id=payment.user_id, auctions=[{
+                **auction.to_dict(),
+                'payment_id': payment.payment_id,
+                'amount': payment.amount,
+                'status_payment': payment.status_payment.value,
+                'service': payment.payment_service.value,
+                'date_payment': payment.date_payment,
+                'payment_expires_at': payment.payment_expires_at,
+                'created_at': payment.created_at,
+            }])
 
         return None
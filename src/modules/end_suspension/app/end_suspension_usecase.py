@@ -1,7 +1,7 @@
 from typing import Dict
 from datetime import datetime
 
-from src.shared.errors.modules_errors import *
+from src.shared.errors.modules_errors import DataNotFound, InvalidParameter, MissingParameter
 from src.shared.helper_functions.email_function import Email
 from src.shared.helper_functions.events_trigger import EventsTrigger
 from src.shared.structure.interface.user_interface import UserInterface
@@ -35,7 +35,8 @@ class EndSuspensionUseCase:
         user_id = suspension.get('user_id')
         user = self.__user_interface.get_user_by_id(user_id=user_id)
 
-        self.__user_interface.update_suspension_status(user_id=suspension.get("user_id"), status=STATUS_SUSPENSION_ENUM.ENDED.value)
+        self.__user_interface.update_suspension_status(user_id=suspension.get("user_id"), suspension_id=suspension_id,
+                                                       status=STATUS_SUSPENSION_ENUM.ENDED)
 
         self.__user_interface.update_user_status(user_id=suspension.get('user_id'), status=STATUS_USER_ACCOUNT_ENUM.ACTIVE.value)
 
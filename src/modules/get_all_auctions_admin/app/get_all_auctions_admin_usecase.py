@@ -1,39 +1,30 @@
 from typing import Dict, List
 
-from src.shared.helper_functions.token_authy import TokenAuthy
-from src.shared.errors.modules_errors import UserNotAuthenticated
+from src.shared.helper_functions.authorizer import Authorizer, STAFF_ACCOUNTS, ACTIVE_STATUS
+from src.shared.database.pagination import validate_page_size
 from src.shared.structure.interface.user_interface import UserInterface
 from src.shared.structure.interface.auction_interface import AuctionInterface
-from src.shared.structure.enums.user_enum import TYPE_ACCOUNT_USER_ENUM, STATUS_USER_ACCOUNT_ENUM
 
 
 class GetAllAuctionsAdminUseCase:
     def __init__(self, auction_interface: AuctionInterface, user_interface: UserInterface):
-        self.__token = TokenAuthy()
+        self.__authorizer = Authorizer(user_interface)
         self.__user_interface = user_interface
         self.__auction_interface = auction_interface
 
     def __call__(self, auth: Dict, body: Dict) -> Dict[str, List[Dict]]:
-        if not auth.get('Authorization'):
-            raise UserNotAuthenticated('Token de acesso não encontrado.')
-        decoded_token = self.__token.decode_token(auth.get('Authorization'))
-        if not decoded_token:
-            raise UserNotAuthenticated("Token de acesso inválido ou expirado.")
-        user_id = decoded_token.get('user_id')
-        user = self.__user_interface.get_user_by_id(user_id=user_id)
-        if not user:
-            raise UserNotAuthenticated()
-        if TYPE_ACCOUNT_USER_ENUM(user.get('type_account')) not in [TYPE_ACCOUNT_USER_ENUM.ADMIN, TYPE_ACCOUNT_USER_ENUM.MODERATOR]:
-            raise UserNotAuthenticated()
-        if STATUS_USER_ACCOUNT_ENUM(user.get('status_account')) != STATUS_USER_ACCOUNT_ENUM.ACTIVE:
-            raise UserNotAuthenticated()
+        self.__authorizer(auth, type_accounts=STAFF_ACCOUNTS, status_accounts=ACTIVE_STATUS, trust_claims=True)
 
         if not body.get('auctions_closed'):
             body['auctions_closed'] = False
 
         auctions_closed = False if body.get('auctions_closed') == 'false' else True
 
-        auctions = self.__auction_interface.get_all_auctions_admin(auctions_closed=auctions_closed)
+        limit = validate_page_size(body.get('limit'))
+
+        page = self.__auction_interface.get_all_auctions_admin(auctions_closed=auctions_closed, limit=limit,
+                                                               cursor=body.get('cursor'))
+        auctions = page.get('auctions')
         if auctions_closed:
             for auction in auctions:
                 if auction.get('payment'):
@@ -41,5 +32,6 @@ class GetAllAuctionsAdminUseCase:
                     auction['user'] = user
 
         return {
-            "auctions": auctions
+            "auctions": auctions,
+            "next_cursor": page.get('next_cursor'),
         }
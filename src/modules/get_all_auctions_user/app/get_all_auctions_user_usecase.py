@@ -1,45 +1,33 @@
-from typing import Dict, Optional, List
+from typing import Dict, List
 
-from src.shared.helper_functions.token_authy import TokenAuthy
-from src.shared.errors.modules_errors import UserNotAuthenticated
+from src.shared.database.pagination import validate_page_size
+from src.shared.helper_functions.authorizer import Authorizer, USER_ACCOUNTS, RESTRICTED_STATUS
 from src.shared.structure.interface.user_interface import UserInterface
 from src.shared.structure.interface.auction_interface import AuctionInterface
-from src.shared.structure.enums.user_enum import TYPE_ACCOUNT_USER_ENUM, STATUS_USER_ACCOUNT_ENUM
 
 
 class GetAllAuctionsUserUseCase:
     def __init__(self, auction_interface: AuctionInterface, user_interface: UserInterface):
-        self.__token = TokenAuthy()
+        self.__authorizer = Authorizer(user_interface)
         self.__user_interface = user_interface
         self.__auction_interface = auction_interface
 
     def __call__(self, auth: Dict, body: Dict) -> Dict[str, List[Dict]]:
-        if not auth.get('Authorization'):
-            raise UserNotAuthenticated('Token de acesso não encontrado.')
-        decoded_token = self.__token.decode_token(auth.get('Authorization'))
-        if not decoded_token:
-            raise UserNotAuthenticated("Token de acesso inválido ou expirado.")
-        user_id = decoded_token.get('user_id')
-        user = self.__user_interface.get_user_by_id(user_id=user_id)
-        if not user:
-            raise UserNotAuthenticated()
-        if TYPE_ACCOUNT_USER_ENUM(user.get('type_account')) != TYPE_ACCOUNT_USER_ENUM.USER:
-            raise UserNotAuthenticated()
-        permitted_status = [STATUS_USER_ACCOUNT_ENUM.ACTIVE, STATUS_USER_ACCOUNT_ENUM.SUSPENDED, STATUS_USER_ACCOUNT_ENUM.BANED]
-        if STATUS_USER_ACCOUNT_ENUM(user.get('status_account')) not in permitted_status:
-            raise UserNotAuthenticated()
+        user_id = self.__authorizer(auth, type_accounts=USER_ACCOUNTS, status_accounts=RESTRICTED_STATUS).user_id
 
-        if not body:
-            auctions = self.__auction_interface.get_all_auctions_user(user_id=user_id)
-        else:
-            auctions = self.__auction_interface.get_all_auctions_user(user_id=user_id, status_auction=body.get('status_auction'))
+        body = body or {}
+        limit = validate_page_size(body.get('limit'))
 
-        if not auctions:
-            return {
-                "auctions": []
-            }
+        page = self.__user_interface.get_auction_history(user_id=user_id, limit=limit, cursor=body.get('cursor'),
+                                                         status_auction=body.get('status_auction'))
+        if not page.get('backfilled'):
+            # Payments created before the history existed are copied to it the first time it is read
+            auctions = self.__auction_interface.get_all_auctions_user(user_id=user_id)
+            self.__user_interface.put_auction_history(user_id=user_id, auctions=auctions, backfilled=True)
+            page = self.__user_interface.get_auction_history(user_id=user_id, limit=limit,
+                                                             status_auction=body.get('status_auction'))
 
-        auctions = sorted(auctions, key=lambda auction: auction.get('start_date'), reverse=True)
         return {
-            "auctions": auctions
+            "auctions": page.get('auctions'),
+            "next_cursor": page.get('next_cursor'),
         }
@@ -9,7 +9,7 @@ controller = GetAllFeedbacksController(usecase)
 
 
 def lambda_handler(event, context):
-    request = HttpRequest(auth=event["headers"])
+    request = HttpRequest(auth=event["headers"], body=event["queryStringParameters"])
     response = controller(request=request())
     http_response = HttpResponse(status_code=response.status_code, body=response.body)
 
@@ -1,37 +1,40 @@
-from typing import Dict
+from typing import Dict, Optional
 
-from src.shared.helper_functions.token_authy import TokenAuthy
-from src.shared.errors.modules_errors import UserNotAuthenticated
+from src.shared.errors.modules_errors import InvalidParameter
+from src.shared.database.pagination import validate_page_size
+from src.shared.helper_functions.authorizer import Authorizer, STAFF_ACCOUNTS, ACTIVE_STATUS
 from src.shared.structure.interface.user_interface import UserInterface
-from src.shared.structure.enums.user_enum import TYPE_ACCOUNT_USER_ENUM, STATUS_USER_ACCOUNT_ENUM
 
 
 class GetAllFeedbacksUseCase:
     def __init__(self, user_interface: UserInterface):
-        self.__token = TokenAuthy()
+        self.__authorizer = Authorizer(user_interface)
         self.__user_interface = user_interface
 
-    def __call__(self, auth: Dict):
-        if not auth.get('Authorization'):
-            raise UserNotAuthenticated('Token de acesso não encontrado.')
-        decoded_token = self.__token.decode_token(auth.get('Authorization'))
-        if not decoded_token:
-            raise UserNotAuthenticated("Token de acesso inválido ou expirado.")
-        user_id = decoded_token.get('user_id')
-        user = self.__user_interface.get_user_by_id(user_id=user_id)
-        if not user:
-            raise UserNotAuthenticated()
-        if TYPE_ACCOUNT_USER_ENUM(user.get('type_account')) not in [TYPE_ACCOUNT_USER_ENUM.ADMIN, TYPE_ACCOUNT_USER_ENUM.MODERATOR]:
-            raise UserNotAuthenticated()
-        if STATUS_USER_ACCOUNT_ENUM(user.get('status_account')) != STATUS_USER_ACCOUNT_ENUM.ACTIVE:
-            raise UserNotAuthenticated()
-
-        feedbacks = self.__user_interface.get_all_feedbacks()
+    def __call__(self, auth: Dict, body: Optional[Dict] = None):
+        self.__authorizer(auth, type_accounts=STAFF_ACCOUNTS, status_accounts=ACTIVE_STATUS)
+
+        body = body or {}
+        limit = validate_page_size(body.get('limit'))
+
+        grade = body.get('grade')
+        if grade is not None and grade != '':
+            if not str(grade).isdigit() or not 1 <= int(grade) <= 5:
+                raise InvalidParameter('Nota', 'deve ser entre 1 e 5 estrelas.')
+            grade = int(grade)
+        else:
+            grade = None
+
+        page = self.__user_interface.get_all_feedbacks(limit=limit, cursor=body.get('cursor'), grade=grade)
+        summary = self.__user_interface.get_feedback_summary()
+        total_feedbacks = summary.get('total_count')
 
         response = {
-            "feedbacks": feedbacks,
-            "total_feedbacks": len(feedbacks) if feedbacks else "Sem avaliações",
-            "mean_feedback": sum([feedback.get('grade') for feedback in feedbacks]) / len(feedbacks) if feedbacks else "Sem avaliações",
+            "feedbacks": page.get('feedbacks'),
+            "next_cursor": page.get('next_cursor'),
+            "total_feedbacks": total_feedbacks if total_feedbacks else "Sem avaliações",
+            "mean_feedback": summary.get('total_sum') / total_feedbacks if total_feedbacks else "Sem avaliações",
+            "grades": summary.get('grades'),
         }
 
         return response
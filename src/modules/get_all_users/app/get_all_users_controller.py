@@ -1,7 +1,10 @@
+from typing import Dict
 from .get_all_users_usecase import GetAllUsersUseCase
 
-from src.shared.errors.modules_errors import *
-from src.shared.https_codes.https_code import *
+from src.shared.errors.modules_errors import DataNotFound, InvalidParameter, InvalidRequest, MissingParameter, \
+    UserNotAuthenticated
+from src.shared.https_codes.https_code import BadRequest, InternalServerError, NotFound, OK, ParameterError, \
+    Unauthorized
 
 
 class GetAllUsersController:
@@ -16,7 +19,7 @@ class GetAllUsersController:
             if not request.get('auth'):
                 raise MissingParameter('auth')
 
-            usecase = self.__usecase(auth=request.get('auth'))
+            usecase = self.__usecase(auth=request.get('auth'), body=request.get('body'))
 
             return OK(body=usecase, message="Usuários encontrados com sucesso.")
 
@@ -1,37 +1,32 @@
-from typing import Dict
+from typing import Dict, Optional
 
-from src.shared.helper_functions.token_authy import TokenAuthy
-from src.shared.errors.modules_errors import UserNotAuthenticated
+from src.shared.errors.modules_errors import InvalidParameter
+from src.shared.database.pagination import validate_page_size
+from src.shared.helper_functions.authorizer import Authorizer, STAFF_ACCOUNTS, ACTIVE_STATUS
 from src.shared.structure.interface.user_interface import UserInterface
-from src.shared.structure.enums.user_enum import TYPE_ACCOUNT_USER_ENUM, STATUS_USER_ACCOUNT_ENUM
+from src.shared.structure.enums.user_enum import TYPE_ACCOUNT_USER_ENUM
 
 
 class GetAllUsersUseCase:
     def __init__(self, user_interface: UserInterface):
-        self.__token = TokenAuthy()
+        self.__authorizer = Authorizer(user_interface)
         self.__user_interface = user_interface
 
-    def __call__(self, auth: Dict):
-        if not auth.get('Authorization'):
-            raise UserNotAuthenticated('Token de acesso não encontrado.')
-        decoded_token = self.__token.decode_token(auth.get('Authorization'))
-        if not decoded_token:
-            raise UserNotAuthenticated("Token de acesso inválido ou expirado.")
-        user_id = decoded_token.get('user_id')
-        user = self.__user_interface.get_user_by_id(user_id=user_id)
-        if not user:
-            raise UserNotAuthenticated()
-        if TYPE_ACCOUNT_USER_ENUM(user.get('type_account')) not in [TYPE_ACCOUNT_USER_ENUM.ADMIN, TYPE_ACCOUNT_USER_ENUM.MODERATOR]:
-            raise UserNotAuthenticated()
-        if STATUS_USER_ACCOUNT_ENUM(user.get('status_account')) != STATUS_USER_ACCOUNT_ENUM.ACTIVE:
-            raise UserNotAuthenticated()
-
-        users = self.__user_interface.get_all_users()
-
-        for user in users:
-            if isinstance(user.get('created_at'), int) is False:
-                user['created_at'] = int(user.get('created_at'))
+    def __call__(self, auth: Dict, body: Optional[Dict] = None):
+        self.__authorizer(auth, type_accounts=STAFF_ACCOUNTS, status_accounts=ACTIVE_STATUS)
+
+        body = body or {}
+        limit = validate_page_size(body.get('limit'))
+
+        type_account = body.get('type_account')
+        if type_account:
+            if type_account not in TYPE_ACCOUNT_USER_ENUM.__members__:
+                raise InvalidParameter('type_account', 'inválido')
+            type_account = TYPE_ACCOUNT_USER_ENUM(type_account)
+
+        page = self.__user_interface.get_all_users(limit=limit, cursor=body.get('cursor'), type_account=type_account)
 
         return {
-            "users": users
+            "users": page.get('users'),
+            "next_cursor": page.get('next_cursor'),
         }
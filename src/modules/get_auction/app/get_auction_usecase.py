@@ -1,10 +1,9 @@
 from typing import Dict
 
-from src.shared.errors.modules_errors import *
+from src.shared.errors.modules_errors import DataNotFound, MissingParameter
 from src.shared.structure.entities.auction import Auction
-from src.shared.helper_functions.token_authy import TokenAuthy
+from src.shared.helper_functions.authorizer import Authorizer, ACTIVE_STATUS
 from src.shared.structure.interface.user_interface import UserInterface
-from src.shared.structure.enums.user_enum import STATUS_USER_ACCOUNT_ENUM
 from src.shared.structure.interface.auction_interface import AuctionInterface
 
 
@@ -12,23 +11,11 @@ class GetAuctionUseCase:
     def __init__(self, user_interface: UserInterface, auction_interface: AuctionInterface):
         self.__user_interface = user_interface
         self.__auction_interface = auction_interface
-        self.__token = TokenAuthy()
+        self.__authorizer = Authorizer(user_interface)
 
     def __call__(self, auth: Dict, body: Dict) -> Dict:
-        if not auth.get('Authorization'):
-            raise UserNotAuthenticated('Token de acesso não encontrado.')
-
-        decoded_token = self.__token.decode_token(auth["Authorization"])
-        if not decoded_token:
-            raise UserNotAuthenticated("Token de acesso inválido ou expirado.")
-        user_id = decoded_token.get('user_id')
-        user = self.__user_interface.get_user_by_id(user_id=user_id)
-        if not user:
-            raise UserNotAuthenticated()
-
-        status_account_permitted = [STATUS_USER_ACCOUNT_ENUM.ACTIVE]
-        if STATUS_USER_ACCOUNT_ENUM(user.get('status_account')) not in status_account_permitted:
-            raise UserNotAuthenticated(message='Sua conta está suspensa.')
+        self.__authorizer(auth, status_accounts=ACTIVE_STATUS, status_account_message='Sua conta está suspensa.',
+                          trust_claims=True)
 
         if not body.get('auction_id'):
             raise MissingParameter('auction_id')
@@ -51,9 +38,6 @@ class GetAuctionUseCase:
             created_at=int(auction.get('created_at'))
         ).to_dict()
 
-        bids = self.__auction_interface.get_all_bids_by_auction_id(auction_id=auction['auction_id'])
-        auction['bids'] = bids if bids else []
-        if len(auction['bids']) > 5:
-            auction['bids'] = auction['bids'][:5]
+        auction['bids'] = self.__auction_interface.get_top_bids_by_auction_id(auction_id=auction['auction_id'], limit=5)
 
         return auction
@@ -1,8 +1,7 @@
 from typing import Dict
 
-from src.shared.errors.modules_errors import *
-from src.shared.structure.enums.user_enum import *
-from src.shared.helper_functions.token_authy import TokenAuthy
+from src.shared.errors.modules_errors import DataNotFound, MissingParameter, UserNotAuthenticated
+from src.shared.helper_functions.authorizer import Authorizer, STAFF_ACCOUNTS, RESTRICTED_STATUS
 from src.shared.helper_functions.mercadopago_api import MercadoPago
 from src.shared.helper_functions.events_trigger import EventsTrigger
 from src.shared.structure.interface.user_interface import UserInterface
@@ -12,7 +11,7 @@ from src.shared.structure.interface.auction_interface import AuctionInterface
 class GetPaymentUseCase:
 
     def __init__(self, auction_interface: AuctionInterface, user_interface: UserInterface):
-        self.__token = TokenAuthy()
+        self.__authorizer = Authorizer(user_interface)
         self.__payment = MercadoPago()
         self.__trigger = EventsTrigger()
         self.__user_interface = user_interface
@@ -20,8 +19,9 @@ class GetPaymentUseCase:
 
     def __call__(self, auth: Dict, body: Dict) -> Dict:
 
-        if not auth.get('Authorization'):
-            raise UserNotAuthenticated("token de acesso não encontrado.")
+        principal = self.__authorizer(auth, status_accounts=RESTRICTED_STATUS,
+                                      missing_token_message="token de acesso não encontrado.",
+                                      status_account_message="Usuário não tem permissão para acessar este recurso.")
 
         if not body:
             MissingParameter('body')
@@ -29,19 +29,6 @@ class GetPaymentUseCase:
         if not body.get("auction_id"):
             raise MissingParameter("auction_id")
 
-        decoded_token = self.__token.decode_token(auth["Authorization"])
-        if not decoded_token:
-            raise UserNotAuthenticated("Token de acesso inválido ou expirado.")
-        user_id = decoded_token.get('user_id')
-        user = self.__user_interface.get_user_by_id(user_id=user_id)
-        if not user:
-            raise UserNotAuthenticated()
-
-        status_account_permitted = [STATUS_USER_ACCOUNT_ENUM.ACTIVE, STATUS_USER_ACCOUNT_ENUM.SUSPENDED,
-                                    STATUS_USER_ACCOUNT_ENUM.BANED]
-        if STATUS_USER_ACCOUNT_ENUM(user.get("status_account")) not in status_account_permitted:
-            raise UserNotAuthenticated("Usuário não tem permissão para acessar este recurso.")
-
         payment = self.__auction_interface.get_payment_by_auction(auction_id=body.get('auction_id'))
         if not payment:
             raise DataNotFound('Pagamento')
@@ -49,9 +36,8 @@ class GetPaymentUseCase:
         if not payment_mercadopago:
             raise DataNotFound('Pagamento')
 
-        accounts_permitted = [TYPE_ACCOUNT_USER_ENUM.ADMIN, TYPE_ACCOUNT_USER_ENUM.MODERATOR]
-        if TYPE_ACCOUNT_USER_ENUM(user.get("type_account")) not in accounts_permitted:
-            if payment.get("user_id") != user_id:
+        if principal.type_account not in STAFF_ACCOUNTS:
+            if payment.get("user_id") != principal.user_id:
                 raise UserNotAuthenticated("Pagamento não pertence ao usuário.")
         else:
             raise UserNotAuthenticated("Você não tem permissão para acessar este recurso.")
@@ -1,7 +1,7 @@
 from typing import Dict
 from bcrypt import checkpw
 
-from src.shared.errors.modules_errors import *
+from src.shared.errors.modules_errors import InvalidParameter, MissingParameter, UserNotAuthenticated
 from src.shared.helper_functions.token_authy import TokenAuthy
 from src.shared.structure.interface.user_interface import UserInterface
 
@@ -34,6 +34,6 @@ class GetTokenUseCase:
         if not checkpw(body['password'].encode('utf-8'), user['password'].encode('utf-8')):
             raise UserNotAuthenticated()
 
-        token = self.__token.generate_token(user_id=user['user_id'], keep_login=body.get('keep_login'))
+        token = self.__token.generate_token(user_id=user['user_id'], keep_login=body.get('keep_login'), user=user)
 
         return {"token": token}
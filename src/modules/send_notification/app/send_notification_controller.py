@@ -0,0 +1,18 @@
+from typing import Dict
+
+from .send_notification_usecase import SendNotificationUseCase
+
+from src.shared.errors.modules_errors import InvalidRequest
+
+
+class SendNotificationController:
+    def __init__(self, usecase: SendNotificationUseCase):
+        self.__usecase = usecase
+
+    def __call__(self, event: Dict) -> Dict:
+        if not event:
+            raise InvalidRequest()
+
+        failed = self.__usecase(records=event.get('Records'))
+
+        return {'batchItemFailures': [{'itemIdentifier': message_id} for message_id in failed]}
@@ -0,0 +1,11 @@
+from .send_notification_usecase import SendNotificationUseCase
+from .send_notification_controller import SendNotificationController
+
+from src.shared.helper_functions.notification_outbox import NotificationSender
+
+usecase = SendNotificationUseCase(NotificationSender())
+controller = SendNotificationController(usecase)
+
+
+def lambda_handler(event, context):
+    return controller(event=event)
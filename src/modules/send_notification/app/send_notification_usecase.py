@@ -0,0 +1,41 @@
+import json
+from typing import Dict, List, Optional
+
+from src.shared.errors.modules_errors import MissingParameter
+from src.shared.helper_functions.notification_outbox import Notification, NotificationSender
+from src.shared.helper_functions.notification_outbox import NotificationOutbox, get_notification_outbox
+
+
+class SendNotificationUseCase:
+
+    def __init__(self, sender: NotificationSender, outbox: Optional[NotificationOutbox] = None):
+        self.__sender = sender
+        self.__outbox = outbox
+
+    def __call__(self, records: List[Dict]) -> List[str]:
+        """
+        Send every notification of an SQS batch, returning the message ids that failed
+        so that only those are delivered again.
+        When only some recipients of a broadcast failed, a notification to just those recipients
+        is queued again instead, so the others do not get the email twice.
+        """
+        if records is None:
+            raise MissingParameter('Records')
+
+        if self.__outbox is None:
+            self.__outbox = get_notification_outbox()
+
+        failed = []
+        for record in records:
+            try:
+                notification = Notification.from_dict(json.loads(record['body']))
+                result = self.__sender(notification)
+                if result.get('failed') and result.get('delivered'):
+                    notification.to = result['failed']
+                    self.__outbox.publish(notification)
+                    self.__outbox.flush()
+                elif result.get('failed'):
+                    failed.append(record['messageId'])
+            except Exception:
+                failed.append(record['messageId'])
+        return failed
@@ -1,47 +1,27 @@
-import os
 import random
-import smtplib
 import string
 import datetime
 from typing import Dict
-from email.mime.text import MIMEText
-from email.mime.multipart import MIMEMultipart
 
 from src.shared.structure.entities.user import User
 from src.shared.helper_functions.email_function import Email
-from src.shared.helper_functions.token_authy import TokenAuthy
+from src.shared.helper_functions.authorizer import Authorizer, USER_ACCOUNTS, PENDING_STATUS
 from src.shared.structure.interface.user_interface import UserInterface
-from src.shared.structure.enums.user_enum import STATUS_USER_ACCOUNT_ENUM, TYPE_ACCOUNT_USER_ENUM
 from src.shared.helper_functions.time_manipulation import TimeManipulation
-from src.shared.errors.modules_errors import MissingParameter, UserNotAuthenticated, InvalidParameter
+from src.shared.errors.modules_errors import MissingParameter, InvalidParameter
 
 
 class SendVerificationEmailCodeUseCase:
 
     def __init__(self, user_interface: UserInterface):
         self.__user_interface = user_interface
-        self.__token = TokenAuthy()
+        self.__authorizer = Authorizer(user_interface)
         self.__email = Email()
 
     def __call__(self, auth: Dict):
-        if not auth.get('Authorization'):
-            raise UserNotAuthenticated('Token de acesso não encontrado.')
-
-        decoded_token = self.__token.decode_token(auth['Authorization'])
-        if not decoded_token:
-            raise UserNotAuthenticated("Token de acesso inválido ou expirado.")
-
-        user_id = decoded_token.get('user_id')
-        user = self.__user_interface.get_user_by_id(user_id=user_id)
-        if not user:
-            raise UserNotAuthenticated()
-
-        status_account_permitted = [STATUS_USER_ACCOUNT_ENUM.PENDING]
-        if STATUS_USER_ACCOUNT_ENUM(user.get('status_account')) not in status_account_permitted:
-            raise UserNotAuthenticated(message='Conta de usuário já validada.')
-
-        if TYPE_ACCOUNT_USER_ENUM(user.get('type_account')) != TYPE_ACCOUNT_USER_ENUM.USER:
-            raise UserNotAuthenticated(message='Você não tem permissão para validar uma conta de usuário.')
+        user = self.__authorizer(auth, type_accounts=USER_ACCOUNTS, status_accounts=PENDING_STATUS,
+                                 type_account_message='Você não tem permissão para validar uma conta de usuário.',
+                                 status_account_message='Conta de usuário já validada.').user
 
         numbers = string.digits
         code = ''.join(random.choice(numbers) for i in range(6))
@@ -1,9 +1,10 @@
 import os
 from typing import Any, Dict
 
-from src.shared.errors.modules_errors import *
-from src.shared.helper_functions.email_function import Email
+from src.shared.errors.modules_errors import DataNotFound, MissingParameter
+from src.shared.helper_functions.email_templates import templates
 from src.shared.helper_functions.events_trigger import EventsTrigger
+from src.shared.helper_functions.notification_outbox import Notification, get_notification_outbox
 from src.shared.helper_functions.time_manipulation import TimeManipulation
 from src.shared.structure.entities.auction import Auction
 from src.shared.structure.enums.auction_enum import STATUS_AUCTION_ENUM
@@ -14,7 +15,7 @@ from src.shared.structure.interface.auction_interface import AuctionInterface
 class StartAuctionUseCase:
 
     def __init__(self, auction_interface: AuctionInterface, user_interface: UserInterface):
-        self.__email = Email()
+        self.__outbox = get_notification_outbox()
         self.__domain = os.environ.get('DOMAIN')
         self.__trigger = EventsTrigger()
         self.__user_interface = user_interface
@@ -48,30 +49,34 @@ class StartAuctionUseCase:
         )
 
         emails = self.__user_interface.get_all_users_to_send_email()
+        card_image = "http://via.placeholder.com/500x500"
+        if auction.images:
+            card_image = auction.images[0].get('sizes', {}).get('card') or auction.images[0].get('image_body')
         auction_start_date = TimeManipulation(auction.start_date).plus_hour(-3)
+        email_body = templates.render(
+            'auction_card',
+            image=card_image,
+            image_alt=auction.title,
+            title=auction.title,
+            date=TimeManipulation(auction_start_date).get_datetime(datetime_format='%d-%m-%Y - %H:%M'),
+            label_color="black",
+            label=f"Lance: R${auction.current_amount}",
+            action=templates.render('auction_card_link', url=f"https://{self.__domain}"),
+        )
 
         time_now = body.get("time_now", None)
         if time_now:
             if emails:
                 minutes_before = int((auction.start_date - time_now) / 60)
-
-                email_body = f"""
-                <div class="TextsBox" style="display: flex; justify-content: center; align-items: center;">
-                    <div style="border: 1px solid black; border-radius: 10px; padding-bottom: 16px;">
-                        <img style="border-radius: 10px 10px 0 0;" width="250" src="http://via.placeholder.com/500x500" alt="">
-                        <div style="color: #949393; text-align: center; margin-bottom: 16px;">
-                            <h2 style="color:#000000;">{auction.title}</h2>
-                            <p style="color:#000000">Data: {TimeManipulation(auction_start_date).get_datetime(datetime_format='%d-%m-%Y - %H:%M')}</p>
-                            <label style="color: black; font-weight: bold; font-size: 24px;">Lance: R${auction.current_amount}</label>
-                        </div>
-                        <a style="background-color: yellow; border: none; padding: 6px 12px; font-size: 16px; font-weight: bold; border-radius: 25px; margin: 8px; color: black;" href="https://{self.__domain}"> Ir para o Leilão </a>
-                    </div>
-                </div>
-                """
-                self.__email.set_email_template(f"Leilão {auction.title} - LOTE[{auction_id}] iniciará em {minutes_before} minuto{'s' if minutes_before > 1 else ''}!",
-                                                email_body)
-                self.__email.send_email(to=emails,
-                                        subject=f"Leilão iniciará em {minutes_before} minuto{'s' if minutes_before > 1 else ''}!")
+                self.__outbox.publish(Notification(
+                    to=emails,
+                    subject=f"Leilão iniciará em {minutes_before} minuto{'s' if minutes_before > 1 else ''}!",
+                    title=f"Leilão {auction.title} - LOTE[{auction_id}] iniciará em {minutes_before} minuto{'s' if minutes_before > 1 else ''}!",
+                    content=email_body,
+                    broadcast=True,
+                    cache_key=('auction_starting', auction.auction_id, auction.status_auction.value, minutes_before),
+                ))
+                self.__outbox.flush()
 
             self.__trigger.delete_rule(rule_name=f"start_auction_{auction.auction_id}_before",
                                        lambda_function=f"start_auction")
@@ -79,23 +84,12 @@ class StartAuctionUseCase:
         else:
             self.__auction_interface.update_auction(auction)
             if emails:
-                email_body = f"""
-                <div class="TextsBox" style="display: flex; justify-content: center; align-items: center;">
-                    <div style="border: 1px solid black; border-radius: 10px; padding-bottom: 16px;">
-                        <img style="border-radius: 10px 10px 0 0;" width="250" src="http://via.placeholder.com/500x500" alt="">
-                        <div style="color: #949393; text-align: center; margin-bottom: 16px;">
-                            <h2 style="color:#000000;">{auction.title}</h2>
-                            <p style="color:#000000">Data: {TimeManipulation(auction_start_date).get_datetime(datetime_format='%d-%m-%Y - %H:%M')}</p>
-                            <label style="color: black; font-weight: bold; font-size: 24px;">Lance: R${auction.current_amount}</label>
-                        </div>
-                        <a style="background-color: yellow; border: none; padding: 6px 12px; font-size: 16px; font-weight: bold; border-radius: 25px; margin: 8px; color: black;" href="https://{self.__domain}"> Ir para o Leilão </a>
-                    </div>
-                </div>
-                """
-                self.__email.set_email_template(f"Leilão {auction.title} - LOTE[{auction_id}] começou!",
-                                                email_body)
-                self.__email.send_email(to=emails,
-                                        subject="Leilão começou!")
+                self.__outbox.publish(Notification(to=emails, subject="Leilão começou!",
+                                                   title=f"Leilão {auction.title} - LOTE[{auction_id}] começou!",
+                                                   content=email_body, broadcast=True,
+                                                   cache_key=('auction_started', auction.auction_id,
+                                                              auction.status_auction.value)))
+                self.__outbox.flush()
 
             self.__trigger.delete_rule(rule_name=f"start_auction_{auction.auction_id}",
                                        lambda_function=f"start_auction")
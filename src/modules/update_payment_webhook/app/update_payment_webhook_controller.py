@@ -1,7 +1,8 @@
+from typing import Dict
 from .update_payment_webhook_usecase import UpdatePaymentWebhookUseCase
 
-from src.shared.errors.modules_errors import *
-from src.shared.https_codes.https_code import *
+from src.shared.errors.modules_errors import InvalidParameter, InvalidRequest, MissingParameter, UserNotAuthenticated
+from src.shared.https_codes.https_code import BadRequest, InternalServerError, OK, ParameterError, Unauthorized
 
 
 class UpdatePaymentWebhookController:
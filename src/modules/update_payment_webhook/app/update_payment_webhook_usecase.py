@@ -1,12 +1,12 @@
 from uuid import uuid4
 from typing import Dict
 
-from src.shared.errors.modules_errors import *
-from src.shared.helper_functions.email_function import Email
+from src.shared.errors.modules_errors import DataNotFound, MissingParameter
 from src.shared.helper_functions.token_authy import TokenAuthy
 from src.shared.structure.entities.suspension import Suspension
 from src.shared.helper_functions.mercadopago_api import MercadoPago
 from src.shared.helper_functions.events_trigger import EventsTrigger
+from src.shared.helper_functions.notification_outbox import Notification, get_notification_outbox
 from src.shared.structure.interface.user_interface import UserInterface
 from src.shared.structure.enums.user_enum import STATUS_USER_ACCOUNT_ENUM
 from src.shared.helper_functions.time_manipulation import TimeManipulation
@@ -18,7 +18,7 @@ from src.shared.structure.enums.auction_enum import STATUS_AUCTION_PAYMENT_ENUM
 class UpdatePaymentWebhookUseCase:
 
     def __init__(self, auction_interface: AuctionInterface, user_interface: UserInterface):
-        self.__email = Email()
+        self.__outbox = get_notification_outbox()
         self.__token = TokenAuthy()
         self.__payment = MercadoPago()
         self.__trigger = EventsTrigger()
@@ -41,6 +41,10 @@ class UpdatePaymentWebhookUseCase:
         if not service_payment:
             raise DataNotFound('Pagamento')
 
+        auction = self.__auction_interface.get_auction_by_id(auction_id=payment.get('auction_id'))
+        if not auction:
+            raise DataNotFound('Leilão')
+
         if service_payment.get('status') == "approved":
             payment['status_payment'] = STATUS_AUCTION_PAYMENT_ENUM.PAID
 
@@ -56,7 +60,6 @@ class UpdatePaymentWebhookUseCase:
             else:
                 date_reactivation = None
 
-            auction = self.__auction_interface.get_auction_by_id(auction_id=payment.get('auction_id'))
             suspension = Suspension(
                 user_id=payment.get('user_id'),
                 suspension_id=uuid4().hex,
@@ -83,14 +86,22 @@ class UpdatePaymentWebhookUseCase:
                                                          status=STATUS_USER_ACCOUNT_ENUM.BANED)
 
             datetime = TimeManipulation(time_now=date_reactivation).get_datetime(datetime_format="%d/%m/%Y %H:%M:%S")
-            self.__email.set_email_template(title="Pagamento não efetuado", content=f"Pagamento do Leilão {auction.get('title')} - Lote[{auction.get('auction_id')}] não foi efetuado no prazo de 5 dias."
-                                                                                    f"O usuário {payment.get('first_name')} {payment.get('last_name')} foi suspenso até {datetime}.",
-                                            footer="Por favor, não responda este e-mail. Entre em contato com o "
-                                                   "suporte.")
-            self.__email.send_email(to=payment.get('email'), subject="Pagamento não efetuado")
+            self.__outbox.publish(Notification(
+                to=payment.get('email'),
+                subject="Pagamento não efetuado",
+                title="Pagamento não efetuado",
+                content=f"Pagamento do Leilão {auction.get('title')} - Lote[{auction.get('auction_id')}] não foi efetuado no prazo de 5 dias."
+                        f"O usuário {payment.get('first_name')} {payment.get('last_name')} foi suspenso até {datetime}.",
+                footer="Por favor, não responda este e-mail. Entre em contato com o suporte.",
+            ))
+            self.__outbox.flush()
 
         self.__auction_interface.update_status_payment(auction_id=payment.get('auction_id'),
                                                        payment_id=payment.get('payment_id'),
                                                        status_payment=payment.get('status_payment').value)
+        self.__user_interface.update_auction_history_payment(user_id=payment.get('user_id'),
+                                                             auction_id=payment.get('auction_id'),
+                                                             end_date=auction.get('end_date'),
+                                                             status_payment=payment.get('status_payment').value)
 
         return None
@@ -2,35 +2,26 @@ from typing import Dict
 from bcrypt import checkpw, hashpw, gensalt
 
 from src.shared.structure.entities.user import User
-from src.shared.helper_functions.token_authy import TokenAuthy
+from src.shared.helper_functions.authorizer import Authorizer
 from src.shared.structure.interface.user_interface import UserInterface
-from src.shared.errors.modules_errors import MissingParameter, UserNotAuthenticated, InvalidParameter
+from src.shared.errors.modules_errors import MissingParameter, InvalidParameter
 
 
 class UpdateUserUseCase:
 
     def __init__(self, user_interface: UserInterface):
         self.__user_interface = user_interface
-        self.__token = TokenAuthy()
+        self.__authorizer = Authorizer(user_interface)
 
     def __call__(self, auth: Dict, body: Dict):
         if not auth:
             raise MissingParameter('auth')
 
-        if not auth.get('Authorization'):
-            raise UserNotAuthenticated('Token de acesso não encontrado.')
+        user = self.__authorizer(auth).user
 
         if not body:
             raise MissingParameter('body')
 
-        decoded_token = self.__token.decode_token(auth['Authorization'])
-        if not decoded_token:
-            raise UserNotAuthenticated("Token de acesso inválido ou expirado.")
-        user_id = decoded_token.get('user_id')
-        user = self.__user_interface.get_user_by_id(user_id=user_id)
-        if not user:
-            raise UserNotAuthenticated()
-
         if body.get("password"):
             if checkpw(body.get("password").encode("utf-8"), user.get("password").encode("utf-8")):
                 raise InvalidParameter("Senha", "deve ser diferente da anterior")
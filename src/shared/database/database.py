@@ -1,25 +1,69 @@
 import os
-import boto3
+import time
+from threading import Lock
+from typing import Dict, List
 
-if os.environ.get('STAGE') == 'test':
-    resource = boto3.resource('dynamodb',
-                              endpoint_url='http://localhost:8000',
-                              region_name='dummy',
-                              aws_access_key_id='dummy',
-                              aws_secret_access_key='dummy'
-                              )
-else:
-    resource = boto3.resource('dynamodb')
+from src.shared.errors.modules_errors import DataNotRetrieved
+
+_resource = None
+_resource_lock = Lock()
+
+
+def get_resource():
+    """
+    DynamoDB resource shared by the whole container, created on first use
+    """
+    global _resource
+    if _resource is None:
+        with _resource_lock:
+            if _resource is None:
+                import boto3
+
+                if os.environ.get('STAGE') == 'test':
+                    _resource = boto3.resource('dynamodb',
+                                               endpoint_url='http://localhost:8000',
+                                               region_name='dummy',
+                                               aws_access_key_id='dummy',
+                                               aws_secret_access_key='dummy'
+                                               )
+                else:
+                    _resource = boto3.resource('dynamodb')
+    return _resource
+
+
+BATCH_GET_SIZE = 100
+BATCH_GET_ATTEMPTS = 5
+
+
+def batch_get_items(table, keys: List[Dict], **kwargs) -> List[Dict]:
+    """
+    Get the items of the keys with BatchGetItem, 100 keys per call. Keys DynamoDB leaves unprocessed are
+    requested again with exponential backoff. Items come back in no particular order, join them by key.
+    """
+    unique_keys = list({tuple(sorted(key.items())): key for key in keys}.values())
+    items = []
+    for start in range(0, len(unique_keys), BATCH_GET_SIZE):
+        request = {table.name: {'Keys': unique_keys[start:start + BATCH_GET_SIZE], **kwargs}}
+        for attempt in range(BATCH_GET_ATTEMPTS):
+            response = get_resource().batch_get_item(RequestItems=request)
+            items.extend(response.get('Responses', {}).get(table.name, []))
+            request = response.get('UnprocessedKeys')
+            if not request:
+                break
+            if attempt + 1 < BATCH_GET_ATTEMPTS:
+                time.sleep(0.05 * 2 ** attempt)
+        else:
+            raise DataNotRetrieved()
+    return items
 
 
 class Database:
     def __init__(self):
-        self.__database_connection = resource
         self.__user_table = os.environ.get('USER_TABLE')
         self.__auction_table = os.environ.get('AUCTION_TABLE')
 
     def get_table_user(self):
-        return self.__database_connection.Table(self.__user_table)
+        return get_resource().Table(self.__user_table)
 
     def get_table_auction(self):
-        return self.__database_connection.Table(self.__auction_table)
+        return get_resource().Table(self.__auction_table)
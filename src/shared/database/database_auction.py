@@ -1,19 +1,46 @@
+import os
+import time
+import random
 from decimal import Decimal
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Set
 from botocore.exceptions import ClientError
 from boto3.dynamodb.conditions import Key, Attr
+from boto3.dynamodb.types import TypeDeserializer
 
-from src.shared.database.database import Database
+from src.shared.database.database import Database, batch_get_items
+from src.shared.database.database_sequence import SequenceDynamodb
+from src.shared.database.pagination import DEFAULT_PAGE_SIZE, decode_partitioned_cursor, encode_cursor, \
+    query_items, take_merged_page
 from src.shared.structure.entities.bid import Bid
 from src.shared.structure.entities.auction import Auction
 from src.shared.structure.enums.auction_enum import STATUS_AUCTION_ENUM
 from src.shared.structure.enums.table_entities import AUCTION_TABLE_ENTITY
 from src.shared.structure.interface.auction_interface import AuctionInterface
+from src.shared.errors.modules_errors import DataAlreadyUsed, DataNotFound, InvalidParameter, UserNotAuthenticated
 
 
 class AuctionDynamodb(AuctionInterface):
+    STATUS_INDEX_KEY_ATTRIBUTES = ('PK', 'SK', 'status_auction', 'start_date')
+    AUCTION_SEQUENCE_KEY = {'PK': AUCTION_TABLE_ENTITY.SEQUENCE.value,
+                            'SK': AUCTION_TABLE_ENTITY.SEQUENCE.value + "#" + AUCTION_TABLE_ENTITY.AUCTION.value}
+    PLACE_BID_ATTEMPTS = 3
+    PLACE_BID_BACKOFF = 0.05
+
     def __init__(self):
-        self.__dynamodb = Database().get_table_auction()
+        self.__table = None
+        self.__sequence_dynamodb = None
+
+    @property
+    def __dynamodb(self):
+        if self.__table is None:
+            self.__table = Database().get_table_auction()
+        return self.__table
+
+    @property
+    def __sequence(self) -> SequenceDynamodb:
+        if self.__sequence_dynamodb is None:
+            self.__sequence_dynamodb = SequenceDynamodb(self.__dynamodb)
+        return self.__sequence_dynamodb
 
     def create_auction(self, auction: Auction) -> Dict or None:
         try:
@@ -22,7 +49,12 @@ class AuctionDynamodb(AuctionInterface):
             auction['SK'] = AUCTION_TABLE_ENTITY.AUCTION.value
             auction['start_amount'] = Decimal(str(auction['start_amount']))
             auction['current_amount'] = Decimal(str(auction['current_amount']))
-            self.__dynamodb.put_item(Item=auction)
+            try:
+                self.__dynamodb.put_item(Item=auction, ConditionExpression=Attr('PK').not_exists())
+            except ClientError as e:
+                if e.response['Error']['Code'] == 'ConditionalCheckFailedException':
+                    raise DataAlreadyUsed(f"Leilão {auction['PK']}")
+                raise e
 
             auction['auction_id'] = auction.pop('PK')
             auction.pop('SK')
@@ -30,101 +62,101 @@ class AuctionDynamodb(AuctionInterface):
         except ClientError as e:
             raise e
 
-    def get_all_auctions_admin(self, auctions_closed: bool = False) -> List[Optional[Dict]]:
+    def get_auctions_by_status(self, status_auctions: List[STATUS_AUCTION_ENUM], limit: int = DEFAULT_PAGE_SIZE,
+                               cursor: Optional[str] = None, start_date_until: Optional[int] = None,
+                               filter_expression=None) -> Dict:
         try:
-            if not auctions_closed:
-                permission_to_search = [STATUS_AUCTION_ENUM.OPEN.value, STATUS_AUCTION_ENUM.PENDING.value]
-                query = self.__dynamodb.query(
-                    IndexName="SK_start_date-index",
-                    KeyConditionExpression=Key('SK').eq(AUCTION_TABLE_ENTITY.AUCTION.value),
-                    FilterExpression=Attr('status_auction').eq(permission_to_search[0]) | Attr('status_auction').eq(
-                        permission_to_search[1]),
+            partitions = [status_auction.value for status_auction in status_auctions]
+            start_keys = decode_partitioned_cursor(cursor, partitions, self.STATUS_INDEX_KEY_ATTRIBUTES)
+
+            streams = {}
+            for status_auction in partitions:
+                key_condition = Key('status_auction').eq(status_auction)
+                if start_date_until is not None:
+                    key_condition = key_condition & Key('start_date').lte(start_date_until)
+                query = dict(
+                    IndexName="status_auction_start_date-index",
+                    KeyConditionExpression=key_condition,
                     ScanIndexForward=True,
+                    Limit=limit + 1,
                 )
-                response = query.get('Items', None)
-                if response:
-                    for auction in response:
-                        auction.pop('SK')
-                        auction['auction_id'] = auction.pop('PK')
-                        auction['created_at'] = int(auction['created_at'])
-                        auction['start_date'] = int(auction['start_date'])
-                        auction['end_date'] = int(auction['end_date'])
-                        auction['start_amount'] = round(float(auction['start_amount']), 2)
-                        auction['current_amount'] = round(float(auction['current_amount']), 2)
-                        if auction.get('status_auction') == STATUS_AUCTION_ENUM.OPEN.value:
-                            bids = self.get_all_bids_by_auction_id(auction_id=auction.get('auction_id'))
-                            auction['bids'] = bids
+                if filter_expression is not None:
+                    query['FilterExpression'] = filter_expression
+                if start_keys.get(status_auction):
+                    query['ExclusiveStartKey'] = start_keys[status_auction]
+                streams[status_auction] = query_items(self.__dynamodb, **query)
+
+            response, next_keys = take_merged_page(streams, 'start_date', limit, self.STATUS_INDEX_KEY_ATTRIBUTES,
+                                                   start_keys)
+            for auction in response:
+                auction.pop('SK')
+                auction['auction_id'] = auction.pop('PK')
+                auction['created_at'] = int(auction['created_at'])
+                auction['start_date'] = int(auction['start_date'])
+                auction['end_date'] = int(auction['end_date'])
+                auction['start_amount'] = round(float(auction['start_amount']), 2)
+                auction['current_amount'] = round(float(auction['current_amount']), 2)
+            return {
+                "auctions": response,
+                "next_cursor": encode_cursor(next_keys),
+            }
+        except ClientError as e:
+            raise e
+
+    def get_all_auctions_admin(self, auctions_closed: bool = False, limit: int = DEFAULT_PAGE_SIZE,
+                               cursor: Optional[str] = None) -> Dict:
+        try:
+            if not auctions_closed:
+                permission_to_search = [STATUS_AUCTION_ENUM.OPEN, STATUS_AUCTION_ENUM.PENDING]
             else:
-                permission_to_search = [STATUS_AUCTION_ENUM.CLOSED.value, STATUS_AUCTION_ENUM.AVAILABLE.value]
-                query = self.__dynamodb.query(
-                    IndexName="SK_start_date-index",
-                    KeyConditionExpression=Key('SK').eq(AUCTION_TABLE_ENTITY.AUCTION.value),
-                    FilterExpression=Attr('status_auction').eq(permission_to_search[0]) | Attr('status_auction').eq(
-                        permission_to_search[1]),
-                    ScanIndexForward=True,
-                )
-                response = query.get('Items', None)
-                if response:
-                    for auction in response:
-                        auction.pop('SK')
-                        auction['auction_id'] = auction.pop('PK')
-                        auction['created_at'] = int(auction['created_at'])
-                        auction['start_date'] = int(auction['start_date'])
-                        auction['end_date'] = int(auction['end_date'])
-                        auction['start_amount'] = round(float(auction['start_amount']), 2)
-                        auction['current_amount'] = round(float(auction['current_amount']), 2)
-                        if auction.get('status_auction') == STATUS_AUCTION_ENUM.CLOSED.value:
-                            bids = self.get_all_bids_by_auction_id(auction_id=auction.get('auction_id'))
-                            auction['bids'] = bids
-                            payment = self.get_payment_by_auction(auction_id=auction.get('auction_id'))
-                            auction['payment'] = payment
-            return response if response else []
+                permission_to_search = [STATUS_AUCTION_ENUM.CLOSED, STATUS_AUCTION_ENUM.AVAILABLE]
+
+            response = self.get_auctions_by_status(status_auctions=permission_to_search, limit=limit, cursor=cursor)
+            for auction in response.get('auctions'):
+                if auction.get('status_auction') == STATUS_AUCTION_ENUM.OPEN.value:
+                    bids = self.get_all_bids_by_auction_id(auction_id=auction.get('auction_id'))
+                    auction['bids'] = bids
+                if auction.get('status_auction') == STATUS_AUCTION_ENUM.CLOSED.value:
+                    bids = self.get_all_bids_by_auction_id(auction_id=auction.get('auction_id'))
+                    auction['bids'] = bids
+                    payment = self.get_payment_by_auction(auction_id=auction.get('auction_id'))
+                    auction['payment'] = payment
+            return response
         except ClientError as e:
             raise e
 
     def get_all_auctions_menu(self) -> Optional[List[Dict]]:
         try:
-            permission_to_search = [STATUS_AUCTION_ENUM.OPEN.value, STATUS_AUCTION_ENUM.PENDING.value]
-            query = self.__dynamodb.query(
-                IndexName="SK_start_date-index",
-                KeyConditionExpression=Key('SK').eq(AUCTION_TABLE_ENTITY.AUCTION.value),
-                FilterExpression=Attr('status_auction').eq(permission_to_search[0]) | Attr('status_auction').eq(
-                    permission_to_search[1]),
-                ScanIndexForward=True,
-                Limit=6,
-            )
-
-            response = query.get('Items', None)
-            if response:
-                for auction in response:
-                    auction.pop('SK')
-                    auction['auction_id'] = auction.pop('PK')
-                    auction['start_amount'] = round(float(auction['start_amount']), 2)
-                    auction['current_amount'] = round(float(auction['current_amount']), 2)
+            permission_to_search = [STATUS_AUCTION_ENUM.OPEN, STATUS_AUCTION_ENUM.PENDING]
+            response = self.get_auctions_by_status(status_auctions=permission_to_search, limit=6).get('auctions')
             return response if len(response) > 0 else None
         except ClientError as e:
             raise e
 
     def get_auction_between_dates(self, start_date: int, end_date: int) -> List[Dict] or None:
+        """
+        Get every open or pending auction starting or ending between the dates, reading each status
+        until the index has no more matches
+        """
         try:
-            permission_to_search = [STATUS_AUCTION_ENUM.OPEN.value, STATUS_AUCTION_ENUM.PENDING.value]
-            query = self.__dynamodb.query(
-                IndexName="SK_created_at-index",
-                KeyConditionExpression=Key('SK').eq(AUCTION_TABLE_ENTITY.AUCTION.value),
-                FilterExpression=Attr('start_date').between(start_date, end_date) | Attr('end_date').between(start_date, end_date),
-                ScanIndexForward=False,
-            )
-
-            response = query.get('Items', None)
-            if response:
-                for auction in response:
-                    if auction.get('status_auction') not in permission_to_search:
-                        response.remove(auction)
-                        continue
-                    auction.pop('SK')
-                    auction['auction_id'] = auction.pop('PK')
-                    auction['start_amount'] = round(float(auction['start_amount']), 2)
-                    auction['current_amount'] = round(float(auction['current_amount']), 2)
+            response = []
+            for status_auction in [STATUS_AUCTION_ENUM.OPEN, STATUS_AUCTION_ENUM.PENDING]:
+                response.extend(query_items(
+                    self.__dynamodb,
+                    IndexName="status_auction_start_date-index",
+                    KeyConditionExpression=Key('status_auction').eq(status_auction.value) & Key('start_date').lte(
+                        end_date),
+                    FilterExpression=Attr('start_date').between(start_date, end_date) | Attr('end_date').between(
+                        start_date, end_date),
+                ))
+            for auction in response:
+                auction.pop('SK')
+                auction['auction_id'] = auction.pop('PK')
+                auction['created_at'] = int(auction['created_at'])
+                auction['start_date'] = int(auction['start_date'])
+                auction['end_date'] = int(auction['end_date'])
+                auction['start_amount'] = round(float(auction['start_amount']), 2)
+                auction['current_amount'] = round(float(auction['current_amount']), 2)
             return response if len(response) > 0 else None
         except ClientError as e:
             raise e
@@ -147,16 +179,41 @@ class AuctionDynamodb(AuctionInterface):
         except ClientError as e:
             raise e
 
-    def get_last_auction_id(self) -> int or None:
+    def get_next_auction_id(self) -> int:
         try:
-            query = self.__dynamodb.query(
+            return self.__sequence.next_value(key=self.AUCTION_SEQUENCE_KEY, seed=self.__get_last_auction_id)
+        except ClientError as e:
+            raise e
+
+    def reserve_auction_ids(self, size: int) -> range:
+        try:
+            return self.__sequence.reserve_block(key=self.AUCTION_SEQUENCE_KEY, size=size,
+                                                 seed=self.__get_last_auction_id)
+        except ClientError as e:
+            raise e
+
+    def __get_last_auction_id(self) -> int or None:
+        """
+        Only used once, to start the auction sequence from the ids created before it existed
+        """
+        auctions = query_items(
+            self.__dynamodb,
+            IndexName="SK-index",
+            KeyConditionExpression=Key('SK').eq(AUCTION_TABLE_ENTITY.AUCTION.value),
+            ProjectionExpression='PK',
+        )
+        return max((int(auction['PK']) for auction in auctions), default=None)
+
+    def get_auction_ids(self, exclude_status: List[STATUS_AUCTION_ENUM] = None) -> Set[str]:
+        try:
+            excluded = {status.value for status in exclude_status or []}
+            auctions = query_items(
+                self.__dynamodb,
                 IndexName="SK-index",
                 KeyConditionExpression=Key('SK').eq(AUCTION_TABLE_ENTITY.AUCTION.value),
+                ProjectionExpression='PK, status_auction',
             )
-            response = query.get('Items', None)
-            if response:
-                return int(sorted(response, key=lambda k: int(k['PK']), reverse=True)[0]['PK'])
-            return None
+            return {auction['PK'] for auction in auctions if auction.get('status_auction') not in excluded}
         except ClientError as e:
             raise e
 
@@ -191,33 +248,95 @@ class AuctionDynamodb(AuctionInterface):
         except ClientError as e:
             raise e
 
-    def update_auction_current_amount(self, auction_id: str = None, current_amount: float = None) -> Dict or None:
+    def get_next_bid_id(self, auction_id: str) -> int:
         try:
-            response = self.__dynamodb.update_item(
-                Key={'PK': auction_id,
-                     'SK': AUCTION_TABLE_ENTITY.AUCTION.value},
-                UpdateExpression='SET current_amount = :current_amount',
-                ExpressionAttributeValues={
-                    ':current_amount': Decimal(str(round(current_amount, 2)))
-                },
-                ReturnValues='UPDATED_NEW'
-            )
+            return self.__sequence.next_value(key=self.__bid_sequence_key(auction_id),
+                                              seed=lambda: self.__get_last_bid_id(auction_id))
         except ClientError as e:
             raise e
 
-    def get_last_bid_id(self, auction_id: str) -> Optional[int]:
-        try:
-            query = self.__dynamodb.query(
-                KeyConditionExpression=Key('PK').eq(auction_id) & Key('SK').begins_with(AUCTION_TABLE_ENTITY.BID.value),
-                ScanIndexForward=False,
-                Limit=1
-            )
-            response = query.get('Items', None)
-            if response:
-                return int(response[0]['SK'].split('#')[-1])
-            return None
-        except ClientError as e:
-            raise e
+    @staticmethod
+    def __bid_sequence_key(auction_id: str) -> Dict:
+        return {'PK': auction_id, 'SK': AUCTION_TABLE_ENTITY.SEQUENCE.value + "#" + AUCTION_TABLE_ENTITY.BID.value}
+
+    def __get_last_bid_id(self, auction_id: str) -> int or None:
+        """
+        Only used once per auction, to start its bid sequence from the bids created before it existed.
+        Refuses to create a counter for an auction that does not exist.
+        """
+        if not self.get_auction_by_id(auction_id=auction_id):
+            raise DataNotFound('Leilão')
+        bids = query_items(
+            self.__dynamodb,
+            KeyConditionExpression=Key('PK').eq(auction_id) & Key('SK').begins_with(
+                AUCTION_TABLE_ENTITY.BID.value + "#"),
+            ProjectionExpression='SK',
+        )
+        return max((int(bid['SK'].split('#')[-1]) for bid in bids), default=None)
+
+    def place_bid(self, bid: Bid) -> Dict:
+        """
+        Put the bid and raise the current amount of the auction in one transaction, retried with
+        jittered backoff when it conflicts with another bid. The bid_id is taken from the sequence
+        beforehand, so refused bids leave gaps in the ids of an auction.
+        """
+        payload = {
+            "PK": bid.auction_id,
+            "SK": AUCTION_TABLE_ENTITY.BID.value + "#" + bid.bid_id,
+            "user_id": bid.user_id,
+            "email": bid.email,
+            "first_name": bid.first_name,
+            "amount": Decimal(str(round(bid.amount, 2))),
+            "created_at": bid.created_at,
+        }
+        transact_items = [
+            {
+                'Put': {
+                    'TableName': self.__dynamodb.name,
+                    'Item': payload,
+                    'ConditionExpression': 'attribute_not_exists(PK)',
+                }
+            },
+            {
+                'Update': {
+                    'TableName': self.__dynamodb.name,
+                    'Key': {'PK': bid.auction_id, 'SK': AUCTION_TABLE_ENTITY.AUCTION.value},
+                    'UpdateExpression': 'SET current_amount = :amount',
+                    'ConditionExpression': 'status_auction = :status_auction AND current_amount <= :max_current_amount',
+                    'ExpressionAttributeValues': {
+                        ':amount': payload['amount'],
+                        ':status_auction': STATUS_AUCTION_ENUM.OPEN.value,
+                        ':max_current_amount': Decimal(str(round(bid.amount - 1, 2))),
+                    },
+                    'ReturnValuesOnConditionCheckFailure': 'ALL_OLD',
+                }
+            },
+        ]
+        for attempt in range(self.PLACE_BID_ATTEMPTS):
+            try:
+                self.__dynamodb.meta.client.transact_write_items(TransactItems=transact_items)
+                return payload
+            except ClientError as e:
+                if e.response['Error']['Code'] != 'TransactionCanceledException':
+                    raise e
+                reasons = [reason.get('Code') for reason in e.response.get('CancellationReasons', [])]
+                if 'TransactionConflict' in reasons and attempt + 1 < self.PLACE_BID_ATTEMPTS:
+                    time.sleep(random.uniform(0, self.PLACE_BID_BACKOFF * 2 ** attempt))
+                    continue
+                if len(reasons) == 2 and reasons[1] == 'ConditionalCheckFailed':
+                    self.__raise_bid_refused(bid, e.response['CancellationReasons'][1].get('Item'))
+                raise e
+
+    @staticmethod
+    def __raise_bid_refused(bid: Bid, auction: Optional[Dict]):
+        if not auction:
+            raise DataNotFound('Leilão')
+        auction = {name: TypeDeserializer().deserialize(value) for name, value in auction.items()}
+        if auction.get('status_auction') != STATUS_AUCTION_ENUM.OPEN.value:
+            raise UserNotAuthenticated("Leilão não está aberto para lances.")
+        if round(float(auction.get('current_amount')), 2) >= bid.amount:
+            raise InvalidParameter("Lance", "deve ser maior que o valor atual do leilão")
+        raise InvalidParameter("Lance", "deve ser pelo menos 1 real a mais que o valor atual do leilão")
 
     def get_all_bids_by_auction_id(self, auction_id: str) -> List[Dict]:
         try:
@@ -236,20 +355,26 @@ class AuctionDynamodb(AuctionInterface):
         except ClientError as e:
             raise e
 
-    def create_bid(self, bid: Bid) -> Dict or None:
+    def get_top_bids_by_auction_id(self, auction_id: str, limit: int = 5) -> List[Dict]:
+        if os.environ.get('BID_AMOUNT_INDEX') != 'true':
+            # PK_amount-index is deployed after status_auction_start_date-index, see dynamodb_schema
+            return self.get_all_bids_by_auction_id(auction_id=auction_id)[:limit]
         try:
-            payload = {
-                "PK": bid.auction_id,
-                "SK": AUCTION_TABLE_ENTITY.BID.value + "#" + bid.bid_id,
-                "user_id": bid.user_id,
-                "email": bid.email,
-                "first_name": bid.first_name,
-                "amount": Decimal(str(bid.amount)),
-                "created_at": bid.created_at,
-            }
-            self.__dynamodb.put_item(Item=payload)
-
-            return payload
+            # Only bids and the payment of a closed auction, which repeats the highest bid, have an amount
+            query = self.__dynamodb.query(
+                IndexName="PK_amount-index",
+                KeyConditionExpression=Key('PK').eq(auction_id),
+                FilterExpression=Attr('SK').begins_with(AUCTION_TABLE_ENTITY.BID.value + "#"),
+                ScanIndexForward=False,
+                Limit=limit + 1,
+            )
+            response = query.get('Items', [])[:limit]
+            for bid in response:
+                bid['bid_id'] = bid.pop('SK').split('#')[1]
+                bid['auction_id'] = bid.pop('PK')
+                bid['amount'] = round(float(bid['amount']), 2)
+                bid['created_at'] = int(bid['created_at'])
+            return response
         except ClientError as e:
             raise e
 
@@ -290,22 +415,22 @@ class AuctionDynamodb(AuctionInterface):
         try:
             FilterExpression = Attr('SK').begins_with("PAYMENT") & Attr('status_auction').eq(status_auction) if status_auction else Attr('SK').begins_with("PAYMENT")
 
-            payments = self.__dynamodb.query(
+            payments = list(query_items(
+                self.__dynamodb,
                 IndexName="user_id-index",
                 KeyConditionExpression=Key('user_id').eq(user_id),
                 FilterExpression=FilterExpression,
-            ).get('Items', None)
+            ))
             if not payments:
                 return []
-            auctions_id = [auction.get("PK") for auction in payments]
-            auctions = [
-                self.__dynamodb.query(
-                    KeyConditionExpression=Key('PK').eq(auction_id) & Key('SK').begins_with("AUCTION"),
-                    FilterExpression=Attr('status_auction').eq(
-                        "CLOSED")
-                    ).get('Items')[0]
-                for auction_id in auctions_id]
-            merged_list = [{**auction, **payment} for auction, payment in zip(auctions, payments)]
+            auctions = batch_get_items(
+                self.__dynamodb,
+                [{'PK': payment.get('PK'), 'SK': AUCTION_TABLE_ENTITY.AUCTION.value} for payment in payments],
+            )
+            auctions = {auction['PK']: auction for auction in auctions
+                        if auction.get('status_auction') == STATUS_AUCTION_ENUM.CLOSED.value}
+            merged_list = [{**auctions[payment.get('PK')], **payment} for payment in payments
+                           if payment.get('PK') in auctions]
             for auction in merged_list:
                 auction['auction_id'] = auction.pop('PK')
                 auction['payment_id'] = auction.pop('SK').split('#')[1]
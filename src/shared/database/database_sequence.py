@@ -0,0 +1,49 @@
+from typing import Callable, Dict, Optional
+from botocore.exceptions import ClientError
+from boto3.dynamodb.conditions import Attr
+
+
+class SequenceDynamodb:
+    """
+    Monotonic id allocator backed by a counter item updated with a conditional ADD.
+    The counter is created on first use, starting from the value returned by seed, so tables
+    that already have ids keep counting from their current maximum.
+    """
+
+    def __init__(self, table):
+        self.__dynamodb = table
+
+    def next_value(self, key: Dict, seed: Optional[Callable[[], Optional[int]]] = None) -> int:
+        return self.reserve_block(key=key, size=1, seed=seed).start
+
+    def reserve_block(self, key: Dict, size: int, seed: Optional[Callable[[], Optional[int]]] = None) -> range:
+        if size < 1:
+            raise ValueError("size must be at least 1")
+        try:
+            last_value = self.__add(key, size)
+        except ClientError as e:
+            if e.response['Error']['Code'] != 'ConditionalCheckFailedException':
+                raise e
+            self.__create_counter(key, seed() if seed else 0)
+            last_value = self.__add(key, size)
+        return range(last_value - size + 1, last_value + 1)
+
+    def __add(self, key: Dict, size: int) -> int:
+        response = self.__dynamodb.update_item(
+            Key=key,
+            UpdateExpression='ADD last_value :size',
+            ConditionExpression=Attr('last_value').exists(),
+            ExpressionAttributeValues={':size': size},
+            ReturnValues='UPDATED_NEW'
+        )
+        return int(response['Attributes']['last_value'])
+
+    def __create_counter(self, key: Dict, initial_value: Optional[int]):
+        try:
+            self.__dynamodb.put_item(
+                Item={**key, 'last_value': initial_value or 0},
+                ConditionExpression=Attr('last_value').not_exists()
+            )
+        except ClientError as e:
+            if e.response['Error']['Code'] != 'ConditionalCheckFailedException':
+                raise e
@@ -1,26 +1,62 @@
-from typing import Dict, Optional
+from decimal import Decimal
+from itertools import chain
+from typing import Dict, List, Optional
 from boto3.dynamodb.conditions import Key, Attr
 from botocore.exceptions import ClientError
 
 from src.shared.database.database import Database
+from src.shared.database.database_sequence import SequenceDynamodb
+from src.shared.database.pagination import decode_cursor, encode_cursor, query_items, take_page
+from src.shared.database.user_cache import user_cache, token_version_cache
 from src.shared.structure.entities.feedback import Feedback
 from src.shared.structure.entities.user import User, UserModerator
 from src.shared.structure.interface.user_interface import UserInterface
 from src.shared.structure.enums.table_entities import USER_TABLE_ENTITY
-from src.shared.structure.enums.user_enum import TYPE_ACCOUNT_USER_ENUM
+from src.shared.structure.enums.user_enum import TYPE_ACCOUNT_USER_ENUM, STATUS_USER_ACCOUNT_ENUM
 from src.shared.structure.enums.suspension_enum import STATUS_SUSPENSION_ENUM
+from src.shared.errors.modules_errors import DataAlreadyUsed, DataNotFound
 
 
 class UserDynamodb(UserInterface):
+    HISTORY_KEY_ATTRIBUTES = ('PK', 'SK')
+    # The auction and payment attributes kept on a history item, with the names the payment is stored with
+    HISTORY_FIELDS = ('auction_id', 'title', 'description', 'images', 'status_auction', 'start_date', 'end_date',
+                      'start_amount', 'current_amount', 'payment_id', 'amount', 'status_payment', 'service',
+                      'date_payment', 'payment_expires_at', 'created_at')
+    FEEDBACK_SEQUENCE_KEY = {'PK': USER_TABLE_ENTITY.SEQUENCE.value,
+                             'SK': USER_TABLE_ENTITY.SEQUENCE.value + "#" + USER_TABLE_ENTITY.FEEDBACK.value}
+    FEEDBACK_AGGREGATE_KEY = {'PK': USER_TABLE_ENTITY.AGGREGATE.value,
+                              'SK': USER_TABLE_ENTITY.AGGREGATE.value + "#" + USER_TABLE_ENTITY.FEEDBACK.value}
+    FEEDBACK_INDEX_KEY_ATTRIBUTES = ('PK', 'SK', 'created_at')
+    FEEDBACK_GRADES = range(1, 6)
+    CREATE_FEEDBACK_ATTEMPTS = 3
+    USER_INDEX_KEY_ATTRIBUTES = ('PK', 'SK', 'type_account')
+    TRANSACT_WRITE_ATTEMPTS = 3
+    # "$" sorts right after "#", so the marker is read first by a descending query of the history
+    HISTORY_BACKFILLED_SK = USER_TABLE_ENTITY.HISTORY.value + "$BACKFILLED"
 
     def __init__(self):
-        self.__dynamodb = Database().get_table_user()
+        self.__table = None
+        self.__sequence_dynamodb = None
+
+    @property
+    def __dynamodb(self):
+        if self.__table is None:
+            self.__table = Database().get_table_user()
+        return self.__table
+
+    @property
+    def __sequence(self) -> SequenceDynamodb:
+        if self.__sequence_dynamodb is None:
+            self.__sequence_dynamodb = SequenceDynamodb(self.__dynamodb)
+        return self.__sequence_dynamodb
 
     def create_user(self, user: User or UserModerator) -> Dict or None:
         try:
             user = user.to_dict()
             user['PK'] = user.pop('user_id')
             user['SK'] = USER_TABLE_ENTITY.USER.value
+            user['suspensions'] = []
 
             self.__dynamodb.put_item(
                 Item=user
@@ -28,43 +64,76 @@ class UserDynamodb(UserInterface):
 
             user['user_id'] = user.pop('PK')
             user.pop('SK')
+            user.pop('suspensions')
 
             return user
         except ClientError as e:
             raise e
 
     def create_feedback(self, feedback: Feedback) -> Dict:
-        try:
-            feedback = feedback.to_dict()
-            feedback['PK'] = feedback.pop('feedback_id')
-            feedback['SK'] = USER_TABLE_ENTITY.FEEDBACK.value
-
-            self.__dynamodb.put_item(
-                Item=feedback
-            )
+        """
+        Put the feedback and add its grade to the aggregate in one transaction. The aggregate must exist,
+        so that it is only created once, from the feedbacks written before it.
+        """
+        feedback = feedback.to_dict()
+        feedback['PK'] = feedback.pop('feedback_id')
+        feedback['SK'] = USER_TABLE_ENTITY.FEEDBACK.value
+        transact_items = [
+            {
+                'Put': {
+                    'TableName': self.__dynamodb.name,
+                    'Item': feedback,
+                    'ConditionExpression': 'attribute_not_exists(PK)',
+                }
+            },
+            {
+                'Update': {
+                    'TableName': self.__dynamodb.name,
+                    'Key': self.FEEDBACK_AGGREGATE_KEY,
+                    'UpdateExpression': 'ADD total_count :one, total_sum :grade, #grade_count :one',
+                    'ConditionExpression': 'attribute_exists(PK)',
+                    'ExpressionAttributeNames': {'#grade_count': f"grade_{feedback['grade']}_count"},
+                    'ExpressionAttributeValues': {':one': 1, ':grade': feedback['grade']},
+                }
+            },
+        ]
+        for attempt in range(self.CREATE_FEEDBACK_ATTEMPTS):
+            try:
+                self.__dynamodb.meta.client.transact_write_items(TransactItems=transact_items)
+                break
+            except ClientError as e:
+                if e.response['Error']['Code'] != 'TransactionCanceledException':
+                    raise e
+                reasons = [reason.get('Code') for reason in e.response.get('CancellationReasons', [])]
+                if reasons and reasons[0] == 'ConditionalCheckFailed':
+                    raise DataAlreadyUsed(f"Feedback {feedback['PK']}")
+                if attempt + 1 == self.CREATE_FEEDBACK_ATTEMPTS:
+                    raise e
+                if len(reasons) == 2 and reasons[1] == 'ConditionalCheckFailed':
+                    self.__create_feedback_aggregate()
 
-            feedback['email'] = feedback.pop('SK')
+        feedback['feedback_id'] = feedback.pop('PK')
+        feedback.pop('SK')
+        return feedback
 
-            return feedback
-        except ClientError as e:
-            raise e
-
-    def get_last_feedback_id(self) -> int:
+    def get_next_feedback_id(self) -> int:
         try:
-            query = self.__dynamodb.query(
-                IndexName='SK_created_at-index',
-                KeyConditionExpression=Key('SK').eq(USER_TABLE_ENTITY.FEEDBACK.value),
-                Limit=1,
-                ScanIndexForward=False,
-            )
-            response = query.get('Items', None)
-            if response:
-                return int(response[0].get('PK'))
-            else:
-                return 0
+            return self.__sequence.next_value(key=self.FEEDBACK_SEQUENCE_KEY, seed=self.__get_last_feedback_id)
         except ClientError as e:
             raise e
 
+    def __get_last_feedback_id(self) -> int or None:
+        """
+        Only used once, to start the feedback sequence from the ids created before it existed
+        """
+        feedbacks = query_items(
+            self.__dynamodb,
+            IndexName='SK_created_at-index',
+            KeyConditionExpression=Key('SK').eq(USER_TABLE_ENTITY.FEEDBACK.value),
+            ProjectionExpression='PK',
+        )
+        return max((int(feedback['PK']) for feedback in feedbacks), default=None)
+
     def authenticate(self,
                      access_key: str = None,
                      email: str = None,
@@ -86,6 +155,7 @@ class UserDynamodb(UserInterface):
             item = item[0] if item else None
             if item:
                 item['user_id'] = item.pop('PK')
+                self.__format_suspensions(item)
                 item.pop('SK')
                 return item
             else:
@@ -94,6 +164,9 @@ class UserDynamodb(UserInterface):
             raise e
 
     def get_user_by_id(self, user_id: str) -> Dict or None:
+        item = user_cache.get(user_id)
+        if item:
+            return item
         try:
             query = self.__dynamodb.query(
                 KeyConditionExpression=Key('PK').eq(user_id) & Key('SK').eq(USER_TABLE_ENTITY.USER.value),
@@ -102,38 +175,66 @@ class UserDynamodb(UserInterface):
             if item:
                 item = item[0]
                 item['user_id'] = item.pop('PK')
+                self.__format_suspensions(item)
                 item['created_at'] = int(item['created_at']) if item.get('created_at') else None
                 item['verification_email_code_expires_at'] = int(item['verification_email_code_expires_at']) if item.get("verification_email_code_expires_at") else None
+                item['token_version'] = int(item.get('token_version', 0))
                 item.pop('SK')
+                user_cache.put(user_id, item)
             return item
         except ClientError as e:
             raise e
 
-    def get_all_users(self, type_account: TYPE_ACCOUNT_USER_ENUM = None) -> Dict or None:
+    def get_token_version(self, user_id: str) -> Optional[int]:
+        cached = token_version_cache.get(user_id)
+        if cached:
+            return cached['token_version']
         try:
-            if type_account == "ADMIN":
+            item = self.__dynamodb.get_item(
+                Key={'PK': user_id, 'SK': USER_TABLE_ENTITY.USER.value},
+                ProjectionExpression='token_version, status_account',
+            ).get('Item')
+            if not item:
                 return None
-            query = self.__dynamodb.query(
-                IndexName='SK_type_account-index',
-                KeyConditionExpression=Key('SK').eq(USER_TABLE_ENTITY.USER.value),
-            ) if not type_account else self.__dynamodb.query(
+            token_version = int(item.get('token_version', 0))
+            token_version_cache.put(user_id, {'token_version': token_version})
+            return token_version
+        except ClientError as e:
+            raise e
+
+    def get_all_users(self, limit: int, cursor: Optional[str] = None,
+                      type_account: TYPE_ACCOUNT_USER_ENUM = None) -> Dict:
+        """
+        Get a page of users, except admins, with the suspension summaries embedded on each user item
+        """
+        try:
+            if type_account == TYPE_ACCOUNT_USER_ENUM.ADMIN:
+                return {"users": [], "next_cursor": None}
+            key_condition = Key('SK').eq(USER_TABLE_ENTITY.USER.value)
+            if type_account:
+                key_condition = key_condition & Key('type_account').eq(type_account.value)
+            query = dict(
                 IndexName='SK_type_account-index',
-                KeyConditionExpression=Key('SK').eq(USER_TABLE_ENTITY.USER.value) & Key('type_account').eq(type_account.value),
+                KeyConditionExpression=key_condition,
+                FilterExpression=Attr('type_account').ne(TYPE_ACCOUNT_USER_ENUM.ADMIN.value),
+                Limit=limit + 1,
             )
-            response = query.get('Items', [])
-            if len(response) > 0:
-                for user in response:
-                    if user.get('type_account') == TYPE_ACCOUNT_USER_ENUM.ADMIN.value:
-                        response.remove(user)
-                    else:
-                        user['user_id'] = user.pop('PK')
-                        user.pop('SK')
-                        user['created_at'] = int(user['created_at']) if user.get("created_at") else None
-                        user['verification_email_code_expires_at'] = int(user['verification_email_code_expires_at']) if user.get("verification_email_code_expires_at") else None
-                        suspensions = self.get_all_suspensions_by_user_id(user['user_id'])
-                        user['suspensions'] = suspensions if suspensions else None
-            return response if response else None
+            start_key = decode_cursor(cursor, self.USER_INDEX_KEY_ATTRIBUTES)
+            if start_key:
+                query['ExclusiveStartKey'] = start_key
 
+            page, next_key = take_page(query_items(self.__dynamodb, **query), limit, self.USER_INDEX_KEY_ATTRIBUTES)
+            for user in page:
+                user['user_id'] = user.pop('PK')
+                user.pop('SK')
+                user['created_at'] = int(user['created_at']) if user.get("created_at") else None
+                user['verification_email_code_expires_at'] = int(user['verification_email_code_expires_at']) if user.get("verification_email_code_expires_at") else None
+                user['token_version'] = int(user.get('token_version', 0))
+                self.__format_suspensions(user)
+            return {
+                "users": page,
+                "next_cursor": encode_cursor(next_key),
+            }
         except ClientError as e:
             raise e
 
@@ -162,6 +263,7 @@ class UserDynamodb(UserInterface):
             response = query.get('Items', None)
             if response:
                 response[0]['user_id'] = response[0].pop('PK')
+                self.__format_suspensions(response[0])
                 response[0].pop('SK')
             return response[0] if response else None
         except ClientError as e:
@@ -177,6 +279,7 @@ class UserDynamodb(UserInterface):
             response = query.get('Items', None)
             if response:
                 response[0]['user_id'] = response[0].pop('PK')
+                self.__format_suspensions(response[0])
                 response[0].pop('SK')
             return response[0] if response else None
         except ClientError as e:
@@ -192,69 +295,104 @@ class UserDynamodb(UserInterface):
             response = query.get('Items', None)
             if response:
                 response[0]['user_id'] = response[0].pop('PK')
+                self.__format_suspensions(response[0])
                 response[0].pop('SK')
             return response[0] if response else None
         except ClientError as e:
             raise e
 
     def update_user(self, user: User) -> Dict or None:
+        """
+        Bumps token_version when the status or the type of the account changes, revoking the tokens
+        issued with the previous ones
+        """
+        key = {'PK': user.user_id, 'SK': USER_TABLE_ENTITY.USER.value}
         try:
-            response = self.__dynamodb.update_item(
-                Key={
-                    'PK': user.user_id,
-                    'SK': USER_TABLE_ENTITY.USER.value
-                },
-                UpdateExpression='SET first_name = :first_name,'
-                                 'last_name = :last_name,'
-                                 'cpf = :cpf,'
-                                 'phone = :phone,'
-                                 'password = :password,'
-                                 'accepted_terms = :accepted_terms,'
-                                 'status_account = :status_account,'
-                                 'type_account = :type_account,'
-                                 'created_at = :created_at,'
-                                 'verification_email_code = :verification_email_code,'
-                                 'verification_email_code_expires_at = :verification_email_code_expires_at',
-                ExpressionAttributeValues={
-                    ':first_name': user.first_name,
-                    ':last_name': user.last_name,
-                    ':cpf': user.cpf,
-                    ':phone': user.phone,
-                    ':password': user.password,
-                    ':accepted_terms': user.accepted_terms,
-                    ':status_account': user.status_account.value,
-                    ':type_account': user.type_account.value,
-                    ':created_at': user.created_at,
-                    ':verification_email_code': user.verification_email_code,
-                    ':verification_email_code_expires_at': user.verification_email_code_expires_at,
-                },
-                ReturnValues='ALL_NEW'
-            )['Attributes']
+            for attempt in range(self.TRANSACT_WRITE_ATTEMPTS):
+                current = self.__dynamodb.get_item(Key=key, ProjectionExpression='status_account, type_account',
+                                                   ConsistentRead=True).get('Item')
+                if current:
+                    condition = Attr('status_account').eq(current.get('status_account')) & \
+                                Attr('type_account').eq(current.get('type_account'))
+                    revoke = current.get('status_account') != user.status_account.value or \
+                        current.get('type_account') != user.type_account.value
+                else:
+                    condition = Attr('PK').not_exists()
+                    revoke = False
+                try:
+                    response = self.__dynamodb.update_item(
+                        Key=key,
+                        UpdateExpression='SET first_name = :first_name,'
+                                         'last_name = :last_name,'
+                                         'cpf = :cpf,'
+                                         'phone = :phone,'
+                                         'password = :password,'
+                                         'accepted_terms = :accepted_terms,'
+                                         'status_account = :status_account,'
+                                         'type_account = :type_account,'
+                                         'created_at = :created_at,'
+                                         'verification_email_code = :verification_email_code,'
+                                         'verification_email_code_expires_at = :verification_email_code_expires_at' +
+                                         (' ADD token_version :one' if revoke else ''),
+                        ConditionExpression=condition,
+                        ExpressionAttributeValues={
+                            ':first_name': user.first_name,
+                            ':last_name': user.last_name,
+                            ':cpf': user.cpf,
+                            ':phone': user.phone,
+                            ':password': user.password,
+                            ':accepted_terms': user.accepted_terms,
+                            ':status_account': user.status_account.value,
+                            ':type_account': user.type_account.value,
+                            ':created_at': user.created_at,
+                            ':verification_email_code': user.verification_email_code,
+                            ':verification_email_code_expires_at': user.verification_email_code_expires_at,
+                            **({':one': 1} if revoke else {}),
+                        },
+                        ReturnValues='ALL_NEW'
+                    )['Attributes']
+                    break
+                except ClientError as e:
+                    # The status or the type changed since they were read, compare them again
+                    if e.response['Error']['Code'] != 'ConditionalCheckFailedException' or \
+                            attempt + 1 == self.TRANSACT_WRITE_ATTEMPTS:
+                        raise e
             if response:
                 response.pop('SK')
                 response['user_id'] = response.pop('PK')
+                self.__format_suspensions(response)
                 response['created_at'] = int(response['created_at'])
+                response['token_version'] = int(response.get('token_version', 0))
+            user_cache.invalidate(user.user_id)
+            if revoke:
+                token_version_cache.invalidate(user.user_id)
             return response if response else None
         except ClientError as e:
             raise e
 
     def update_user_status(self, user_id: str, status: str) -> Dict or None:
         try:
+            # Bumping token_version revokes the status embedded in tokens issued before this change
             response = self.__dynamodb.update_item(
                 Key={
                     'PK': user_id,
                     'SK': USER_TABLE_ENTITY.USER.value
                 },
-                UpdateExpression='SET status_account = :status_account',
+                UpdateExpression='SET status_account = :status_account ADD token_version :one',
                 ExpressionAttributeValues={
-                    ':status_account': status,
+                    ':status_account': status.value if isinstance(status, STATUS_USER_ACCOUNT_ENUM) else status,
+                    ':one': 1,
                 },
                 ReturnValues='ALL_NEW'
             )['Attributes']
             if response:
                 response.pop('SK')
                 response['user_id'] = response.pop('PK')
+                self.__format_suspensions(response)
                 response['created_at'] = int(response['created_at'])
+                response['token_version'] = int(response['token_version'])
+            user_cache.invalidate(user_id)
+            token_version_cache.invalidate(user_id)
             return response if response else None
         except ClientError as e:
             raise e
@@ -277,60 +415,194 @@ class UserDynamodb(UserInterface):
             raise e
 
     def create_suspension(self, suspension) -> Dict or None:
+        """
+        Put the suspension and append its summary to the user item in one transaction.
+        Raises DataNotFound when the user does not exist.
+        """
+        suspension = suspension.to_dict()
+        suspension['PK'] = suspension.pop('user_id')
+        suspension['SK'] = USER_TABLE_ENTITY.SUSPENSION.value + "#" + suspension.pop('suspension_id')
+        user_key = {'PK': suspension['PK'], 'SK': USER_TABLE_ENTITY.USER.value}
         try:
-            suspension = suspension.to_dict()
-            suspension['PK'] = suspension.pop('user_id')
-            suspension['SK'] = USER_TABLE_ENTITY.SUSPENSION.value + "#" + suspension.pop('suspension_id')
-
-            self.__dynamodb.put_item(
-                Item=suspension
-            )
+            self.__transact_write([
+                {
+                    'Put': {
+                        'TableName': self.__dynamodb.name,
+                        'Item': suspension,
+                        'ConditionExpression': 'attribute_not_exists(PK)',
+                    }
+                },
+                {
+                    'Update': {
+                        'TableName': self.__dynamodb.name,
+                        'Key': user_key,
+                        'UpdateExpression': 'SET suspensions = list_append(if_not_exists(suspensions, :empty), '
+                                            ':suspension)',
+                        'ConditionExpression': 'attribute_exists(PK)',
+                        'ExpressionAttributeValues': {':suspension': [self.__suspension_summary(suspension)],
+                                                      ':empty': []},
+                    }
+                },
+            ])
 
             suspension['user_id'] = suspension.pop('PK')
             suspension['suspension_id'] = suspension.pop('SK').split('#')[1]
 
+            user_cache.invalidate(suspension['user_id'])
             return suspension
         except ClientError as e:
+            reasons = [reason.get('Code') for reason in e.response.get('CancellationReasons', [])]
+            if len(reasons) > 1 and reasons[1] == 'ConditionalCheckFailed':
+                raise DataNotFound('Usuário')
             raise e
 
     def update_suspension_status(self, user_id: str, suspension_id: str, status: STATUS_SUSPENSION_ENUM) -> Dict or None:
+        """
+        Update the status of the suspension and of its summary on the user item in one transaction
+        """
+        status = status.value if isinstance(status, STATUS_SUSPENSION_ENUM) else status
+        suspension_key = {'PK': user_id, 'SK': USER_TABLE_ENTITY.SUSPENSION.value + "#" + suspension_id}
+        user_key = {'PK': user_id, 'SK': USER_TABLE_ENTITY.USER.value}
         try:
-            response = self.__dynamodb.update_item(
-                Key={
-                    'PK': user_id,
-                    'SK': USER_TABLE_ENTITY.SUSPENSION.value + "#" + suspension_id
-                },
-                UpdateExpression='SET status_suspension = :status_suspension',
-                ExpressionAttributeValues={
-                    ':status_suspension': status.value,
-                },
-                ReturnValues='ALL_NEW'
-            )['Attributes']
-            if response:
-                response.pop('SK')
-                response['user_id'] = response.pop('PK')
-                response['created_at'] = int(response['created_at']) if response.get('created_at') else None
-            return response if response else None
+            user = self.__dynamodb.get_item(Key=user_key, ProjectionExpression='suspensions',
+                                            ConsistentRead=True).get('Item') or {}
+            summaries = user.get('suspensions', [])
+            index = next((index for index, summary in enumerate(summaries)
+                          if summary.get('suspension_id') == suspension_id), None)
+
+            transact_items = [{
+                'Update': {
+                    'TableName': self.__dynamodb.name,
+                    'Key': suspension_key,
+                    'UpdateExpression': 'SET status_suspension = :status_suspension',
+                    'ConditionExpression': 'attribute_exists(PK)',
+                    'ExpressionAttributeValues': {':status_suspension': status},
+                }
+            }]
+            if index is not None:
+                transact_items.append({
+                    'Update': {
+                        'TableName': self.__dynamodb.name,
+                        'Key': user_key,
+                        'UpdateExpression': f'SET suspensions[{index}].status_suspension = :status_suspension',
+                        'ConditionExpression': f'suspensions[{index}].suspension_id = :suspension_id',
+                        'ExpressionAttributeValues': {':status_suspension': status, ':suspension_id': suspension_id},
+                    }
+                })
+            self.__transact_write(transact_items)
+
+            user_cache.invalidate(user_id)
+            response = {**summaries[index], 'status_suspension': status} if index is not None else \
+                {'suspension_id': suspension_id, 'status_suspension': status}
+            response['user_id'] = user_id
+            return self.__format_suspension(response)
         except ClientError as e:
             raise e
 
-    def get_all_feedbacks(self) -> Dict or None:
+    def __transact_write(self, transact_items: List[Dict]):
+        for attempt in range(self.TRANSACT_WRITE_ATTEMPTS):
+            try:
+                self.__dynamodb.meta.client.transact_write_items(TransactItems=transact_items)
+                return
+            except ClientError as e:
+                if e.response['Error']['Code'] != 'TransactionCanceledException':
+                    raise e
+                reasons = [reason.get('Code') for reason in e.response.get('CancellationReasons', [])]
+                if 'TransactionConflict' not in reasons or attempt + 1 == self.TRANSACT_WRITE_ATTEMPTS:
+                    raise e
+
+    @staticmethod
+    def __suspension_summary(suspension: Dict) -> Dict:
+        return {
+            'suspension_id': suspension['SK'].split('#')[1],
+            'reason': suspension.get('reason'),
+            'status_suspension': suspension.get('status_suspension'),
+            'date_suspension': suspension.get('date_suspension'),
+            'date_reactivation': suspension.get('date_reactivation'),
+            'created_at': suspension.get('created_at'),
+        }
+
+    @staticmethod
+    def __format_suspension(suspension: Dict) -> Dict:
+        suspension['created_at'] = int(suspension['created_at']) if suspension.get('created_at') else None
+        suspension['date_suspension'] = int(suspension['date_suspension']) if suspension.get('date_suspension') else None
+        suspension['date_reactivation'] = int(suspension['date_reactivation']) if suspension.get('date_reactivation') else None
+        return suspension
+
+    def __format_suspensions(self, user: Dict):
+        """
+        Same shape as get_all_suspensions_by_user_id, None when the user was never suspended
+        """
+        summaries = user.get('suspensions')
+        user['suspensions'] = [self.__format_suspension({**summary, 'user_id': user.get('user_id')})
+                               for summary in summaries] if summaries else None
+
+    def get_all_feedbacks(self, limit: int, cursor: Optional[str] = None, grade: Optional[int] = None) -> Dict:
         try:
-            query = self.__dynamodb.query(
+            query = dict(
                 IndexName='SK_created_at-index',
                 KeyConditionExpression=Key('SK').eq(USER_TABLE_ENTITY.FEEDBACK.value),
+                ScanIndexForward=False,
+                Limit=limit + 1,
             )
-            response = query.get('Items', None)
-            if response:
-                for item in response:
-                    item.pop('SK')
-                    item['feedback_id'] = item.pop('PK')
-                    item['created_at'] = int(item['created_at'])
-                    item['grade'] = int(item['grade'])
-            return response if response else None
+            if grade is not None:
+                query['FilterExpression'] = Attr('grade').eq(grade)
+            start_key = decode_cursor(cursor, self.FEEDBACK_INDEX_KEY_ATTRIBUTES)
+            if start_key:
+                query['ExclusiveStartKey'] = start_key
+
+            page, next_key = take_page(query_items(self.__dynamodb, **query), limit,
+                                       self.FEEDBACK_INDEX_KEY_ATTRIBUTES)
+            for item in page:
+                item.pop('SK')
+                item['feedback_id'] = item.pop('PK')
+                item['created_at'] = int(item['created_at'])
+                item['grade'] = int(item['grade'])
+            return {
+                "feedbacks": page,
+                "next_cursor": encode_cursor(next_key),
+            }
         except ClientError as e:
             raise e
 
+    def get_feedback_summary(self) -> Dict:
+        try:
+            item = self.__dynamodb.get_item(Key=self.FEEDBACK_AGGREGATE_KEY, ConsistentRead=True).get('Item')
+            if not item:
+                item = self.__create_feedback_aggregate()
+            return {
+                "total_count": int(item.get('total_count', 0)),
+                "total_sum": int(item.get('total_sum', 0)),
+                "grades": {str(grade): int(item.get(f'grade_{grade}_count', 0)) for grade in self.FEEDBACK_GRADES},
+            }
+        except ClientError as e:
+            raise e
+
+    def __create_feedback_aggregate(self) -> Dict:
+        """
+        Only used once, to start the aggregate from the feedbacks created before it existed
+        """
+        feedbacks = query_items(
+            self.__dynamodb,
+            IndexName='SK_created_at-index',
+            KeyConditionExpression=Key('SK').eq(USER_TABLE_ENTITY.FEEDBACK.value),
+            ProjectionExpression='grade',
+        )
+        item = {**self.FEEDBACK_AGGREGATE_KEY, 'total_count': 0, 'total_sum': 0,
+                **{f'grade_{grade}_count': 0 for grade in self.FEEDBACK_GRADES}}
+        for feedback in feedbacks:
+            grade = int(feedback['grade'])
+            item['total_count'] += 1
+            item['total_sum'] += grade
+            item[f'grade_{grade}_count'] = item.get(f'grade_{grade}_count', 0) + 1
+        try:
+            self.__dynamodb.put_item(Item=item, ConditionExpression=Attr('PK').not_exists())
+        except ClientError as e:
+            if e.response['Error']['Code'] != 'ConditionalCheckFailedException':
+                raise e
+            item = self.__dynamodb.get_item(Key=self.FEEDBACK_AGGREGATE_KEY, ConsistentRead=True).get('Item')
+        return item
+
     def get_suspension_by_id(self, suspension_id: str) -> Dict or None:
         try:
             query = self.__dynamodb.query(
@@ -347,3 +619,93 @@ class UserDynamodb(UserInterface):
             return response[0] if response else None
         except ClientError as e:
             raise e
+
+    def put_auction_history(self, user_id: str, auctions: List[Dict], backfilled: bool = False) -> None:
+        try:
+            with self.__dynamodb.batch_writer(overwrite_by_pkeys=['PK', 'SK']) as batch:
+                for auction in auctions:
+                    batch.put_item(Item=self.__history_item(user_id, auction))
+                if backfilled:
+                    batch.put_item(Item={'PK': user_id, 'SK': self.HISTORY_BACKFILLED_SK})
+        except ClientError as e:
+            raise e
+
+    def get_auction_history(self, user_id: str, limit: int, cursor: Optional[str] = None,
+                            status_auction: Optional[str] = None) -> Dict:
+        """
+        The backfilled flag tells whether the history was filled from the payments created before it existed,
+        a page following a cursor always is.
+        """
+        try:
+            query = dict(
+                KeyConditionExpression=Key('PK').eq(user_id) & Key('SK').between(
+                    USER_TABLE_ENTITY.HISTORY.value + "#", self.HISTORY_BACKFILLED_SK),
+                ScanIndexForward=False,
+                Limit=limit + 2,
+            )
+            if status_auction:
+                query['FilterExpression'] = Attr('status_auction').eq(status_auction) | Attr('SK').eq(
+                    self.HISTORY_BACKFILLED_SK)
+            start_key = decode_cursor(cursor, self.HISTORY_KEY_ATTRIBUTES)
+            if start_key:
+                query['ExclusiveStartKey'] = start_key
+
+            items = query_items(self.__dynamodb, **query)
+            backfilled = start_key is not None
+            first = next(items, None)
+            if first and first['SK'] == self.HISTORY_BACKFILLED_SK:
+                backfilled = True
+            elif first:
+                items = chain([first], items)
+
+            page, next_key = take_page(items, limit, self.HISTORY_KEY_ATTRIBUTES)
+            return {
+                "auctions": [self.__from_history_item(item) for item in page],
+                "next_cursor": encode_cursor(next_key),
+                "backfilled": backfilled,
+            }
+        except ClientError as e:
+            raise e
+
+    def update_auction_history_payment(self, user_id: str, auction_id: str, end_date: int,
+                                       status_payment: str) -> Optional[Dict]:
+        try:
+            response = self.__dynamodb.update_item(
+                Key={'PK': user_id, 'SK': self.__history_sk(end_date, auction_id)},
+                UpdateExpression='SET status_payment = :status_payment',
+                ConditionExpression=Attr('PK').exists(),
+                ExpressionAttributeValues={':status_payment': status_payment},
+                ReturnValues='ALL_NEW'
+            )
+            return self.__from_history_item(response['Attributes'])
+        except ClientError as e:
+            # Not backfilled yet, the payment status is read when the history is filled
+            if e.response['Error']['Code'] == 'ConditionalCheckFailedException':
+                return None
+            raise e
+
+    @staticmethod
+    def __history_sk(end_date: int, auction_id: str) -> str:
+        return f"{USER_TABLE_ENTITY.HISTORY.value}#{int(end_date):010d}#{auction_id}"
+
+    def __history_item(self, user_id: str, auction: Dict) -> Dict:
+        item = {name: Decimal(str(auction[name])) if isinstance(auction[name], float) else auction[name]
+                for name in self.HISTORY_FIELDS if name in auction}
+        item['PK'] = user_id
+        item['SK'] = self.__history_sk(auction['end_date'], auction['auction_id'])
+        return item
+
+    def __from_history_item(self, item: Dict) -> Dict:
+        # Items written before HISTORY_FIELDS may carry other attributes, named payment_service for service
+        if 'service' not in item and 'payment_service' in item:
+            item['service'] = item['payment_service']
+        item = {'user_id': item['PK'], **{name: item.get(name) for name in self.HISTORY_FIELDS}}
+        item['amount'] = round(float(item['amount']), 2)
+        item['start_amount'] = round(float(item['start_amount']), 2)
+        item['current_amount'] = round(float(item['current_amount']), 2)
+        item['start_date'] = int(item['start_date'])
+        item['end_date'] = int(item['end_date'])
+        item['created_at'] = int(item['created_at'])
+        item['date_payment'] = int(item['date_payment']) if item.get('date_payment') else None
+        item['payment_expires_at'] = int(item['payment_expires_at'])
+        return item
@@ -0,0 +1,122 @@
+import json
+import heapq
+import base64
+from decimal import Decimal
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from src.shared.errors.modules_errors import InvalidParameter
+
+DEFAULT_PAGE_SIZE = 50
+MAX_PAGE_SIZE = 100
+
+
+def encode_cursor(key: Optional[Dict]) -> Optional[str]:
+    """
+    Encode a DynamoDB key as an opaque continuation token.
+    Numeric key attributes of the tables are timestamps, so Decimals are stored as int.
+    """
+    if not key:
+        return None
+    key = json.dumps(key, separators=(',', ':'), default=lambda value: int(value) if isinstance(value, Decimal) else value)
+    return base64.urlsafe_b64encode(key.encode('utf-8')).decode('utf-8')
+
+
+def decode_cursor(cursor: Optional[str], key_attributes: Tuple[str, ...]) -> Optional[Dict]:
+    """
+    Decode a continuation token produced by encode_cursor, checking it holds the expected key attributes.
+    """
+    if not cursor:
+        return None
+    try:
+        key = json.loads(base64.urlsafe_b64decode(cursor.encode('utf-8')).decode('utf-8'))
+    except (ValueError, TypeError):
+        raise InvalidParameter('cursor', 'inválido')
+    if not _is_key(key, key_attributes):
+        raise InvalidParameter('cursor', 'inválido')
+    return key
+
+
+def decode_partitioned_cursor(cursor: Optional[str], partitions: List[str],
+                              key_attributes: Tuple[str, ...]) -> Dict[str, Optional[Dict]]:
+    """
+    Decode a continuation token produced by encode_cursor for a page merged from several partitions.
+    Returns the start key of each partition, None meaning the partition is read from the beginning.
+    """
+    if not cursor:
+        return {partition: None for partition in partitions}
+    try:
+        keys = json.loads(base64.urlsafe_b64decode(cursor.encode('utf-8')).decode('utf-8'))
+    except (ValueError, TypeError):
+        raise InvalidParameter('cursor', 'inválido')
+    if not isinstance(keys, dict) or set(keys.keys()) != set(partitions):
+        raise InvalidParameter('cursor', 'inválido')
+    for key in keys.values():
+        if key is not None and not _is_key(key, key_attributes):
+            raise InvalidParameter('cursor', 'inválido')
+    return keys
+
+
+def _is_key(key, key_attributes: Tuple[str, ...]) -> bool:
+    return isinstance(key, dict) and set(key.keys()) == set(key_attributes)
+
+
+def validate_page_size(limit) -> int:
+    if limit is None or limit == '':
+        return DEFAULT_PAGE_SIZE
+    try:
+        limit = int(limit)
+    except (ValueError, TypeError):
+        raise InvalidParameter('limit', 'deve ser um número')
+    if limit < 1 or limit > MAX_PAGE_SIZE:
+        raise InvalidParameter('limit', f'deve ser entre 1 e {MAX_PAGE_SIZE}')
+    return limit
+
+
+def query_items(table, **kwargs) -> Iterator[Dict]:
+    """
+    Stream every item matched by a query, following LastEvaluatedKey across 1 MB pages.
+    """
+    while True:
+        response = table.query(**kwargs)
+        for item in response.get('Items', []):
+            yield item
+        last_evaluated_key = response.get('LastEvaluatedKey')
+        if not last_evaluated_key:
+            return
+        kwargs['ExclusiveStartKey'] = last_evaluated_key
+
+
+def take_page(items: Iterator[Dict], limit: int, key_attributes: Tuple[str, ...]) -> Tuple[List[Dict], Optional[Dict]]:
+    """
+    Take up to limit items from a stream. Returns the page and the key of its last item
+    when the stream still has items left, or None when it is exhausted.
+    """
+    page = []
+    for item in items:
+        if len(page) == limit:
+            return page, {name: page[-1][name] for name in key_attributes}
+        page.append(item)
+    return page, None
+
+
+def take_merged_page(streams: Dict[str, Iterator[Dict]], sort_key: str, limit: int, key_attributes: Tuple[str, ...],
+                     start_keys: Dict[str, Optional[Dict]]) -> Tuple[List[Dict], Optional[Dict[str, Optional[Dict]]]]:
+    """
+    Take up to limit items from several streams, each already ordered by sort_key, merged in sort_key order.
+    Returns the page and the start key of every partition for the next page, or None when all are exhausted.
+    """
+    merged = heapq.merge(*[_tag_stream(partition, stream) for partition, stream in streams.items()],
+                         key=lambda tagged: tagged[1][sort_key])
+    page = []
+    next_keys = dict(start_keys)
+    for partition, item in merged:
+        if len(page) == limit:
+            return page, next_keys
+        page.append(item)
+        next_keys[partition] = {name: item[name] for name in key_attributes}
+    return page, None
+
+
+def _tag_stream(partition: str, stream: Iterator[Dict]) -> Iterator[Tuple[str, Dict]]:
+    for item in stream:
+        yield partition, item
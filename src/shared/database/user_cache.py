@@ -0,0 +1,64 @@
+import os
+import copy
+import time
+from threading import Lock
+from collections import OrderedDict
+from typing import Dict, Optional
+
+
+class UserCache:
+    """
+    TTL + LRU cache of user items keyed by user_id. Lives at module level so it survives warm
+    invocations of the same Lambda container; other containers only see a write once their entry expires,
+    so the TTL bounds how long a status change can go unnoticed elsewhere.
+    """
+
+    def __init__(self, max_size: int = 256, ttl: float = 30):
+        self.__max_size = max_size
+        self.__ttl = ttl
+        self.__items = OrderedDict()
+        self.__lock = Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, user_id: str) -> Optional[Dict]:
+        with self.__lock:
+            entry = self.__items.get(user_id)
+            if entry is None or entry[0] < time.monotonic():
+                if entry is not None:
+                    del self.__items[user_id]
+                self.misses += 1
+                return None
+            self.__items.move_to_end(user_id)
+            self.hits += 1
+            return copy.deepcopy(entry[1])
+
+    def put(self, user_id: str, user: Dict) -> None:
+        if self.__max_size < 1 or self.__ttl <= 0:
+            return
+        with self.__lock:
+            self.__items[user_id] = (time.monotonic() + self.__ttl, copy.deepcopy(user))
+            self.__items.move_to_end(user_id)
+            while len(self.__items) > self.__max_size:
+                self.__items.popitem(last=False)
+
+    def invalidate(self, user_id: str) -> None:
+        with self.__lock:
+            self.__items.pop(user_id, None)
+
+    def clear(self) -> None:
+        with self.__lock:
+            self.__items.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def stats(self) -> Dict:
+        with self.__lock:
+            return {"hits": self.hits, "misses": self.misses, "size": len(self.__items)}
+
+
+user_cache = UserCache(max_size=int(os.environ.get('USER_CACHE_SIZE', 256)),
+                       ttl=float(os.environ.get('USER_CACHE_TTL', 30)))
+
+token_version_cache = UserCache(max_size=int(os.environ.get('TOKEN_VERSION_CACHE_SIZE', 1024)),
+                                ttl=float(os.environ.get('TOKEN_VERSION_CACHE_TTL', 10)))
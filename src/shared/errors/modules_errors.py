@@ -37,3 +37,8 @@ class UserNotAuthenticated(MainError):
             super().__init__(message)
         else:
             super().__init__(f"Usuário não autenticado.")
+
+
+class DataNotRetrieved(MainError):
+    def __init__(self):
+        super().__init__(f"Não foi possível buscar todos os itens, tente novamente.")
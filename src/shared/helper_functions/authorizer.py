@@ -0,0 +1,108 @@
+from typing import Dict, FrozenSet, Optional
+
+from src.shared.helper_functions.token_authy import TokenAuthy
+from src.shared.errors.modules_errors import UserNotAuthenticated
+from src.shared.structure.interface.user_interface import UserInterface
+from src.shared.structure.enums.user_enum import TYPE_ACCOUNT_USER_ENUM, STATUS_USER_ACCOUNT_ENUM
+
+STAFF_ACCOUNTS = frozenset({TYPE_ACCOUNT_USER_ENUM.ADMIN, TYPE_ACCOUNT_USER_ENUM.MODERATOR})
+ADMIN_ACCOUNTS = frozenset({TYPE_ACCOUNT_USER_ENUM.ADMIN})
+USER_ACCOUNTS = frozenset({TYPE_ACCOUNT_USER_ENUM.USER})
+
+ACTIVE_STATUS = frozenset({STATUS_USER_ACCOUNT_ENUM.ACTIVE})
+PENDING_STATUS = frozenset({STATUS_USER_ACCOUNT_ENUM.PENDING})
+RESTRICTED_STATUS = frozenset({STATUS_USER_ACCOUNT_ENUM.ACTIVE, STATUS_USER_ACCOUNT_ENUM.SUSPENDED,
+                               STATUS_USER_ACCOUNT_ENUM.BANED})
+NOT_DELETED_STATUS = frozenset({STATUS_USER_ACCOUNT_ENUM.ACTIVE, STATUS_USER_ACCOUNT_ENUM.PENDING,
+                                STATUS_USER_ACCOUNT_ENUM.SUSPENDED, STATUS_USER_ACCOUNT_ENUM.BANED})
+
+token_authy = TokenAuthy()
+
+
+class Principal:
+    """
+    The authenticated caller of a request
+    """
+    user_id: str
+    type_account: TYPE_ACCOUNT_USER_ENUM
+    status_account: STATUS_USER_ACCOUNT_ENUM
+    user: Optional[Dict]
+
+    def __init__(self, user_id: str, type_account: TYPE_ACCOUNT_USER_ENUM, status_account: STATUS_USER_ACCOUNT_ENUM,
+                 user: Optional[Dict] = None):
+        self.user_id = user_id
+        self.type_account = type_account
+        self.status_account = status_account
+        self.user = user
+
+
+class Authorizer:
+    """
+    Decode the access token, fetch the user once and check the account type and status allowed by the use case.
+    With trust_claims, a token carrying type_account, status_account and a current token_version is enough to
+    authorize and the user is not fetched; the principal then has no user item.
+    """
+
+    def __init__(self, user_interface: UserInterface):
+        self.__user_interface = user_interface
+
+    def __call__(self, auth: Optional[Dict],
+                 type_accounts: Optional[FrozenSet[TYPE_ACCOUNT_USER_ENUM]] = None,
+                 status_accounts: Optional[FrozenSet[STATUS_USER_ACCOUNT_ENUM]] = None,
+                 type_account_message: str = None,
+                 status_account_message: str = None,
+                 missing_token_message: str = 'Token de acesso não encontrado.',
+                 trust_claims: bool = False) -> Principal:
+        token = auth.get('Authorization') if auth else None
+        if not token:
+            raise UserNotAuthenticated(missing_token_message)
+
+        decoded_token = token_authy.decode_token(token)
+        if not decoded_token:
+            raise UserNotAuthenticated("Token de acesso inválido ou expirado.")
+
+        if trust_claims:
+            principal = self.__principal_from_claims(decoded_token, type_accounts, status_accounts)
+            if principal:
+                return principal
+
+        user = self.__user_interface.get_user_by_id(user_id=decoded_token.get('user_id'))
+        if not user:
+            raise UserNotAuthenticated()
+
+        principal = Principal(
+            user_id=user.get('user_id'),
+            type_account=TYPE_ACCOUNT_USER_ENUM(user.get('type_account')),
+            status_account=STATUS_USER_ACCOUNT_ENUM(user.get('status_account')),
+            user=user,
+        )
+        if type_accounts is not None and principal.type_account not in type_accounts:
+            raise UserNotAuthenticated(type_account_message)
+        if status_accounts is not None and principal.status_account not in status_accounts:
+            raise UserNotAuthenticated(status_account_message)
+        return principal
+
+    def __principal_from_claims(self, decoded_token: Dict,
+                                type_accounts: Optional[FrozenSet[TYPE_ACCOUNT_USER_ENUM]],
+                                status_accounts: Optional[FrozenSet[STATUS_USER_ACCOUNT_ENUM]]) -> Optional[Principal]:
+        """
+        Claims are only trusted to grant access. Tokens without claims, with claims that would be refused or
+        with an outdated token_version fall back to the user fetch, which decides with the stored account.
+        """
+        if 'token_version' not in decoded_token:
+            return None
+        try:
+            principal = Principal(
+                user_id=decoded_token.get('user_id'),
+                type_account=TYPE_ACCOUNT_USER_ENUM(decoded_token.get('type_account')),
+                status_account=STATUS_USER_ACCOUNT_ENUM(decoded_token.get('status_account')),
+            )
+        except ValueError:
+            return None
+        if type_accounts is not None and principal.type_account not in type_accounts:
+            return None
+        if status_accounts is not None and principal.status_account not in status_accounts:
+            return None
+        if self.__user_interface.get_token_version(user_id=principal.user_id) != decoded_token.get('token_version'):
+            return None
+        return principal
@@ -0,0 +1,23 @@
+from threading import Lock
+from typing import Dict
+
+_clients: Dict[str, object] = {}
+_clients_lock = Lock()
+
+
+def get_client(service_name: str):
+    """
+    boto3 client shared by the whole container, created on first use.
+    Loading a service model takes tens of milliseconds, so request paths that never reach
+    a service, like validation failures, do not pay for it during the cold start.
+    """
+    client = _clients.get(service_name)
+    if client is None:
+        with _clients_lock:
+            client = _clients.get(service_name)
+            if client is None:
+                import boto3
+
+                client = boto3.client(service_name)
+                _clients[service_name] = client
+    return client
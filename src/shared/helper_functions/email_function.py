@@ -1,17 +1,104 @@
 import os
-import smtplib
-from email.mime.text import MIMEText
-from email.mime.multipart import MIMEMultipart
+import time
+from queue import Queue
+from threading import Lock
+from typing import Dict, List, Optional, Tuple
 
+from src.shared.helper_functions.email_templates import templates, default_footer
 
-default_footer = """
-    <div class="TextsBox" style="color: #949393; word-wrap: break-word;">
-      <h2>Atenciosamente,</h2>
-      <h2>
-        <b>IMT</b>
-      </h2>
-    </div>
-"""
+
+class SmtpConnection:
+    """
+    Authenticated SMTP session kept open across sends while the Lambda container stays warm.
+    A session idle for longer than keepalive is checked with NOOP before use, and a send that finds the
+    session dropped reconnects once and retries. smtplib, with the ssl and email packages it pulls in,
+    is only imported by the methods that talk to the server, so importing this module stays cheap.
+    """
+
+    def __init__(self, host: str, port: int, user: str, password: str, keepalive: float = 30):
+        self.__host = host
+        self.__port = port
+        self.__user = user
+        self.__password = password
+        self.__keepalive = keepalive
+        self.__server = None
+        self.__last_used = 0.0
+        self.__lock = Lock()
+
+    def send(self, sender: str, to, message: str) -> Dict[str, Tuple[int, bytes]]:
+        """
+        Returns the recipients refused by the server, like smtplib.SMTP.sendmail
+        """
+        import smtplib
+
+        reconnect_errors = (smtplib.SMTPServerDisconnected, smtplib.SMTPConnectError, ConnectionError, TimeoutError)
+        with self.__lock:
+            for attempt in range(2):
+                server = self.__session()
+                try:
+                    refused = server.sendmail(sender, to, message)
+                    self.__last_used = time.monotonic()
+                    return refused
+                except smtplib.SMTPResponseException as e:
+                    if e.smtp_code != 421 or attempt:
+                        raise e
+                    self.__close()
+                except reconnect_errors as e:
+                    self.__close()
+                    if attempt:
+                        raise e
+
+    def close(self):
+        with self.__lock:
+            self.__close()
+
+    def __session(self):
+        import smtplib
+
+        if self.__server and time.monotonic() - self.__last_used > self.__keepalive:
+            try:
+                if self.__server.noop()[0] != 250:
+                    self.__close()
+            except (smtplib.SMTPException, OSError):
+                self.__close()
+        if not self.__server:
+            server = smtplib.SMTP(self.__host, self.__port)
+            try:
+                server.starttls()
+                server.login(self.__user, self.__password)
+            except Exception as e:
+                server.close()
+                raise e
+            self.__server = server
+            self.__last_used = time.monotonic()
+        return self.__server
+
+    def __close(self):
+        import smtplib
+
+        if self.__server:
+            try:
+                self.__server.quit()
+            except (smtplib.SMTPException, OSError):
+                self.__server.close()
+            self.__server = None
+
+
+_connections: Dict[Tuple[str, int, str, int], SmtpConnection] = {}
+_connections_lock = Lock()
+
+
+def get_smtp_connection(host: str, port: int, user: str, password: str, slot: int = 0) -> SmtpConnection:
+    """
+    Connections live for the whole container, one per server, account and slot.
+    Concurrent broadcasts use one slot per worker so batches do not queue on the same session.
+    """
+    key = (host, port, user, slot)
+    with _connections_lock:
+        if key not in _connections:
+            _connections[key] = SmtpConnection(host, port, user, password,
+                                               keepalive=float(os.environ.get('EMAIL_KEEPALIVE', 30)))
+        return _connections[key]
 
 
 class Email:
@@ -21,70 +108,74 @@ class Email:
         self.__password = os.environ.get('EMAIL_PASSWORD')
         self.__host = os.environ.get('EMAIL_HOST')
         self.__port = int(os.environ.get('EMAIL_PORT'))
+        self.__batch_size = int(os.environ.get('EMAIL_BCC_BATCH_SIZE', 50))
+        self.__concurrency = int(os.environ.get('EMAIL_BROADCAST_CONCURRENCY', 4))
+        self.__batch_retries = int(os.environ.get('EMAIL_BATCH_RETRIES', 2))
 
-    def __connect(self):
-        self.__server = smtplib.SMTP(self.__host, self.__port)
-        self.__server.starttls()
-        self.__server.login(self.__email, self.__password)
+    def send_email(self, to, subject: str):
+        message = self.__message(", ".join(to) if isinstance(to, list) else to, subject)
+        connection = get_smtp_connection(self.__host, self.__port, self.__email, self.__password)
+        connection.send(self.__email, to, message)
 
-    def __disconnect(self):
-        self.__server.quit()
+    def broadcast(self, to: List[str], subject: str) -> Dict:
+        """
+        Send the current template to many recipients in BCC batches, without exposing the addresses.
+        Batches are sent concurrently over reused connections and retried on failure.
+        Returns how many recipients were delivered and the addresses that failed.
+        """
+        import smtplib
+        from concurrent.futures import ThreadPoolExecutor
 
-    def send_email(self, to, subject: str):
-        try:
-            message = MIMEMultipart()
-            message['From'] = self.__email
-            message['To'] = ", ".join(to) if isinstance(to, list) else to
-            message['Subject'] = subject
-            message.attach(MIMEText(self.__email_body, 'html'))
-            self.__connect()
-            self.__server.sendmail(self.__email, to, message.as_string())
-            self.__disconnect()
-        except Exception as e:
-            if self.__server:
-                self.__disconnect()
-            raise e
+        recipients = list(dict.fromkeys(to))
+        if not recipients:
+            return {"delivered": 0, "failed": []}
+
+        message = self.__message(self.__email, subject)
+
+        batches = [recipients[i:i + self.__batch_size] for i in range(0, len(recipients), self.__batch_size)]
+        workers = max(1, min(self.__concurrency, len(batches)))
+        slots = Queue()
+        for slot in range(workers):
+            slots.put(slot)
+
+        def send_batch(batch: List[str]) -> List[str]:
+            slot = slots.get()
+            try:
+                connection = get_smtp_connection(self.__host, self.__port, self.__email, self.__password, slot)
+                for attempt in range(self.__batch_retries + 1):
+                    try:
+                        refused = connection.send(self.__email, batch, message)
+                        return list(refused or {})
+                    except smtplib.SMTPRecipientsRefused as e:
+                        return list(e.recipients)
+                    except (smtplib.SMTPException, OSError):
+                        if attempt == self.__batch_retries:
+                            return batch
+                        time.sleep(0.5 * 2 ** attempt)
+            finally:
+                slots.put(slot)
+
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            failed = [recipient for refused in executor.map(send_batch, batches) for recipient in refused]
+
+        return {"delivered": len(recipients) - len(failed), "failed": failed}
 
     def set_email_template(self, title, content: str,
-                           footer: str = default_footer):
-        self.__email_body = f"""
-        <html lang="pt-br" charset="UTF-8">
-        <head>
-        </head>
-        <body
-            style="margin: 0; padding: 0; display: flex; align-items: center; justify-content: center; min-height: 75vh; background-color: white; font-family: system-ui, -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, Oxygen, Ubuntu, Cantarell, 'Open Sans', 'Helvetica Neue', sans-serif;">
-            <table class="main"
-                style="width: 50vw; max-width: 600px; background-color: #E9E9E9; border-radius: 10px; box-shadow: 0px 4px 10px rgba(0, 0, 0, 0.25); overflow: hidden;">
-                <tr>
-                    <td>
-                        <table class="TittleBox" style="width: 100%; background-color: #2C4FBC; border-radius: 10px 10px 0 0;">
-                            <tr>
-                                <td style="text-align: center; padding: 20px;">
-                                    <img alt="Apae Leilão Logo"
-                                        src="https://apaeleilaoimtphotos.s3.sa-east-1.amazonaws.com/logo-apaeleilao/logo-apaeleilao-branco.jpg" 
-                                        style="width: 50%;"/>
-                                    <h1 style="color: #FFFFFF; margin-top: 10px;"><b>{title}</b></h1>
-                                </td>
-                            </tr>
-                        </table>
-                        <table class="ContentBox" style="width: 100%; background-color: #FFFFFF;">
-                            <tr>
-                                <td style="text-align: center; padding: 20px;">
-                                    {content}
-                                </td>
-                            </tr>
-                        </table>
-                        <table class="BottomBox"
-                            style="width: 100%; background-color: #FFFFFF; border-top: 1px solid gray; border-radius: 0 0 10px 10px;">
-                            <tr>
-                                <td style="text-align: center; padding: 20px;">
-                                    {footer}
-                                </td>
-                            </tr>
-                        </table>
-                    </td>
-                </tr>
-            </table>
-        </body>
-        </html>
+                           footer: str = default_footer, cache_key: Optional[Tuple] = None):
         """
+        Render the email layout. Bodies sent many times pass a (template, auction_id, status) cache_key
+        so they are rendered once per container; the key must change whenever the title, content or footer do.
+        """
+        self.__email_body = templates.render('layout', cache_key=cache_key, title=title, content=content,
+                                             footer=footer)
+
+    def __message(self, to: str, subject: str) -> str:
+        from email.mime.text import MIMEText
+        from email.mime.multipart import MIMEMultipart
+
+        message = MIMEMultipart()
+        message['From'] = self.__email
+        message['To'] = to
+        message['Subject'] = subject
+        message.attach(MIMEText(self.__email_body, 'html'))
+        return message.as_string()
@@ -0,0 +1,160 @@
+import os
+from threading import Lock
+from string import Template
+from collections import OrderedDict
+from typing import Dict, Hashable, Optional, Tuple
+
+
+default_footer = """
+    <div class="TextsBox" style="color: #949393; word-wrap: break-word;">
+      <h2>Atenciosamente,</h2>
+      <h2>
+        <b>IMT</b>
+      </h2>
+    </div>
+"""
+
+
+def _compile(source: str) -> Tuple[Tuple[str, ...], Tuple[str, ...]]:
+    """
+    Split a string.Template source once into its literal chunks and placeholder names.
+    Rendering is then a single join, as cheap as the f-strings it replaces.
+    """
+    chunks, names = [], []
+    literal, position = '', 0
+    for match in Template.pattern.finditer(source):
+        literal += source[position:match.start()]
+        position = match.end()
+        if match.group('escaped') is not None:
+            literal += '$'
+            continue
+        name = match.group('named') or match.group('braced')
+        if not name:
+            raise ValueError(f"Invalid placeholder in template at {match.start()}")
+        chunks.append(literal)
+        names.append(name)
+        literal = ''
+    chunks.append(literal + source[position:])
+    return tuple(chunks), tuple(names)
+
+
+def _substitute(compiled: Tuple[Tuple[str, ...], Tuple[str, ...]], values: Dict) -> str:
+    chunks, names = compiled
+    parts = [chunks[0]]
+    for name, chunk in zip(names, chunks[1:]):
+        parts.append(str(values[name]))
+        parts.append(chunk)
+    return ''.join(parts)
+
+
+class TemplateRegistry:
+    """
+    Email templates compiled once per container and rendered by substitution.
+    Bodies that go out many times, like a broadcast split in several messages, can be rendered
+    with a cache key and are then kept in a bounded LRU cache. The values are not part of the key:
+    a caller must put in its cache key everything its values vary with, or it gets the body cached before.
+    """
+
+    def __init__(self, max_size: int = 128):
+        self.__templates: Dict[str, Tuple[Tuple[str, ...], Tuple[str, ...]]] = {}
+        self.__rendered = OrderedDict()
+        self.__max_size = max_size
+        self.__lock = Lock()
+
+    def register(self, name: str, source: str):
+        self.__templates[name] = _compile(source)
+
+    def render(self, name: str, cache_key: Optional[Tuple[Hashable, ...]] = None, **values) -> str:
+        if cache_key is None or self.__max_size < 1:
+            return _substitute(self.__templates[name], values)
+
+        key = (name,) + tuple(cache_key)
+        with self.__lock:
+            if key in self.__rendered:
+                self.__rendered.move_to_end(key)
+                return self.__rendered[key]
+
+        rendered = _substitute(self.__templates[name], values)
+        with self.__lock:
+            self.__rendered[key] = rendered
+            self.__rendered.move_to_end(key)
+            while len(self.__rendered) > self.__max_size:
+                self.__rendered.popitem(last=False)
+        return rendered
+
+    def clear(self):
+        with self.__lock:
+            self.__rendered.clear()
+
+
+templates = TemplateRegistry(max_size=int(os.environ.get('EMAIL_RENDER_CACHE_SIZE', 128)))
+
+templates.register('layout', """
+        <html lang="pt-br" charset="UTF-8">
+        <head>
+        </head>
+        <body
+            style="margin: 0; padding: 0; display: flex; align-items: center; justify-content: center; min-height: 75vh; background-color: white; font-family: system-ui, -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, Oxygen, Ubuntu, Cantarell, 'Open Sans', 'Helvetica Neue', sans-serif;">
+            <table class="main"
+                style="width: 50vw; max-width: 600px; background-color: #E9E9E9; border-radius: 10px; box-shadow: 0px 4px 10px rgba(0, 0, 0, 0.25); overflow: hidden;">
+                <tr>
+                    <td>
+                        <table class="TittleBox" style="width: 100%; background-color: #2C4FBC; border-radius: 10px 10px 0 0;">
+                            <tr>
+                                <td style="text-align: center; padding: 20px;">
+                                    <img alt="Apae Leilão Logo"
+                                        src="https://apaeleilaoimtphotos.s3.sa-east-1.amazonaws.com/logo-apaeleilao/logo-apaeleilao-branco.jpg"
+                                        style="width: 50%;"/>
+                                    <h1 style="color: #FFFFFF; margin-top: 10px;"><b>${title}</b></h1>
+                                </td>
+                            </tr>
+                        </table>
+                        <table class="ContentBox" style="width: 100%; background-color: #FFFFFF;">
+                            <tr>
+                                <td style="text-align: center; padding: 20px;">
+                                    ${content}
+                                </td>
+                            </tr>
+                        </table>
+                        <table class="BottomBox"
+                            style="width: 100%; background-color: #FFFFFF; border-top: 1px solid gray; border-radius: 0 0 10px 10px;">
+                            <tr>
+                                <td style="text-align: center; padding: 20px;">
+                                    ${footer}
+                                </td>
+                            </tr>
+                        </table>
+                    </td>
+                </tr>
+            </table>
+        </body>
+        </html>
+        """)
+
+templates.register('auction_card', """
+                <div class="TextsBox" style="display: flex; justify-content: center; align-items: center;">
+                    <div style="border: 1px solid black; border-radius: 10px; padding-bottom: 16px;">
+                        <img style="border-radius: 10px 10px 0 0;" width="250" src="${image}" alt="${image_alt}">
+                        <div style="color: #949393; text-align: center; margin-bottom: 16px;">
+                            <h2 style="color:#000000;">${title}</h2>
+                            <p style="color:#000000">Data: ${date}</p>
+                            <label style="color: ${label_color}; font-weight: bold; font-size: 24px;">${label}</label>
+                        </div>
+                        ${action}
+                    </div>
+                </div>
+                """)
+
+templates.register('auction_card_link', """<a style="background-color: yellow; border: none; padding: 6px 12px; font-size: 16px; font-weight: bold; border-radius: 25px; margin: 8px; color: black;" href="${url}"> Ir para o Leilão </a>""")
+
+templates.register('auction_winner', """
+            <h1>Leilão<span style="font-weight: bold;">${title} LOTE[${auction_id}]</span> Finalizado!</h1>
+            <p>Parabéns você ganhou o leilão!</p>
+            <p>Para mais informações acesse o site.</p>
+            """)
+
+templates.register('auction_loser', """
+            <h1>Leilão<span style="font-weight: bold;">LOTE[${auction_id}]</span> Finalizado!</h1>
+            <p>Infelizmente você não ganhou o leilão.</p>
+            <p>Para mais informações acesse o site.</p>
+            """)
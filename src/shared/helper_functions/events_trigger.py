@@ -1,14 +1,20 @@
 import os
 import json
-import boto3
 from datetime import datetime
 from typing import Dict, Optional
 
+from src.shared.helper_functions.aws_clients import get_client
+
 
 class EventsTrigger:
-    def __init__(self):
-        self.__events = boto3.client('events')
-        self.__lambda = boto3.client('lambda')
+
+    @property
+    def __events(self):
+        return get_client('events')
+
+    @property
+    def __lambda(self):
+        return get_client('lambda')
 
     def create_trigger(self, rule_name: str, lambda_function: str, date: int, payload: Optional[Dict] = None):
 
@@ -0,0 +1,50 @@
+import io
+import importlib.util
+from typing import Dict, Optional, Tuple
+
+IMAGE_SIZES = {
+    'thumbnail': 200,
+    'card': 500,
+    'full': 1600,
+}
+DERIVATIVE_EXTENSIONS = ('webp', 'jpg')
+
+
+def pillow_available() -> bool:
+    return importlib.util.find_spec('PIL') is not None
+
+
+def derivative_format() -> Tuple[str, str, str]:
+    """
+    WebP when the installed Pillow can write it, JPEG otherwise: (Pillow format, extension, content type)
+    """
+    from PIL import features
+
+    if features.check('webp'):
+        return 'WEBP', 'webp', 'image/webp'
+    return 'JPEG', 'jpg', 'image/jpeg'
+
+
+def create_derivatives(data: bytes) -> Optional[Dict[str, Tuple[bytes, str]]]:
+    """
+    Resize an image to every size of IMAGE_SIZES, keeping its aspect ratio and never upscaling.
+    Returns the encoded bytes and content type of each size, or None when Pillow is not installed.
+    """
+    if not pillow_available():
+        return None
+    from PIL import Image, ImageOps
+
+    image_format, _, content_type = derivative_format()
+    with Image.open(io.BytesIO(data)) as original:
+        original = ImageOps.exif_transpose(original)
+        if original.mode not in ('RGB', 'RGBA') or (original.mode == 'RGBA' and image_format == 'JPEG'):
+            original = original.convert('RGB')
+
+        derivatives = {}
+        for size, max_edge in IMAGE_SIZES.items():
+            image = original.copy()
+            image.thumbnail((max_edge, max_edge), Image.LANCZOS)
+            output = io.BytesIO()
+            image.save(output, format=image_format, quality=82, optimize=True)
+            derivatives[size] = (output.getvalue(), content_type)
+        return derivatives
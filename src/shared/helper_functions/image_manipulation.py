@@ -1,36 +1,293 @@
+import io
 import os
-import boto3
 import base64
+import binascii
+from typing import Dict, Iterator, List
+
+from src.shared.errors.modules_errors import DataNotFound, InvalidParameter
+from src.shared.helper_functions.aws_clients import get_client
+from src.shared.helper_functions.image_derivatives import IMAGE_SIZES, DERIVATIVE_EXTENSIONS, create_derivatives, \
+    derivative_format, pillow_available
+
+AUCTION_FOLDER = 'auctions/'
+DELETE_BATCH_SIZE = 1000
+
+
+def auction_prefix(auction_id: str) -> str:
+    return f'{AUCTION_FOLDER}{auction_id}/'
+
+
+def image_key(auction_id: str, image_id: str) -> str:
+    return f'{auction_prefix(auction_id)}{image_id}'
+
+
+def derivative_key(auction_id: str, image_id: str, size: str, extension: str) -> str:
+    return f'{auction_prefix(auction_id)}{size}/{image_id}.{extension}'
+
+
+def derivative_keys(auction_id: str, image_id: str) -> List[str]:
+    """
+    Every key a derivative of the image may have been stored under, whatever format Pillow wrote
+    """
+    return [derivative_key(auction_id, image_id, size, extension)
+            for size in IMAGE_SIZES for extension in DERIVATIVE_EXTENSIONS]
+
+
+def object_url(bucket: str, key: str) -> str:
+    return f"https://{bucket}.s3.sa-east-1.amazonaws.com/{key}"
+
+
+class _Base64Reader(io.RawIOBase):
+    """
+    File-like view of a base64 string decoded chunk by chunk, so an upload never holds
+    the whole decoded image next to the encoded one. Characters outside the alphabet, like
+    line breaks, are skipped the same way base64.b64decode skips them.
+    """
+    CHUNK_SIZE = 256 * 1024
+
+    def __init__(self, encoded: str):
+        super().__init__()
+        self.__encoded = encoded
+        self.__position = 0
+        self.__pending = ''
+        self.__decoded = b''
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, buffer) -> int:
+        while len(self.__decoded) < len(buffer) and (self.__position < len(self.__encoded) or self.__pending):
+            chunk = self.__encoded[self.__position:self.__position + self.CHUNK_SIZE]
+            self.__position += self.CHUNK_SIZE
+            pending = self.__pending + ''.join(chunk.split())
+            if self.__position < len(self.__encoded):
+                cut = len(pending) - len(pending) % 4
+            else:
+                cut = len(pending)
+            self.__pending = pending[cut:]
+            try:
+                self.__decoded += base64.b64decode(pending[:cut])
+            except binascii.Error:
+                raise InvalidParameter('Imagem', 'não é um base64 válido')
+        size = min(len(buffer), len(self.__decoded))
+        buffer[:size] = self.__decoded[:size]
+        self.__decoded = self.__decoded[size:]
+        return size
 
 
 class ImageManipulation:
+    """
+    S3 storage of the auction images. An instance only holds configuration read once from the
+    environment and every key is derived from its arguments, so one instance can be reused by a
+    warm container and shared by threads.
+    """
+    UPLOAD_CONTENT_TYPES = ('image/jpeg', 'image/png', 'image/webp')
+
     def __init__(self):
-        self.__s3 = boto3.client('s3')
-        self.__auction_folder = 'auctions/'
         self.__bucket = os.environ.get('BUCKET_NAME')
+        self.__upload_concurrency = int(os.environ.get('IMAGE_UPLOAD_CONCURRENCY', 8))
+        self.__upload_expires_in = int(os.environ.get('IMAGE_UPLOAD_EXPIRES_IN', 900))
+        self.__upload_max_size = int(os.environ.get('IMAGE_UPLOAD_MAX_SIZE', 10 * 1024 * 1024))
+
+    @property
+    def __s3(self):
+        return get_client('s3')
 
     def create_auction_folder(self, auction_id: str):
         try:
-            auction_folder_key = f'{self.__auction_folder}{auction_id}/'
-            self.__s3.put_object(ACL='public-read-write', Bucket=self.__bucket, Key=auction_folder_key, Body='')
+            self.__s3.put_object(ACL='public-read-write', Bucket=self.__bucket, Key=auction_prefix(auction_id), Body='')
         except Exception as e:
             raise e
 
-    def upload_auction_image(self, auction_id: str, image_id: str, image_body: str, content_type: str):
+    def upload_auction_image(self, auction_id: str, image_id: str, image_body: str, content_type: str) -> Dict:
+        """
+        Upload an image and its derivatives, built from the decoded bytes at upload time.
+        Returns the url of the image and the url of each size. Without Pillow the image is streamed
+        to S3 while it is decoded and every size points to the original image.
+        """
+        from boto3.s3.transfer import TransferConfig
+
         try:
-            image_key = f'{self.__auction_folder}{auction_id}/{image_id}'
-            self.__s3.put_object(ACL='public-read-write', Bucket=self.__bucket, Key=image_key, Body=base64.b64decode(image_body),
-                                 ContentType=content_type)
-            self.__auction_folder = f'{self.__auction_folder}{auction_id}/'
-            return self.get_image_url(image_id)
+            url = self.get_image_url(auction_id, image_id)
+            reader = _Base64Reader(image_body)
+            data = reader.read() if pillow_available() else None
+            self.__s3.upload_fileobj(reader if data is None else io.BytesIO(data), self.__bucket,
+                                     image_key(auction_id, image_id),
+                                     ExtraArgs={'ACL': 'public-read-write', 'ContentType': content_type},
+                                     Config=TransferConfig(max_concurrency=4))
+            if data is None:
+                return {'image_body': url, 'sizes': {size: url for size in IMAGE_SIZES}}
+            return {'image_body': url, 'sizes': self.__store_derivatives(auction_id, image_id, data)}
         except Exception as e:
             raise e
 
-    def delete_auction_image(self, image_name):
-        pass
+    def upload_auction_images(self, auction_id: str, images: List[Dict]) -> List[Dict]:
+        """
+        Upload the folder marker and every image of an auction, with its derivatives, on a bounded thread
+        pool. Returns what upload_auction_image returns, in the order of images. When an upload fails,
+        everything uploaded for the images is deleted before the error is raised.
+        """
+        from concurrent.futures import ThreadPoolExecutor
+
+        workers = max(1, min(self.__upload_concurrency, len(images) + 1))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            folder = executor.submit(self.create_auction_folder, auction_id)
+            uploads = [executor.submit(self.upload_auction_image, auction_id=auction_id,
+                                       image_id=image.get('image_id'), image_body=image.get('image_body'),
+                                       content_type=image.get('content_type'))
+                       for image in images]
+
+        error = folder.exception()
+        uploaded = []
+        for upload in uploads:
+            if upload.exception():
+                error = error or upload.exception()
+            else:
+                uploaded.append(upload.result())
+        if error:
+            # A failed image may still have left its original or some derivatives behind
+            self.discard_auction_upload(auction_id, [image.get('image_id') for image in images])
+            raise error
+        return uploaded
+
+    def create_upload_form(self, auction_id: str, image_id: str, content_type: str) -> Dict:
+        """
+        Presigned POST policy letting the client upload one image straight to S3. The policy pins the key,
+        the content type and a maximum size, and expires after IMAGE_UPLOAD_EXPIRES_IN seconds.
+        """
+        post = self.__s3.generate_presigned_post(
+            Bucket=self.__bucket,
+            Key=image_key(auction_id, image_id),
+            Fields={'acl': 'public-read-write', 'Content-Type': content_type},
+            Conditions=[
+                {'acl': 'public-read-write'},
+                {'Content-Type': content_type},
+                ['content-length-range', 1, self.__upload_max_size],
+            ],
+            ExpiresIn=self.__upload_expires_in,
+        )
+        return {
+            'image_id': image_id,
+            'url': post['url'],
+            'fields': post['fields'],
+            'expires_in': self.__upload_expires_in,
+        }
+
+    def confirm_auction_images(self, auction_id: str, image_ids: List[str]) -> List[Dict]:
+        """
+        Check that the images uploaded through create_upload_form exist, with HeadObject calls run
+        concurrently. Returns the images as stored in the auction, in the order of image_ids.
+        """
+        from concurrent.futures import ThreadPoolExecutor
+        from botocore.exceptions import ClientError
+
+        def head(image_id: str) -> Dict:
+            try:
+                response = self.__s3.head_object(Bucket=self.__bucket, Key=image_key(auction_id, image_id))
+            except ClientError as e:
+                if e.response['Error']['Code'] in ('404', 'NoSuchKey', 'NotFound'):
+                    raise DataNotFound(f'Imagem {image_id}')
+                raise e
+            return {
+                'image_id': image_id,
+                'content_type': response.get('ContentType'),
+                'image_body': self.get_image_url(auction_id, image_id),
+            }
+
+        workers = max(1, min(self.__upload_concurrency, len(image_ids)))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(head, image_ids))
+
+    def create_auction_derivatives(self, auction_id: str, image_ids: List[str]) -> List[Dict[str, str]]:
+        """
+        Store a thumbnail, card and full version of every image uploaded through create_upload_form,
+        read back from S3 and processed concurrently. Returns the url of each size per image, in the
+        order of image_ids. Without Pillow no derivative is stored and every size points to the original image.
+        """
+        if not pillow_available():
+            return [{size: self.get_image_url(auction_id, image_id) for size in IMAGE_SIZES} for image_id in image_ids]
+        from concurrent.futures import ThreadPoolExecutor
+
+        def derive(image_id: str) -> Dict[str, str]:
+            original = self.__s3.get_object(Bucket=self.__bucket, Key=image_key(auction_id, image_id))
+            return self.__store_derivatives(auction_id, image_id, original['Body'].read())
+
+        workers = max(1, min(self.__upload_concurrency, len(image_ids)))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(derive, image_ids))
+
+    def __store_derivatives(self, auction_id: str, image_id: str, data: bytes) -> Dict[str, str]:
+        _, extension, _ = derivative_format()
+        try:
+            derivatives = create_derivatives(data)
+        except (OSError, ValueError):
+            raise InvalidParameter('Imagem', 'não é uma imagem válida')
+        for size, (body, content_type) in derivatives.items():
+            self.__s3.put_object(ACL='public-read-write', Bucket=self.__bucket, Body=body,
+                                 Key=derivative_key(auction_id, image_id, size, extension),
+                                 ContentType=content_type, CacheControl='public, max-age=31536000, immutable')
+        return {size: object_url(self.__bucket, derivative_key(auction_id, image_id, size, extension))
+                for size in derivatives}
+
+    def discard_auction_upload(self, auction_id: str, image_ids: List[str]):
+        """
+        Delete what upload_auction_images and create_auction_derivatives wrote for an auction,
+        the images, their derivatives and the folder marker
+        """
+        keys = [key for image_id in image_ids for key in [image_key(auction_id, image_id),
+                                                          *derivative_keys(auction_id, image_id)]]
+        keys.append(auction_prefix(auction_id))
+        self.__delete_keys(keys)
+
+    def delete_auction_image(self, auction_id: str, image_id: str) -> List[str]:
+        """
+        Delete an image and its derivatives. Returns the keys S3 could not delete.
+        """
+        return self.__delete_keys([image_key(auction_id, image_id), *derivative_keys(auction_id, image_id)])
+
+    def delete_auction_folder(self, auction_id: str) -> List[str]:
+        """
+        Delete every object under the auction prefix, one DeleteObjects call per listed page.
+        Returns the keys S3 could not delete.
+        """
+        failed = []
+        paginator = self.__s3.get_paginator('list_objects_v2')
+        for page in paginator.paginate(Bucket=self.__bucket, Prefix=auction_prefix(auction_id),
+                                       PaginationConfig={'PageSize': DELETE_BATCH_SIZE}):
+            failed.extend(self.__delete_keys([item['Key'] for item in page.get('Contents', [])]))
+        return failed
+
+    def list_auction_objects(self) -> Iterator[Dict]:
+        """
+        Stream every object stored under the auctions prefix, 1000 per ListObjectsV2 page,
+        with the auction id taken from its key
+        """
+        paginator = self.__s3.get_paginator('list_objects_v2')
+        for page in paginator.paginate(Bucket=self.__bucket, Prefix=AUCTION_FOLDER,
+                                       PaginationConfig={'PageSize': DELETE_BATCH_SIZE}):
+            for item in page.get('Contents', []):
+                yield {
+                    'key': item['Key'],
+                    'auction_id': item['Key'][len(AUCTION_FOLDER):].split('/', 1)[0],
+                    'size': item['Size'],
+                    'last_modified': item['LastModified'],
+                }
+
+    def delete_objects(self, keys: List[str]) -> List[str]:
+        """
+        Delete the keys, 1000 per DeleteObjects call. Returns the keys S3 could not delete.
+        """
+        return self.__delete_keys(keys)
 
-    def delete_auction_folder(self, auction_id):
-        pass
+    def get_image_url(self, auction_id: str, image_id: str) -> str:
+        return object_url(self.__bucket, image_key(auction_id, image_id))
 
-    def get_image_url(self, image_id):
-        return f"https://{self.__bucket}.s3.sa-east-1.amazonaws.com/" + self.__auction_folder + image_id
+    def __delete_keys(self, keys: List[str]) -> List[str]:
+        failed = []
+        for start in range(0, len(keys), DELETE_BATCH_SIZE):
+            response = self.__s3.delete_objects(Bucket=self.__bucket, Delete={
+                'Objects': [{'Key': key} for key in keys[start:start + DELETE_BATCH_SIZE]],
+                'Quiet': True,
+            })
+            failed.extend(error['Key'] for error in response.get('Errors', []))
+        return failed
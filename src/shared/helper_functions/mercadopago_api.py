@@ -1,15 +1,34 @@
 import os
-import mercadopago
+from threading import Lock
 
 from src.shared.structure.entities.payment import Payment
 from src.shared.helper_functions.time_manipulation import TimeManipulation
 
+_sdk = None
+_sdk_lock = Lock()
+
+
+def get_mercadopago_sdk():
+    """
+    MercadoPago SDK shared by the whole container, imported and created on first use
+    """
+    global _sdk
+    if _sdk is None:
+        with _sdk_lock:
+            if _sdk is None:
+                import mercadopago
+
+                _sdk = mercadopago.SDK(os.environ.get('MERCADO_PAGO_ACCESS_TOKEN'))
+    return _sdk
+
 
 class MercadoPago:
     def __init__(self):
         self.__payment_preference = None
-        self.__access_token = os.environ.get('MERCADO_PAGO_ACCESS_TOKEN')
-        self.__mp = mercadopago.SDK(self.__access_token)
+
+    @property
+    def __mp(self):
+        return get_mercadopago_sdk()
 
     def create_payment(self):
         payment = self.__mp.payment().create(self.__payment_preference)
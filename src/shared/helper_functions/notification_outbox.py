@@ -0,0 +1,207 @@
+import os
+import json
+from queue import Queue, Empty
+from abc import ABC, abstractmethod
+from typing import TYPE_CHECKING, Dict, List, Optional, Tuple
+
+from src.shared.helper_functions.aws_clients import get_client
+from src.shared.helper_functions.email_templates import default_footer
+
+if TYPE_CHECKING:
+    from src.shared.helper_functions.email_function import Email
+
+
+class Notification:
+    """
+    An email waiting to be sent. A broadcast goes to every recipient in BCC batches,
+    otherwise every recipient sees the others in the To header.
+    cache_key identifies bodies sent many times, see Email.set_email_template.
+    """
+    to: List[str]
+    subject: str
+    title: str
+    content: str
+    footer: str
+    broadcast: bool
+    cache_key: Optional[Tuple]
+
+    def __init__(self, to, subject: str, title: str, content: str, footer: str = default_footer,
+                 broadcast: bool = False, cache_key: Optional[Tuple] = None):
+        self.to = [to] if isinstance(to, str) else list(to)
+        self.subject = subject
+        self.title = title
+        self.content = content
+        self.footer = footer
+        self.broadcast = broadcast
+        self.cache_key = tuple(cache_key) if cache_key else None
+
+    def to_dict(self) -> Dict:
+        return {
+            'to': self.to,
+            'subject': self.subject,
+            'title': self.title,
+            'content': self.content,
+            'footer': self.footer,
+            'broadcast': self.broadcast,
+            'cache_key': list(self.cache_key) if self.cache_key else None,
+        }
+
+    @staticmethod
+    def from_dict(notification: Dict) -> 'Notification':
+        return Notification(
+            to=notification['to'],
+            subject=notification['subject'],
+            title=notification['title'],
+            content=notification['content'],
+            footer=notification.get('footer', default_footer),
+            broadcast=notification.get('broadcast', False),
+            cache_key=notification.get('cache_key'),
+        )
+
+
+class NotificationSender:
+    """
+    Deliver notifications through SMTP
+    """
+
+    def __init__(self, email: Optional['Email'] = None):
+        if email is None:
+            from src.shared.helper_functions.email_function import Email
+
+            email = Email()
+        self.__email = email
+
+    def __call__(self, notification: Notification) -> Dict:
+        """
+        Returns how many recipients were delivered and the addresses that failed
+        """
+        recipients = [recipient for recipient in notification.to if recipient]
+        if not recipients:
+            return {"delivered": 0, "failed": []}
+
+        self.__email.set_email_template(notification.title, notification.content, footer=notification.footer,
+                                        cache_key=notification.cache_key)
+        if notification.broadcast:
+            return self.__email.broadcast(to=recipients, subject=notification.subject)
+        self.__email.send_email(to=recipients if len(recipients) > 1 else recipients[0],
+                                subject=notification.subject)
+        return {"delivered": len(recipients), "failed": []}
+
+
+class NotificationOutbox(ABC):
+    """
+    Notifications published by a use case are buffered and handed over on flush,
+    so the request does not wait on the mail server.
+    """
+
+    @abstractmethod
+    def publish(self, notification: Notification) -> None:
+        """
+        Buffer a notification until the next flush
+        """
+        pass
+
+    @abstractmethod
+    def flush(self) -> int:
+        """
+        Hand over the buffered notifications, returning how many were handed over
+        """
+        pass
+
+
+class LocalNotificationOutbox(NotificationOutbox):
+    """
+    In-process stand-in for the queue, used when NOTIFICATION_QUEUE_URL is not set.
+    Flush sends the buffered notifications itself, one after the other.
+    """
+
+    def __init__(self, sender: Optional[NotificationSender] = None):
+        self.__queue = Queue()
+        self.__sender = sender
+
+    def publish(self, notification: Notification) -> None:
+        self.__queue.put(notification)
+
+    def flush(self) -> int:
+        if self.__sender is None:
+            self.__sender = NotificationSender()
+        flushed = 0
+        while True:
+            try:
+                notification = self.__queue.get_nowait()
+            except Empty:
+                return flushed
+            self.__sender(notification)
+            flushed += 1
+
+
+class SqsNotificationOutbox(NotificationOutbox):
+    """
+    Sends the buffered notifications to an SQS queue drained by the send_notification Lambda.
+    Broadcasts are split so that every message stays below the SQS size limit, and messages are sent
+    up to 10 per SendMessageBatch call as long as the batch also stays below that limit.
+    Entries the queue refuses are retried before failing.
+    """
+    MAX_BATCH_ENTRIES = 10
+    MAX_BATCH_BYTES = 256 * 1024
+    MAX_RECIPIENTS_PER_MESSAGE = 500
+    SEND_ATTEMPTS = 3
+
+    def __init__(self, queue_url: str, sqs_client=None):
+        self.__queue_url = queue_url
+        self.__sqs_client = sqs_client
+        self.__messages: List[str] = []
+
+    @property
+    def __sqs(self):
+        return self.__sqs_client or get_client('sqs')
+
+    def publish(self, notification: Notification) -> None:
+        message = notification.to_dict()
+        message['to'] = []
+        size = len(json.dumps(message).encode('utf-8'))
+        if size > self.MAX_BATCH_BYTES:
+            raise Exception("Notificação excede o tamanho máximo de uma mensagem.")
+
+        recipients, message_size = [], size
+        for recipient in notification.to:
+            recipient_size = len(json.dumps(recipient).encode('utf-8')) + 2
+            if recipients and (len(recipients) == self.MAX_RECIPIENTS_PER_MESSAGE
+                               or message_size + recipient_size > self.MAX_BATCH_BYTES):
+                self.__messages.append(json.dumps(dict(message, to=recipients)))
+                recipients, message_size = [], size
+            recipients.append(recipient)
+            message_size += recipient_size
+        if recipients:
+            self.__messages.append(json.dumps(dict(message, to=recipients)))
+
+    def flush(self) -> int:
+        messages, self.__messages = self.__messages, []
+        batch, batch_size = [], 0
+        for message in messages:
+            size = len(message.encode('utf-8'))
+            if batch and (len(batch) == self.MAX_BATCH_ENTRIES or batch_size + size > self.MAX_BATCH_BYTES):
+                self.__send_batch(batch)
+                batch, batch_size = [], 0
+            batch.append(message)
+            batch_size += size
+        if batch:
+            self.__send_batch(batch)
+        return len(messages)
+
+    def __send_batch(self, messages: List[str]):
+        entries = [{'Id': str(index), 'MessageBody': message} for index, message in enumerate(messages)]
+        for attempt in range(self.SEND_ATTEMPTS):
+            response = self.__sqs.send_message_batch(QueueUrl=self.__queue_url, Entries=entries)
+            failed = {entry['Id'] for entry in response.get('Failed', [])}
+            entries = [entry for entry in entries if entry['Id'] in failed]
+            if not entries:
+                return
+        raise Exception(f"Não foi possível enfileirar {len(entries)} notificação(ões).")
+
+
+def get_notification_outbox() -> NotificationOutbox:
+    queue_url = os.environ.get('NOTIFICATION_QUEUE_URL')
+    if queue_url:
+        return SqsNotificationOutbox(queue_url)
+    return LocalNotificationOutbox()
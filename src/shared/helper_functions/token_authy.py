@@ -10,16 +10,25 @@ from src.shared.helper_functions.time_manipulation import TimeManipulation
 class TokenAuthy(ABC):
     def __init__(self):
         self.__secret = os.environ.get('ENCRYPTED_KEY')
+        self.__embed_claims = os.environ.get('TOKEN_CLAIMS') == 'true'
 
-    def generate_token(self, user_id: str, keep_login: bool = False, exp_time: int = None) -> str:
+    def generate_token(self, user_id: str, keep_login: bool = False, exp_time: int = None, user: Dict = None) -> str:
+        """
+        With TOKEN_CLAIMS=true and the user given, the token also carries type_account, status_account and
+        token_version, so read-only endpoints can authorize without fetching the user
+        """
         if keep_login:
             date_exp = TimeManipulation().plus_day(30) + 3 * 3600
         else:
             date_exp = TimeManipulation().plus_day(1) + 3 * 3600
         if exp_time:
             date_exp = exp_time
-        return jwt.encode({"user_id": user_id, "exp": date_exp}, self.__secret,
-                          algorithm='HS256')
+        payload = {"user_id": user_id, "exp": date_exp}
+        if self.__embed_claims and user:
+            payload["type_account"] = user.get('type_account')
+            payload["status_account"] = user.get('status_account')
+            payload["token_version"] = int(user.get('token_version') or 0)
+        return jwt.encode(payload, self.__secret, algorithm='HS256')
 
     def decode_token(self, token: str) -> Dict or None:
         try:
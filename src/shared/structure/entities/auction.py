@@ -1,11 +1,13 @@
 from abc import ABC
-from typing import List, Optional, Dict
+from typing import TYPE_CHECKING, List, Optional, Dict
 
-from src.shared.errors.modules_errors import *
-from src.shared.structure.entities.bid import Bid
-from src.shared.structure.entities.payment import Payment
+from src.shared.errors.modules_errors import InvalidParameter, MissingParameter
 from src.shared.structure.enums.auction_enum import STATUS_AUCTION_ENUM
 
+if TYPE_CHECKING:
+    from src.shared.structure.entities.bid import Bid
+    from src.shared.structure.entities.payment import Payment
+
 
 class Auction(ABC):
     auction_id: str
@@ -182,7 +184,9 @@ class Auction(ABC):
         return created_at
 
     @staticmethod
-    def validate_and_set_bids(bids: List[Optional[Bid]]) -> List[Optional[Bid]] or None:
+    def validate_and_set_bids(bids: List[Optional['Bid']]) -> List[Optional['Bid']] or None:
+        from src.shared.structure.entities.bid import Bid
+
         if bids is None:
             raise MissingParameter("bids")
         if not isinstance(bids, list):
@@ -194,7 +198,9 @@ class Auction(ABC):
         return bids
 
     @staticmethod
-    def validate_and_set_payments(payments: List[Optional[Payment]]) -> List[Optional[Payment]]:
+    def validate_and_set_payments(payments: List[Optional['Payment']]) -> List[Optional['Payment']]:
+        from src.shared.structure.entities.payment import Payment
+
         if payments is None:
             raise MissingParameter("payments")
         if not isinstance(payments, list):
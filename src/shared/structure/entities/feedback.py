@@ -1,7 +1,7 @@
 from abc import ABC
 import re
 
-from src.shared.errors.modules_errors import *
+from src.shared.errors.modules_errors import InvalidParameter, MissingParameter
 
 
 class Feedback(ABC):
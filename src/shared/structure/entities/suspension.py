@@ -26,9 +26,9 @@ class Suspension(ABC):
 
     def to_dict(self):
         return {
-            'user_id': self.suspension_id,
+            'user_id': self.user_id,
             'suspension_id': self.suspension_id,
-            'date_suspension': self.date_suspencion,
+            'date_suspension': self.date_suspension,
             'date_reactivation': self.date_reactivation,
             'reason': self.reason,
             'created_at': self.created_at,
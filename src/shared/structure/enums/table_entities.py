@@ -5,9 +5,13 @@ class USER_TABLE_ENTITY(Enum):
     USER = "USER"
     SUSPENSION = "SUSPENSION"
     FEEDBACK = "FEEDBACK"
+    HISTORY = "HISTORY"
+    SEQUENCE = "SEQUENCE"
+    AGGREGATE = "AGGREGATE"
 
 
 class AUCTION_TABLE_ENTITY(Enum):
     AUCTION = "AUCTION"
     BID = "BID"
-    PAYMENT = "PAYMENT"
\ No newline at end of file
+    PAYMENT = "PAYMENT"
+    SEQUENCE = "SEQUENCE"
\ No newline at end of file
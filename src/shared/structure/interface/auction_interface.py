@@ -1,9 +1,10 @@
 from abc import ABC, abstractmethod
-from typing import Optional, Dict, List
+from typing import Optional, Dict, List, Set
 
 from src.shared.structure.entities.bid import Bid
 from src.shared.structure.entities.auction import Auction
 from src.shared.structure.entities.payment import Payment
+from src.shared.structure.enums.auction_enum import STATUS_AUCTION_ENUM
 
 
 class AuctionInterface(ABC):
@@ -29,16 +30,33 @@ class AuctionInterface(ABC):
         pass
 
     @abstractmethod
-    def get_all_auctions_admin(self, auctions_closed: bool) -> List[Optional[Dict]]:
+    def get_all_auctions_admin(self, auctions_closed: bool, limit: int, cursor: Optional[str] = None) -> Dict:
         """
-        Get all auctions by admin
+        Get a page of auctions for the admin and the cursor of the next page
         """
         pass
 
     @abstractmethod
-    def create_bid(self, bid: Bid) -> Dict or None:
+    def get_auctions_by_status(self, status_auctions: List[STATUS_AUCTION_ENUM], limit: int,
+                               cursor: Optional[str] = None, start_date_until: Optional[int] = None,
+                               filter_expression=None) -> Dict:
         """
-        Create a new bid
+        Get a page of auctions with the given status ordered by start date and the cursor of the next page
+        """
+        pass
+
+    @abstractmethod
+    def get_next_bid_id(self, auction_id: str) -> int:
+        """
+        Allocate a new bid id for the auction
+        """
+        pass
+
+    @abstractmethod
+    def place_bid(self, bid: Bid) -> Dict:
+        """
+        Create the bid and raise the current amount of the auction in a single transaction
+        Refused if the auction is not open or the bid is not at least 1 above the current amount
         """
         pass
 
@@ -60,6 +78,13 @@ class AuctionInterface(ABC):
     def get_all_bids_by_auction_id(self, auction_id: str) -> List[Dict]:
         pass
 
+    @abstractmethod
+    def get_top_bids_by_auction_id(self, auction_id: str, limit: int = 5) -> List[Dict]:
+        """
+        Get the highest bids of the auction, highest first
+        """
+        pass
+
     @abstractmethod
     def get_all_auctions_menu(self) -> Optional[List[Dict]]:
         """
@@ -76,30 +101,30 @@ class AuctionInterface(ABC):
         pass
 
     @abstractmethod
-    def update_auction_current_amount(self, auction_id: str = None, amount: float = None) -> Optional[Dict]:
+    def get_auction_between_dates(self, start_date: int, end_date: int) -> Optional[Dict]:
         """
-        Update the current amount of the auction
+        Get all auctions between dates
         """
         pass
 
     @abstractmethod
-    def get_auction_between_dates(self, start_date: int, end_date: int) -> Optional[Dict]:
+    def get_next_auction_id(self) -> int:
         """
-        Get all auctions between dates
+        Allocate a new auction id
         """
         pass
 
     @abstractmethod
-    def get_last_auction_id(self) -> Optional[int]:
+    def reserve_auction_ids(self, size: int) -> range:
         """
-        Get the last auction id
+        Allocate a block of consecutive auction ids, for bulk imports
         """
         pass
 
     @abstractmethod
-    def get_last_bid_id(self, auction_id: str) -> Optional[int]:
+    def get_auction_ids(self, exclude_status: List[STATUS_AUCTION_ENUM] = None) -> Set[str]:
         """
-        Get the last bid id
+        Get the id of every auction, except those with one of the excluded status
         """
         pass
 
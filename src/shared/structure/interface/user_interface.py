@@ -25,9 +25,10 @@ class UserInterface(ABC):
         pass
 
     @abstractmethod
-    def get_all_users(self, type_account: TYPE_ACCOUNT_USER_ENUM = None) -> Optional[Dict]:
+    def get_all_users(self, limit: int, cursor: Optional[str] = None,
+                      type_account: TYPE_ACCOUNT_USER_ENUM = None) -> Dict:
         """
-        Get all users
+        Get a page of users, except admins, with their suspensions
         """
         pass
 
@@ -45,6 +46,13 @@ class UserInterface(ABC):
         """
         pass
 
+    @abstractmethod
+    def get_token_version(self, user_id: str) -> Optional[int]:
+        """
+        Get the current token version of the user, None if the user does not exist
+        """
+        pass
+
     @abstractmethod
     def get_user_by_email(self, email: str) -> Optional[Dict]:
         """
@@ -109,11 +117,11 @@ class UserInterface(ABC):
         pass
 
     @abstractmethod
-    def get_last_feedback_id(self) -> int:
+    def get_next_feedback_id(self) -> int:
         """
-        Get last feedback id
+        Allocate a new feedback id
         """
-        pass 
+        pass
 
     @abstractmethod
     def get_suspension_by_id(self, suspension_id: str) -> Optional[Dict]:
@@ -123,8 +131,39 @@ class UserInterface(ABC):
         pass
 
     @abstractmethod
-    def get_all_feedbacks(self) -> Optional[Dict]:
+    def get_all_feedbacks(self, limit: int, cursor: Optional[str] = None, grade: Optional[int] = None) -> Dict:
+        """
+        Get a page of feedbacks, most recent first, optionally only those with a grade
+        """
+        pass
+
+    @abstractmethod
+    def get_feedback_summary(self) -> Dict:
+        """
+        Get the number of feedbacks and the sum of their grades, in total and per grade
+        """
+        pass
+
+    @abstractmethod
+    def put_auction_history(self, user_id: str, auctions: List[Dict], backfilled: bool = False) -> None:
+        """
+        Write the won auctions, with their payment, to the history of a user. Only the auction and payment
+        attributes are kept, not the personal data of the buyer
+        """
+        pass
+
+    @abstractmethod
+    def get_auction_history(self, user_id: str, limit: int, cursor: Optional[str] = None,
+                            status_auction: Optional[str] = None) -> Dict:
+        """
+        Get a page of the history of a user, most recent auction first
+        """
+        pass
+
+    @abstractmethod
+    def update_auction_history_payment(self, user_id: str, auction_id: str, end_date: int,
+                                       status_payment: str) -> Optional[Dict]:
         """
-        Get all feedbacks
+        Update the payment status of an auction of the history of a user
         """
         pass